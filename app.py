@@ -1,114 +1,279 @@
+import asyncio
+import os
+import sys
+
 import pygame
-from src.constants import WIDTH, SCREEN_SIZE, FPS, START_SCREEN, PLAYING, GAME_OVER
+from src.constants import WIDTH, SCREEN_SIZE, FPS, TICK_RATE, AUTOSAVE_INTERVAL_MS, START_SCREEN, PLAYING, GAME_OVER
 from src.game.game import Game
 from src.game.board import Board
 from src.game.piece import Piece
 from src.game.row import Row
 from src.view.pygame_renderer import PygameRenderer
 from src.view.input import InputHandler
+from src.view.idle import IdleScheduler
 from src.utils.session_manager import SessionManager
+from src.utils.clock import FixedStepClock
+from src.utils.profiler import FrameProfiler
+
+PROFILER_KEY = pygame.K_F3          # Toggles the frame-time overlay
+PROFILER_ENV = "TETRIS_PROFILE"     # Set to 1 to start with the overlay on
 
 def spawn_piece():
     """Simple function to spawn a new piece"""
     from src.constants import START_X, START_Y
     return Piece(START_X, START_Y)
 
-def main():
+def toggle_profiler(renderer, game):
+    """Turn the frame-time profiler overlay on or off.
+
+    While on, every call in PygameRenderer.PROFILED_CALLS and Game.update
+    and Game.apply is timed; turning it off removes the timing wrappers.
+    """
+    if renderer.profiler is None:
+        profiler = FrameProfiler()
+        profiler.instrument(renderer, renderer.PROFILED_CALLS)
+        profiler.instrument(game, ("update", "apply"), "Game.")
+        renderer.profiler = profiler
+    else:
+        renderer.profiler.restore()
+        renderer.profiler = None
+    renderer.request_full_update()
+
+def collect_intents(events, renderer, input_handler, game=None):
+    """Turn one batch of pygame events into game intents.
+
+    If game is given, PROFILER_KEY toggles the profiler overlay for it.
+
+    Returns:
+        tuple: (intents, quit) where quit is True if the window was closed.
+    """
+    intents = []
+    quit_requested = False
+
+    # Event processing
+    for event in events:
+        if event.type == pygame.QUIT:
+            quit_requested = True
+        elif event.type == pygame.VIDEORESIZE:
+            renderer.resize(pygame.display.get_surface())
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # Left click
+                pos = renderer.to_logical(event.pos)  # Buttons live in drawing coordinates
+                for manager in (renderer.button_manager, renderer.hud_button_manager):
+                    for button in manager.buttons:
+                        if button.is_hovered(pos):
+                            button.clicked = True
+                intent = renderer.button_manager.handle_click(pos)
+                if not intent:
+                    intent = renderer.hud_button_manager.handle_click(pos)
+                if intent:
+                    intents.append(intent)
+        elif event.type == pygame.MOUSEBUTTONUP:
+            for manager in (renderer.button_manager, renderer.hud_button_manager):
+                for button in manager.buttons:
+                    button.clicked = False
+        elif event.type == pygame.KEYDOWN and event.key == PROFILER_KEY and game is not None:
+            toggle_profiler(renderer, game)
+
+    # Add keyboard intents
+    intents.extend(input_handler.get_intents(events))
+    return intents, quit_requested
+
+def advance_simulation(game, sim_clock, now):
+    """Run the gravity ticks due at now (milliseconds)."""
+    # Only update gravity when playing; otherwise restart the clock so
+    # time spent on menus or paused isn't replayed afterwards
+    if game._state == PLAYING and not game.paused:
+        for _ in range(sim_clock.advance(now)):
+            game.update()
+    else:
+        sim_clock.reset(now)
+
+def draw_frame(renderer, game, board):
+    """Draw one complete frame (without presenting it to the display)."""
+    # Draw current state
+    renderer.draw_board(board)  # Draw the board grid and filled cells
+
+    # Draw game elements if not in start screen
+    if game._state != START_SCREEN:
+        if game.current_piece:  # Draw the currently falling piece
+            renderer.draw_piece(game.current_piece)
+        if game.next_piece:  # Draw the next piece preview
+            renderer.draw_next_piece_preview(game.next_piece)
+        renderer.draw_score(game.score, game.high_score)
+
+    # Draw ghost piece if playing and not paused
+    if game._state == PLAYING and game.current_piece and not game.paused:
+        renderer.draw_ghost_piece(board, game.current_piece)
+
+    # Draw level info if playing
+    if game._state == PLAYING:
+        renderer.draw_level_info(game.level, game.lines_cleared, game.gravity_delay)
+
+    # Draw overlays and HUD elements after core board rendering
+    mouse_pos = renderer.to_logical(pygame.mouse.get_pos())  # Read once for every button this frame
+    if game._state == START_SCREEN:
+        renderer.draw_start_screen(mouse_pos=mouse_pos)
+        renderer.clear_hud_buttons()
+    elif game._state == GAME_OVER:
+        renderer.draw_game_over_screen(score=game.score, high_score=game.high_score, mouse_pos=mouse_pos)
+        renderer.clear_hud_buttons()
+    elif game.paused:
+        renderer.draw_pause_popup(score=game.score, high_score=game.high_score, mouse_pos=mouse_pos)
+        renderer.clear_hud_buttons()
+    else:
+        renderer.clear_popup_buttons()
+        renderer.draw_pause_button(mouse_pos=mouse_pos)
+
+    # Debug overlay goes on top of everything
+    if renderer.profiler is not None:
+        renderer.draw_profiler_overlay()
+
+def init_app():
+    """Open the window and create the components shared by main() and main_async().
+
+    Returns:
+        tuple: (board, game, renderer, input_handler, sim_clock)
+    """
     pygame.init()
     pygame.font.init()
-    screen = pygame.display.set_mode(SCREEN_SIZE)
+    screen = pygame.display.set_mode(SCREEN_SIZE, pygame.RESIZABLE)
     pygame.display.set_caption("Tetris (Team Project)")
-    clock = pygame.time.Clock()
-    
+    sim_clock = FixedStepClock()  # Logic runs at TICK_RATE regardless of FPS
+    sim_clock.reset(pygame.time.get_ticks())
+
     # Create components
     session = SessionManager()
     board = Board(lambda: Row(WIDTH))
     game = Game(board, spawn_piece, session)  # Just the game referee
     renderer = PygameRenderer(screen)
     input_handler = InputHandler()
-    
+    if os.environ.get(PROFILER_ENV, "0") != "0":
+        toggle_profiler(renderer, game)
+    return board, game, renderer, input_handler, sim_clock
+
+def main():
+    board, game, renderer, input_handler, sim_clock = init_app()
+    clock = pygame.time.Clock()
+    idle = IdleScheduler()  # Sleeps on static screens instead of redrawing at FPS
+
     # Main application loop
     done = False
-    while not done:
-        events = pygame.event.get()
-        intents = []
-        
-        # Event processing
-        for event in events:
-            if event.type == pygame.QUIT:
+    try:
+        while not done:
+            events = idle.get_events(game)
+            intents, done = collect_intents(events, renderer, input_handler, game)
+
+            # Apply intents and update game (EXIT/QUIT set game.done)
+            game.apply(intents)
+
+            if game.done:
                 done = True
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Left click
-                    for manager in (renderer.button_manager, renderer.hud_button_manager):
-                        for button in manager.buttons:
-                            if button.is_hovered(event.pos):
-                                button.clicked = True
-                    intent = renderer.button_manager.handle_click(event.pos)
-                    if not intent:
-                        intent = renderer.hud_button_manager.handle_click(event.pos)
-                    if intent:
-                        intents.append(intent)
-            elif event.type == pygame.MOUSEBUTTONUP:
-                for manager in (renderer.button_manager, renderer.hud_button_manager):
-                    for button in manager.buttons:
-                        button.clicked = False
-        
-        # Add keyboard intents
-        intents.extend(input_handler.get_intents(events))
-            
-        # Apply intents and update game
+
+            advance_simulation(game, sim_clock, pygame.time.get_ticks())
+
+            # Static screens that are already on display don't need redrawing
+            if not idle.should_render(game):
+                continue
+
+            draw_frame(renderer, game, board)
+
+            # Refresh display (only the areas that changed, when possible)
+            renderer.present()
+            idle.rendered(game)
+
+            # Cap render frame rate (simulation speed is set by sim_clock)
+            clock.tick(FPS)
+    except Exception:
+        # Show the game events leading up to the crash
+        game.event_log.dump()
+        raise
+    finally:
+        pygame.quit()
+
+async def run_every(period, stop, step):
+    """Call step() every period seconds until stop is set.
+
+    Each call has a deadline one period after the previous one. A task that
+    falls more than a period behind skips the missed deadlines rather than
+    running them back to back. Setting stop ends the wait for the next
+    deadline at once, so long periods don't delay shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time()
+    while not stop.is_set():
+        step()
+        deadline += period
+        delay = deadline - loop.time()
+        if delay < 0:
+            deadline = loop.time()
+            delay = 0
+        try:
+            await asyncio.wait_for(stop.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+
+async def main_async(autosave_path=None, autosave_interval_ms=AUTOSAVE_INTERVAL_MS):
+    """asyncio variant of main() with the same game behavior.
+
+    Input polling, simulation ticks, rendering and periodic I/O run as
+    separate tasks on their own deadlines, so other coroutines (network
+    spectating, background AI) can share the loop without threads.
+
+    Args:
+        autosave_path (str, optional): Write Game.save_state() here every
+            autosave_interval_ms while a game is in progress.
+        autosave_interval_ms (int): Time between autosaves.
+    """
+    board, game, renderer, input_handler, sim_clock = init_app()
+    idle = IdleScheduler()  # Skips redraws of static screens
+    stop = asyncio.Event()
+
+    def poll_input():
+        intents, quit_requested = collect_intents(idle.poll_events(), renderer, input_handler, game)
+        # Apply intents (EXIT/QUIT set game.done)
         game.apply(intents)
-        
-        if "EXIT" in intents:
-            done = True
-
-        if game.done:
-            done = True
-            
-        # Only update gravity when playing
-        if game._state == PLAYING:
-            game.update()
+        if quit_requested or game.done:
+            stop.set()
+
+    def tick():
+        advance_simulation(game, sim_clock, pygame.time.get_ticks())
 
-        # Draw current state
-        renderer.draw_board(board)  # Draw the board grid and filled cells
-        
-        # Draw game elements if not in start screen
-        if game._state != START_SCREEN:
-            if game.current_piece:  # Draw the currently falling piece
-                renderer.draw_piece(game.current_piece)
-            if game.next_piece:  # Draw the next piece preview
-                renderer.draw_next_piece_preview(game.next_piece)
-            renderer.draw_score(game.score, game.high_score)
-
-        # Draw ghost piece if playing and not paused
-        if game._state == PLAYING and game.current_piece and not game.paused:
-            renderer.draw_ghost_piece(board, game.current_piece)
-        
-        # Draw level info if playing
+    def render():
+        # Static screens that are already on display don't need redrawing
+        if idle.should_render(game):
+            draw_frame(renderer, game, board)
+            renderer.present()
+            idle.rendered(game)
+
+    def autosave():
         if game._state == PLAYING:
-            renderer.draw_level_info(game.level, game.lines_cleared, game.gravity_delay)
-
-        # Draw overlays and HUD elements after core board rendering
-        if game._state == START_SCREEN:
-            renderer.draw_start_screen()
-            renderer.clear_hud_buttons()
-        elif game._state == GAME_OVER:
-            renderer.draw_game_over_screen(score=game.score, high_score=game.high_score)
-            renderer.clear_hud_buttons()
-        elif game.paused:
-            renderer.draw_pause_popup(score=game.score, high_score=game.high_score)
-            renderer.clear_hud_buttons()
-        else:
-            renderer.clear_popup_buttons()
-            renderer.draw_pause_button()
-            
-        # Refresh display
-        pygame.display.flip()
-        
-        # Cap frame rate
-        clock.tick(FPS)
-    
-    pygame.quit()
+            blob = game.save_state()
+            temp_path = autosave_path + ".tmp"
+            with open(temp_path, "wb") as handle:
+                handle.write(blob)
+            os.replace(temp_path, autosave_path)  # Never leave a half-written save
+
+    tasks = [
+        asyncio.create_task(run_every(1 / FPS, stop, poll_input)),
+        asyncio.create_task(run_every(1 / TICK_RATE, stop, tick)),
+        asyncio.create_task(run_every(1 / FPS, stop, render)),
+    ]
+    if autosave_path:
+        tasks.append(asyncio.create_task(run_every(autosave_interval_ms / 1000, stop, autosave)))
+    try:
+        await asyncio.gather(*tasks)
+    except Exception:
+        # Show the game events leading up to the crash
+        game.event_log.dump()
+        raise
+    finally:
+        for task in tasks:
+            task.cancel()
+        pygame.quit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if "--async" in sys.argv[1:]:
+        asyncio.run(main_async(autosave_path=os.environ.get("TETRIS_AUTOSAVE")))
+    else:
+        main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Headless game runner.
+
+Runs the Tetris engine with no window and no frame cap, then reports
+throughput and the final score. Useful for benchmarking the engine and for
+checking balance changes without playing by hand.
+
+Usage:
+    python headless.py                                 # Bot plays 1000 pieces
+    python headless.py --seed 42 --generator random    # Reproducible run, uniform pieces
+    python headless.py --policy random --seconds 5     # Random key presses for 5 seconds
+    python headless.py --policy random --level 20      # Random play at 20G
+    python headless.py --policy scripted --script LEFT,ROTATE,DROP --lines 40
+    python headless.py --games 10000 --workers 8 --pieces 500   # Self-play farm, percentiles
+"""
+
+import argparse
+import sys
+
+from src.sim.farm import run_farm
+from src.sim.generators import GENERATORS
+from src.sim.runner import POLICIES, run_headless
+from src.utils.event_log import EventLog, LEVEL_NAMES, parse_level
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run Tetris headless at maximum speed")
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Seed for piece generation and the random policy')
+    parser.add_argument('--generator', choices=sorted(GENERATORS), default='bag',
+                        help='Piece generator (default: bag)')
+    parser.add_argument('--policy', choices=POLICIES, default='bot',
+                        help='Input policy (default: bot)')
+    parser.add_argument('--script', type=str, default='DROP',
+                        help='Comma separated intents for the scripted policy')
+    parser.add_argument('--level', type=int, default=1,
+                        help='Starting level; 20 and above is 20G (default: 1)')
+
+    # Stop conditions (the game also stops on game over)
+    parser.add_argument('--pieces', type=int, default=None,
+                        help='Stop after this many pieces have locked')
+    parser.add_argument('--lines', type=int, default=None,
+                        help='Stop after this many lines have been cleared')
+    parser.add_argument('--seconds', type=float, default=None,
+                        help='Stop after this much wall time')
+    parser.add_argument('--ticks', type=int, default=None,
+                        help='Stop after this many simulation ticks')
+
+    # Self-play farm (many games over worker processes)
+    parser.add_argument('--games', type=int, default=None,
+                        help='Play this many games (seeds --seed, --seed+1, ...) and report percentiles')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes for --games (default: CPU count)')
+
+    # Event logging (off by default so it doesn't skew throughput)
+    parser.add_argument('--log-level', type=str.upper, choices=list(LEVEL_NAMES.values()), default='OFF',
+                        help='Record game events at this level and above (default: OFF)')
+    parser.add_argument('--log-file', type=str, default=None,
+                        help='Also write recorded events to this JSON Lines file')
+
+    args = parser.parse_args(argv)
+    if args.pieces is None and args.lines is None and args.seconds is None and args.ticks is None:
+        args.pieces = 1000
+    return args
+
+
+def run_farm_main(args):
+    """Play args.games games over worker processes and print percentiles."""
+    report = run_farm(
+        args.games,
+        workers=args.workers,
+        first_seed=args.seed or 0,
+        generator=args.generator,
+        policy=args.policy,
+        script=[intent.strip().upper() for intent in args.script.split(',') if intent.strip()],
+        max_pieces=args.pieces,
+        max_lines=args.lines,
+        max_seconds=args.seconds,
+        max_ticks=args.ticks,
+        start_level=args.level,
+    )
+
+    print(f"Games:     {report.games} ({report.game_overs} game over, {len(report.errors)} errors)")
+    print(f"Elapsed:   {report.elapsed:.3f}s")
+    print(f"Games/s:   {report.games_per_second:.1f}")
+    if report.games:  # No stats when every game failed
+        for field in report.STAT_FIELDS:
+            stats = report.percentiles(field)
+            print(f"{field.capitalize() + ':':<10} mean {report.mean(field):.1f}  "
+                  + "  ".join(f"p{percent} {value:g}" for percent, value in stats.items()))
+    for seed, error in report.errors[:1]:
+        print(f"First error (seed {seed}):\n{error}", file=sys.stderr)
+    return 1 if report.errors else 0
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.games is not None:
+        return run_farm_main(args)
+    sink = open(args.log_file, 'w') if args.log_file else None
+    event_log = EventLog(level=parse_level(args.log_level), sink=sink)
+    try:
+        result = run_headless(
+            seed=args.seed,
+            generator=args.generator,
+            policy=args.policy,
+            script=[intent.strip().upper() for intent in args.script.split(',') if intent.strip()],
+            max_pieces=args.pieces,
+            max_lines=args.lines,
+            max_seconds=args.seconds,
+            max_ticks=args.ticks,
+            event_log=event_log,
+            start_level=args.level,
+        )
+    finally:
+        if sink is not None:
+            sink.close()
+
+    print(f"Score:     {result.score}")
+    print(f"Lines:     {result.lines}")
+    print(f"Pieces:    {result.pieces}")
+    print(f"Ticks:     {result.ticks}")
+    print(f"Elapsed:   {result.elapsed:.3f}s")
+    print(f"Pieces/s:  {result.pieces_per_second:.1f}")
+    print(f"Lines/s:   {result.lines_per_second:.1f}")
+    print(f"Game over: {'yes' if result.game_over else 'no'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
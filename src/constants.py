@@ -1,43 +0,0 @@
-# Screen size
-SCREEN_SIZE = (600, 500)
-FPS = 60
-
-# Playing grid/board dimensions
-HEIGHT = 20 # number of rows
-WIDTH = 10 # number of columns
-
-# Grid size for field
-GRID_SIZE = 4
-
-# Starting position for new pieces
-START_X = 3
-START_Y = 0
-
-# Define colors
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-PURPLE = (120, 37, 179)
-TEAL = (100, 179, 179)
-BROWN = (80, 34, 22)
-GREEN = (80, 134, 22)
-RED = (180, 34, 22)
-PINK = (180, 34, 122)
-GRAY = (128, 128, 128)
-
-COLORS = (
-    WHITE,
-    BLACK,
-    PURPLE,
-    TEAL,
-    BROWN,
-    GREEN,
-    RED,
-    PINK,
-    GRAY,
-)
-
-# Cell (block) size in pixels
-CELL_SIZE = 20
-
-# Rectangle to be drawn that stores the next page preview
-NEXT_PAGE_PREVIEW_RECT = [290, 200, 150, 150]
\ No newline at end of file
@@ -3,7 +3,8 @@
 from .game_dimensions import (
     WIDTH, HEIGHT, CELL_SIZE,
     WINDOW_WIDTH, WINDOW_HEIGHT, SCREEN_SIZE,
-    FPS, START_X, START_Y
+    FPS, TICK_RATE, MAX_CATCH_UP_TICKS, IDLE_WAIT_MS, AUTOSAVE_INTERVAL_MS,
+    START_X, START_Y
 )
 
 from .game_states import (
@@ -1,6 +1,7 @@
-"""Constants for game colors and style."""
+"""Constants for game colors and style.
 
-import pygame
+Plain tuples only, so the simulation core can import this without pygame.
+"""
 
 # Basic colors
 BLACK = (0, 0, 0)
@@ -20,4 +21,4 @@ COLORS = [
 ]
 
 # Preview box
-NEXT_PAGE_PREVIEW_RECT = pygame.Rect(300, 180, 150, 180)  # x, y, width, height
\ No newline at end of file
+NEXT_PAGE_PREVIEW_RECT = (300, 180, 150, 180)  # x, y, width, height
\ No newline at end of file
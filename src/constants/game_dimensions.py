@@ -11,6 +11,10 @@ WINDOW_HEIGHT = 600
 SCREEN_SIZE = (WINDOW_WIDTH, WINDOW_HEIGHT)
 
 # Game settings
-FPS = 60          # Frames per second
+FPS = 60          # Frames per second (render rate)
+TICK_RATE = 60    # Simulation ticks per second, independent of FPS
+MAX_CATCH_UP_TICKS = 5  # Most ticks simulated in one frame after a hitch
+IDLE_WAIT_MS = 500      # Longest a static screen sleeps waiting for input
+AUTOSAVE_INTERVAL_MS = 5000  # How often the asyncio loop snapshots the game
 START_X = WIDTH // 2 - 2  # Starting X position for new pieces (centered)
 START_Y = 0              # Starting Y position for new pieces (top)
\ No newline at end of file
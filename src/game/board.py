@@ -26,6 +26,7 @@ class Board:
         self.__height = height  # Board height (total number of rows)
         self.__width = width    # Board width (total number of columns)
         self._row_factory = row_factory     # Factory function to create Row objects
+        self.__version = 0      # Bumped on every mutation so renderers can cache
         self.clear()    # Populate the board with empty Row objects
         self.__lines_cleared = 0  # Track total lines cleared
 
@@ -44,6 +45,11 @@ class Board:
     @property
     def lines_cleared(self) -> int:
         return self.__lines_cleared
+
+    @property
+    def version(self) -> int:
+        """Mutation counter: changes whenever cells change through Board methods."""
+        return self.__version
     
     def validate_integrity(self) -> None:
         """Ensure the linked list length matches the board height."""
@@ -56,10 +62,78 @@ class Board:
             linked list of empty rows.
         """
         self._rows = LinkedList()   # Create a new empty linked list to hold Row objects
+        self.__version += 1
 
         for _ in range(self.height):
             self.rows.append(self._row_factory())    # Append empty Row objects to match the board height
 
+    def snapshot(self) -> tuple:
+        """
+            Capture the board contents as immutable data.
+
+            Returns:
+                tuple: (row snapshots from top to bottom, cumulative lines cleared)
+        """
+        rows = []
+        node = self.rows.head
+        while node:     # Walk the list once instead of indexing each row
+            rows.append(node.value.snapshot())
+            node = node.next
+        return (tuple(rows), self.__lines_cleared)
+
+    def row_bits(self) -> tuple:
+        """
+            Return each row's occupancy bitmask, top to bottom, in one pass.
+
+            Returns:
+                tuple: One int per row (bit col set = occupied)
+        """
+        bits = []
+        node = self.rows.head
+        while node:
+            bits.append(node.value.bits)
+            node = node.next
+        return tuple(bits)
+
+    def iter_rows(self):
+        """
+            Yield every row's contents, top to bottom, in one pass over the list.
+
+            Meant for renderers that need every occupied cell: no per-cell
+            index lookups or list walks.
+
+            Yields:
+                tuple: (row_index, bits, colors) where bits is the occupancy
+                bitmask (bit col set = occupied) and colors is a read-only
+                mapping of column to color for the occupied cells.
+        """
+        node = self.rows.head
+        row_index = 0
+        while node:
+            row = node.value
+            yield row_index, row.bits, row.colors
+            node = node.next
+            row_index += 1
+
+    def restore(self, snapshot) -> None:
+        """
+            Replace the board contents with data returned by snapshot().
+
+            Raises:
+                ValueError: If the snapshot was taken from a board of another height.
+        """
+        rows, lines_cleared = snapshot
+        if len(rows) != self.height:
+            raise ValueError(f"Snapshot has {len(rows)} rows, board height is {self.height}")
+
+        self.clear()    # Fresh rows, so the restored board shares nothing with the old one
+        node = self.rows.head
+        for row_snapshot in rows:
+            node.value.restore(row_snapshot)
+            node = node.next
+        self.__lines_cleared = lines_cleared
+        self.__version += 1
+
     def _check_row_index(self, row: int) -> None:
         """Check that the given row index is within board bounds."""
         if not (0 <= row < self.height):
@@ -103,11 +177,13 @@ class Board:
 
         row_obj = self.get_row_object(row)     # Retrieve the Row row_obj at the specified row index
         row_obj.set_bit(col, color)     # Set the bit at column index and store the color
+        self.__version += 1
 
     def clear_cell(self, row, col) -> None:
         """Clear the cell at (row, col) to make it empty."""
         node = self._rows.get_node_at(row)
         node.value.clear_bit(col)
+        self.__version += 1
 
     def clear_full_lines(self) -> int:
         """
@@ -134,7 +210,9 @@ class Board:
         missing_rows = self.height - self.rows.length()
         for _ in range(missing_rows):
             self.rows.insert_top(self._row_factory())
-        
+        if lines_cleared:
+            self.__version += 1
+
         return lines_cleared
 
     # Cody's game mechanics methods
@@ -162,23 +240,7 @@ class Board:
             bool: True if piece will collide with other piece, False if not
         """
 
-        # Getting tuple that represents shape of piece to be placed
-        shape = SHAPES[piece.type][piece.rotation]
-
-        # Going through each cell in the piece to be placed and ensuring that will not collide with other piece or end of board
-        for grid_position in shape:
-            coords = self.grid_position_to_coords(grid_position, piece.x, piece.y)
-            col = coords[0]
-            row = coords[1]
-
-            # Checking if within bounds of board
-            if row < 0 or row >= self.height or col < 0 or col >= self.width:
-                return True
-
-            if self.get_cell(row, col):
-                return True
-            
-        return False
+        return self._would_collide_at(piece, piece.x, piece.y)
 
     def place_piece(self, piece) -> bool:
         """
@@ -243,30 +305,40 @@ class Board:
             return False
         return True
 
-    def go_side(self, x_movement, piece) -> None:
+    def go_side(self, x_movement, piece) -> bool:
         """
         Moves the piece left or right, reverting if it causes a collision.
 
         Args:
             x_movement (int): Movement in X direction (-1 for left, 1 for right).
             piece: The piece to be moved.
+
+        Returns:
+            bool: True if the piece moved, False if it was blocked.
         """
         piece.x += x_movement
         if self.will_piece_collide(piece):
             piece.x -= x_movement
-        
+            return False
+        return True
+
 
-    def rotate(self, piece) -> None:
+    def rotate(self, piece) -> bool:
         """
         Rotates the piece clockwise. If rotation causes collision, reverts it.
 
         Args:
             piece: The piece to be rotated.
+
+        Returns:
+            bool: True if the piece rotated, False if it was blocked.
         """
         old_rotation = piece.rotation
         piece.rotation = (piece.rotation + 1) % len(SHAPES[piece.type])
         if self.will_piece_collide(piece):
             piece.rotation = old_rotation
+            return False
+        return True
         
     def get_landing_y(self, piece) -> int:
         """
@@ -302,15 +374,30 @@ class Board:
         Like will_piece_collide but checks collision at an arbitrary (x, y)
         without mutating the piece.
         """
-        shape = SHAPES[piece.type][piece.rotation]
-        for grid_position in shape:
+        height = self.__height
+        width = self.__width
+        # Build a bitmask per shape row (4x4 grid), checking bounds on the way
+        masks = [0, 0, 0, 0]
+        first = 3
+        for grid_position in SHAPES[piece.type][piece.rotation]:
             col = x + (grid_position % 4)
-            row = y + (grid_position // 4)
+            offset = grid_position // 4
+            row = y + offset
 
-            if row < 0 or row >= self.height or col < 0 or col >= self.width:
+            if row < 0 or row >= height or col < 0 or col >= width:
                 return True
 
-            if self.get_cell(row, col):
+            masks[offset] |= 1 << col
+            if offset < first:
+                first = offset
+
+        # Walk the covered rows once and test each against its row mask
+        node = self.rows.get_node_at(y + first)
+        for mask in masks[first:]:
+            if node is None:
+                break
+            if node.value.bits & mask:
                 return True
+            node = node.next
 
-        return False
\ No newline at end of file
+        return False
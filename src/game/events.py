@@ -0,0 +1,95 @@
+"""
+Game events and a lightweight synchronous event bus.
+
+Game publishes an event whenever something observable changes (a piece
+locks, lines clear, the level or state changes, a piece spawns). Renderers,
+stats and session code can subscribe instead of polling Game every frame.
+"""
+
+from collections import namedtuple
+from contextlib import contextmanager
+
+# Event payloads (immutable and cheap to build)
+PieceSpawned = namedtuple("PieceSpawned", ["piece_type", "next_type"])
+PieceLocked = namedtuple("PieceLocked", ["piece_type", "x", "y", "source"])
+LinesCleared = namedtuple("LinesCleared", ["count", "total", "score"])
+LevelUp = namedtuple("LevelUp", ["level", "gravity_delay"])
+StateChanged = namedtuple("StateChanged", ["state", "paused"])
+GameOver = namedtuple("GameOver", ["score", "level", "lines"])
+
+
+class EventBus:
+    """
+    Synchronous publish/subscribe dispatcher keyed by event type.
+
+    Subscribers are called in subscription order, inside publish(). While a
+    batch is open, events are queued instead and delivered when it closes,
+    which lets a headless run gather events without per-event callbacks.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers = {}  # Event type -> list of callbacks
+        self._batch = None      # Queued events while batching, else None
+
+    def subscribe(self, event_type, callback):
+        """
+        Register callback(event) for events of event_type.
+
+        Returns:
+            The callback, so it can be passed to unsubscribe later.
+        """
+        self._subscribers.setdefault(event_type, []).append(callback)
+        return callback
+
+    def unsubscribe(self, event_type, callback) -> None:
+        """Remove a callback registered with subscribe (no-op if absent)."""
+        callbacks = self._subscribers.get(event_type)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+
+    def has_subscribers(self, event_type) -> bool:
+        return bool(self._subscribers.get(event_type))
+
+    def publish(self, event) -> None:
+        """Deliver event to its subscribers now, or queue it if a batch is open."""
+        if self._batch is not None:
+            self._batch.append(event)
+            return
+        for callback in self._subscribers.get(type(event), ()):
+            callback(event)
+
+    def start_batch(self) -> None:
+        """Begin queueing published events instead of delivering them."""
+        if self._batch is None:
+            self._batch = []
+
+    def end_batch(self, deliver=True) -> list:
+        """
+        Stop queueing and return the queued events.
+
+        Args:
+            deliver (bool): Also dispatch the queued events to subscribers, in order.
+
+        Returns:
+            list: Events published while the batch was open.
+        """
+        events = self._batch or []
+        self._batch = None
+        if deliver:
+            for event in events:
+                self.publish(event)
+        return events
+
+    @contextmanager
+    def batch(self, deliver=True):
+        """Context manager form of start_batch/end_batch; yields the live event list."""
+        if self._batch is not None:
+            # Nested inside an open batch: the outer batch delivers
+            yield self._batch
+            return
+        self.start_batch()
+        events = self._batch
+        try:
+            yield events
+        finally:
+            self.end_batch(deliver)
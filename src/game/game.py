@@ -1,8 +1,25 @@
+import pickle
+import random
+
 from src.utils.score import points_for_clear
 from src.constants.game_states import START_SCREEN, PLAYING, GAME_OVER
+from src.utils.event_log import EventLog
+from src.game.intents import Intent, coalesce
+from src.game.piece import Piece
+from src.game.events import (
+    EventBus, PieceSpawned, PieceLocked, LinesCleared, LevelUp, StateChanged, GameOver
+)
 
 class Game:
-    def __init__(self, board, spawn_piece_func, session):
+    # Gravity tuning: ticks shaved off gravity_delay per level, and its floor
+    GRAVITY_SPEED_INCREASE = 3
+    MIN_GRAVITY_DELAY = 10
+    # Rows per gravity_delay for each level past the delay floor, ending at 20G
+    GRAVITY_ROWS_CURVE = (2, 3, 4, 6, 8, 10, 15, 20, 30, 50, 100, 200)
+    # Bumped whenever the save_state layout changes
+    SAVE_FORMAT = 1
+
+    def __init__(self, board, spawn_piece_func, session, event_log=None, events=None):
         self.board = board
         self.spawn_piece = spawn_piece_func
         self.current_piece = None
@@ -18,13 +35,48 @@ class Game:
         self._score = 0
         self._session = session  # Session manager dependency injection
         self._state = START_SCREEN
+
+        # Structured event log of locks, clears and state changes
+        self.event_log = event_log if event_log is not None else EventLog()
+        # Event bus for subscribers (renderer caches, stats, session)
+        self.events = events if events is not None else EventBus()
         
         # Progression (Owen)
+        self.start_level = 1  # Level new games begin at (raise for speed modes)
         self.level = 1
         # self.score = 0
         self.lines_cleared = 0
         self.base_gravity_delay = 30
         self.gravity_delay = self._calculate_gravity_delay()
+        self.gravity_rows = self._calculate_gravity_rows()
+
+        # Intent dispatch tables, one per game state (see apply)
+        self._pause_toggled = False
+        self._handlers = {
+            START_SCREEN: {
+                Intent.START: self._on_start,
+                Intent.QUIT: self._on_quit,
+                Intent.EXIT: self._on_quit,
+            },
+            GAME_OVER: {
+                Intent.RESTART: self._on_start,
+                Intent.QUIT: self._on_quit,
+                Intent.EXIT: self._on_quit,
+            },
+            PLAYING: {
+                Intent.PAUSE: self._on_pause,
+                Intent.RESUME: self._on_resume,
+                Intent.RESTART: self._on_restart,
+                Intent.CLICK: self._on_click,
+                Intent.LEFT: self._on_left,
+                Intent.RIGHT: self._on_right,
+                Intent.DOWN: self._on_down,
+                Intent.SOFT_DOWN: self._on_down,
+                Intent.ROTATE: self._on_rotate,
+                Intent.DROP: self._on_drop,
+                Intent.EXIT: self._on_quit,
+            },
+        }
         
     def start_new_game(self):
         """Initialize a new game."""
@@ -37,9 +89,12 @@ class Game:
         self._score = 0
         self._state = PLAYING
         self.gravity_timer = 0
-        self.level = 1
+        self.level = self.start_level
         self.lines_cleared = 0
         self.gravity_delay = self._calculate_gravity_delay()
+        self.gravity_rows = self._calculate_gravity_rows()
+        self.events.publish(StateChanged(self._state, self.paused))
+        self.events.publish(PieceSpawned(self.current_piece.type, self.next_piece.type))
 
     @property
     def score(self):
@@ -49,79 +104,196 @@ class Game:
     def high_score(self):
         return self._session.high_score
 
+    def save_state(self) -> bytes:
+        """Serialize everything needed to resume this game into one blob.
+
+        Covers the board, current and next piece, the piece RNG, score,
+        level, lines_cleared, gravity_timer and play state. The RNG comes
+        from spawn_piece if it offers get_state/set_state (the sim
+        generators do), otherwise from the global random module that the
+        default spawn function uses. The session high score is not saved.
+
+        Returns:
+            bytes: Blob for load_state (also fine to write to disk).
+        """
+        get_rng_state = getattr(self.spawn_piece, "get_state", None)
+        rng_state = get_rng_state() if get_rng_state is not None else random.getstate()
+        current = self.current_piece.snapshot() if self.current_piece is not None else None
+        next_ = self.next_piece.snapshot() if self.next_piece is not None else None
+        state = (
+            self.SAVE_FORMAT,
+            self.board.snapshot(),
+            current,
+            next_,
+            rng_state,
+            self._score,
+            self.start_level,
+            self.level,
+            self.lines_cleared,
+            self.gravity_timer,
+            self._state,
+            self.paused,
+        )
+        return pickle.dumps(state, pickle.HIGHEST_PROTOCOL)
+
+    def load_state(self, blob: bytes) -> None:
+        """Restore a game saved with save_state.
+
+        Loading the same blob twice yields two identical games, so bots can
+        fork a position and play it out several ways. Only load blobs this
+        program wrote (they are pickles).
+
+        Raises:
+            ValueError: If the blob was written by an incompatible version.
+        """
+        state = pickle.loads(blob)
+        if not state or state[0] != self.SAVE_FORMAT:
+            raise ValueError("Unsupported save_state format")
+        (_, board, current, next_, rng_state, score, start_level, level,
+         lines_cleared, gravity_timer, game_state, paused) = state
+
+        self.board.restore(board)
+        self.current_piece = Piece.from_snapshot(current) if current is not None else None
+        self.next_piece = Piece.from_snapshot(next_) if next_ is not None else None
+        set_rng_state = getattr(self.spawn_piece, "set_state", None)
+        if set_rng_state is not None:
+            set_rng_state(rng_state)
+        else:
+            random.setstate(rng_state)
+
+        self._score = score
+        self.start_level = start_level
+        self.level = level
+        self.lines_cleared = lines_cleared
+        self.gravity_delay = self._calculate_gravity_delay()
+        self.gravity_rows = self._calculate_gravity_rows()
+        self.gravity_timer = gravity_timer
+        self._state = game_state
+        self.paused = paused
+        self.game_over = game_state == GAME_OVER
+        self.done = False
+        self.event_log.info("state_loaded", level=level, score=score)
+        self.events.publish(StateChanged(self._state, self.paused))
+
     def apply(self, intents):
-        """Apply player intents (LEFT/RIGHT/ROTATE/DROP/SOFT_DOWN/PAUSE/CLICK/START/EXIT)"""
-        # Handle start screen and game over states
-        if self._state == START_SCREEN:
-            for intent in intents:
-                if intent == "START":
-                    self.start_new_game()
-                elif intent == "QUIT":
-                    self.done = True
-            return
-            
-        if self._state == GAME_OVER:
-            for intent in intents:
-                if intent == "QUIT":
-                    self.done = True
-                elif intent == "RESTART":
-                    self.start_new_game()
+        """Apply player intents (LEFT/RIGHT/ROTATE/DROP/SOFT_DOWN/PAUSE/CLICK/START/EXIT)
+
+        Intents may be Intent codes or their string names. Consecutive
+        repeats are coalesced into one run, then dispatched through the
+        handler table for the state the game was in when apply was called.
+        """
+        handlers = self._handlers[self._state]
+        self._pause_toggled = False
+        for code, count in coalesce(intents):
+            handler = handlers.get(code)
+            if handler is not None:
+                handler(count)
+
+    # Intent handlers: each receives how many times the intent was repeated in a row
+
+    def _on_start(self, count):
+        """START/RESTART from a menu screen; repeats would only restart again."""
+        self.start_new_game()
+
+    def _on_quit(self, count):
+        self.done = True
+
+    def _on_pause(self, count):
+        """Toggle pause; a PAUSE/PAUSE pair cancels out."""
+        if count % 2:
+            self._set_paused(not self.paused)
+        self._pause_toggled = True
+
+    def _on_resume(self, count):
+        self._set_paused(False)
+
+    def _on_restart(self, count):
+        self.start_new_game()
+        self._pause_toggled = False
+
+    def _on_click(self, count):
+        """A click resumes a paused game, unless the same batch just paused it."""
+        if self.paused and not self._pause_toggled:
+            self._set_paused(False)
+
+    def _on_left(self, count):
+        self._repeat_until_blocked(lambda: self._try_move(-1, 0), count)
+
+    def _on_right(self, count):
+        self._repeat_until_blocked(lambda: self._try_move(1, 0), count)
+
+    def _on_rotate(self, count):
+        self._repeat_until_blocked(self._try_rotate, count)
+
+    def _on_down(self, count):
+        # Each step can lock the piece and spawn a new one, so none are redundant
+        for _ in range(count):
+            if self.paused or self._state == GAME_OVER:
+                return
+            self._try_move(0, 1)
+
+    def _on_drop(self, count):
+        for _ in range(count):
+            if self.paused or self._state == GAME_OVER:
+                return
+            self._drop_piece()
+
+    def _set_paused(self, paused):
+        """Change the pause flag, publishing StateChanged if it actually changed."""
+        if paused != self.paused:
+            self.paused = paused
+            self.events.publish(StateChanged(self._state, paused))
+
+    def _repeat_until_blocked(self, action, count):
+        """Run action up to count times, stopping once it fails (e.g. at a wall)."""
+        if self.paused:
             return
-            
-        # Game is in progress - handle gameplay inputs
-        pause_toggled = False
-        for intent in intents:
-            if intent == "PAUSE":
-                self.paused = not self.paused
-                pause_toggled = True
-            elif intent == "RESUME":
-                self.paused = False
-                continue
-            elif intent == "RESTART":
-                self.start_new_game()
-                pause_toggled = False
-                continue
-            elif intent == "CLICK" and self.paused and not pause_toggled:
-                self.paused = False
-                continue
-            if self.paused:
-                continue
-            if intent == "LEFT":
-                self._try_move(-1, 0)
-            elif intent == "RIGHT":
-                self._try_move(1, 0)
-            elif intent == "DOWN" or intent == "SOFT_DOWN":
-                self._try_move(0, 1)
-            elif intent == "ROTATE":
-                self._try_rotate()
-            elif intent == "DROP":
-                self._drop_piece()
+        for _ in range(count):
+            if not action():
+                return
 
     def _try_move(self, dx, dy):
-        """Try a move/rotate → if collision, cancel it"""
+        """Try a move/rotate → if collision, cancel it
+
+        Returns:
+            bool: True if the piece moved, False if it was blocked or locked.
+        """
         if self._state == GAME_OVER:
-            return
+            return False
             
         if dx != 0:
-            self.board.go_side(dx, self.current_piece)
+            return self.board.go_side(dx, self.current_piece)
         elif dy != 0:
             if not self.board.go_down(self.current_piece):
                 # If moving down collides → step back, lock piece, clear rows, spawn new piece
-                print("freeze piece in try_move")
-                self._freeze_piece()
+                self._freeze_piece("soft_drop")
+                return False
+            return True
+        return False
 
     def _try_rotate(self):
-        """Try rotation → if collision, cancel it"""
+        """Try rotation → if collision, cancel it
+
+        Returns:
+            bool: True if the piece rotated, False if it was blocked.
+        """
         if self._state == GAME_OVER:
-            return
+            return False
             
-        self.board.rotate(self.current_piece)
+        return self.board.rotate(self.current_piece)
 
-    def _freeze_piece(self):
-        """Freeze step: lock piece, clear rows, spawn new piece"""
+    def _freeze_piece(self, source="lock"):
+        """Freeze step: lock piece, clear rows, spawn new piece
+
+        Args:
+            source (str): What locked the piece (soft_drop, hard_drop or gravity).
+        """
         # Piece is already placed by board.go_down() when it returns False
+        piece = self.current_piece
+        if piece is not None:
+            self.event_log.debug("piece_locked", source=source, x=piece.x, y=piece.y)
+            self.events.publish(PieceLocked(piece.type, piece.x, piece.y, source))
         lines_cleared = self.board.clear_full_lines()  # clear rows, returns count
-        print("freeze piece")
         # Update score and level if lines cleared
         if lines_cleared > 0:
             # First apply base scoring
@@ -135,6 +307,8 @@ class Game:
                 self._session.update_high_score(self._score)
             except Exception:
                 pass
+            self.event_log.info("lines_cleared", count=lines_cleared, total=self.lines_cleared, score=self._score)
+            self.events.publish(LinesCleared(lines_cleared, self.lines_cleared, self._score))
         self._spawn_new_piece()  # spawn new piece (private)
 
     def _drop_piece(self):
@@ -143,28 +317,56 @@ class Game:
             return
             
         self.board.go_space(self.current_piece)
-        print("drop piece")
-        self._freeze_piece()
+        self._freeze_piece("hard_drop")
 
     def _spawn_new_piece(self):
         """Replaces current piece with next piece and spawns a new next piece then checks for game over (private)"""
         self.current_piece = self.next_piece
         self.next_piece = self.spawn_piece()
+        self.events.publish(PieceSpawned(self.current_piece.type, self.next_piece.type))
         if self.board.will_piece_collide(self.current_piece):
             self._state = GAME_OVER
+            self.event_log.info("game_over", score=self._score, level=self.level, lines=self.lines_cleared)
+            self.events.publish(StateChanged(self._state, self.paused))
+            self.events.publish(GameOver(self._score, self.level, self.lines_cleared))
 
     def update(self):
-        """Update game state (gravity)"""
+        """Advance the game by one fixed simulation tick (gravity)"""
         if self._state == GAME_OVER:
             return
             
         if not self.paused:
-            self.gravity_timer += 1
+            # The timer gains gravity_rows per tick and each full gravity_delay
+            # is one row, so fractional speeds (e.g. 3 rows per 10 ticks) keep
+            # their remainder instead of rounding
+            self.gravity_timer += self.gravity_rows
             if self.gravity_timer >= self.gravity_delay:
-                if not self.board.go_down(self.current_piece):
-                    print("freeze piece in update")
-                    self._freeze_piece()
-                self.gravity_timer = 0
+                rows = self.gravity_timer // self.gravity_delay
+                self.gravity_timer -= rows * self.gravity_delay
+                self._apply_gravity(rows)
+
+    def _apply_gravity(self, rows):
+        """Move the current piece down by up to rows, locking it if it lands.
+
+        A single row uses board.go_down. Larger steps (high levels, up to
+        20G) ask the board for the landing row once instead of looping.
+        """
+        piece = self.current_piece
+        if rows == 1:
+            landed = not self.board.go_down(piece)
+        else:
+            land_y = self.board.get_landing_y(piece)
+            landed = piece.y + rows > land_y
+            if landed:
+                piece.y = land_y
+                self.board.place_piece(piece)
+            else:
+                piece.y += rows
+
+        if landed:
+            self._freeze_piece("gravity")
+            # Leftover gravity belongs to the old piece, not the new one
+            self.gravity_timer = 0
 
     def _update_score(self, lines_cleared):
         """Update score based on number of lines cleared.
@@ -182,16 +384,33 @@ class Game:
         As level increases, pieces fall faster.
         
         Returns:
-            int: Frames between auto-fall
+            int: Simulation ticks between auto-fall
         """
-        # How much faster (in frames) the gravity becomes per level
-        speed_increase = 3
+        # How much faster (in ticks) the gravity becomes per level
+        speed_increase = self.GRAVITY_SPEED_INCREASE
         # Minimum delay (cap) to avoid zero/negative gravity timings
-        min_delay = 10
+        min_delay = self.MIN_GRAVITY_DELAY
         calculated_delay = self.base_gravity_delay - (self.level - 1) * speed_increase
-        # Enforce a floor so gravity never goes below `min_delay` frames
+        # Enforce a floor so gravity never goes below `min_delay` ticks
         return max(min_delay, calculated_delay)
 
+    def _calculate_gravity_rows(self) -> int:
+        """Calculate how many rows gravity covers per gravity_delay ticks.
+
+        Until gravity_delay reaches its floor this is one row. Each level
+        past that moves further along GRAVITY_ROWS_CURVE, so speed keeps
+        rising up to 20G (a full board height per tick).
+
+        Returns:
+            int: Rows per gravity_delay ticks
+        """
+        # Last level whose delay is still above the floor
+        levels_above_floor = -(-(self.base_gravity_delay - self.MIN_GRAVITY_DELAY) // self.GRAVITY_SPEED_INCREASE)
+        steps = self.level - (levels_above_floor + 1)
+        if steps <= 0:
+            return 1
+        return self.GRAVITY_ROWS_CURVE[min(steps, len(self.GRAVITY_ROWS_CURVE)) - 1]
+
     def _update_level(self, lines_cleared_count: int) -> None:
         """Update level based on lines cleared.
         
@@ -204,6 +423,9 @@ class Game:
             if new_level > self.level:
                 self.level = new_level
                 self.gravity_delay = self._calculate_gravity_delay()
+                self.gravity_rows = self._calculate_gravity_rows()
+                self.event_log.info("level_up", level=self.level, gravity_delay=self.gravity_delay)
+                self.events.publish(LevelUp(self.level, self.gravity_delay))
 
             # Update score for the cleared lines using current level multiplier
             self._add_score(lines_cleared_count)
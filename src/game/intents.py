@@ -0,0 +1,78 @@
+"""
+Integer intent codes and helpers for Game.apply.
+
+Input sources (keyboard, buttons, bots) describe what the player wants as
+intents. Game works on the integer codes below; the historical string names
+("LEFT", "DROP", ...) are still accepted and translated on the way in.
+"""
+
+from enum import IntEnum
+
+
+class Intent(IntEnum):
+    """Player intents understood by Game.apply."""
+    LEFT = 1
+    RIGHT = 2
+    DOWN = 3
+    SOFT_DOWN = 4
+    ROTATE = 5
+    DROP = 6
+    PAUSE = 7
+    RESUME = 8
+    RESTART = 9
+    CLICK = 10
+    START = 11
+    QUIT = 12
+    EXIT = 13
+
+
+# String name -> code, for callers that still send strings
+INTENT_CODES = {intent.name: intent for intent in Intent}
+
+
+def to_code(intent):
+    """
+    Translate a single intent into its Intent code.
+
+    Args:
+        intent (Intent | int | str): Intent code or legacy string name.
+
+    Returns:
+        Intent or None: The code, or None if the intent is not recognised.
+    """
+    if isinstance(intent, Intent):
+        return intent
+    if isinstance(intent, str):
+        return INTENT_CODES.get(intent)
+    try:
+        return Intent(intent)
+    except ValueError:
+        return None
+
+
+def coalesce(intents) -> list:
+    """
+    Collapse a sequence of intents into (code, count) runs.
+
+    Consecutive repeats of the same intent become a single run so handlers
+    can deal with them in one step (e.g. stop moving once a wall is hit, or
+    cancel a PAUSE/PAUSE pair). Unknown intents are dropped.
+
+    Args:
+        intents (iterable): Intent codes or legacy string names.
+
+    Returns:
+        list: (Intent, count) tuples in the original order.
+    """
+    runs = []
+    last_code = None
+    for intent in intents:
+        code = to_code(intent)
+        if code is None:
+            continue
+        if code == last_code:
+            runs[-1][1] += 1
+        else:
+            runs.append([code, 1])
+            last_code = code
+    return [(code, count) for code, count in runs]
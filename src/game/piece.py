@@ -15,18 +15,37 @@ class Piece:
     """
 
 
-    def __init__(self, x, y) -> None:
+    def __init__(self, x, y, rng=None) -> None:
         """
         Initializes a new piece with a random shape and color at the given (x, y) position.
 
         Args:
             x (int): Initial X position.
             y (int): Initial Y position.
+            rng (random.Random, optional): Source of randomness. Defaults to the
+                global random module; pass a seeded instance for reproducible runs.
         """
+        rng = rng if rng is not None else random
 
         self.x = x
         self.y = y
-        self.type = random.randint(0, len(figures.SHAPES) - 1) # pick random shape
-        self.color = random.randint(1, len(constants.COLORS) - 1) # pick random color
+        self.type = rng.randint(0, len(figures.SHAPES) - 1) # pick random shape
+        self.color = rng.randint(1, len(constants.COLORS) - 1) # pick random color
         self.rotation = 0 # start unrotated
-        self.cells = [] # empty since no cells filled in yet
\ No newline at end of file
+        self.cells = [] # empty since no cells filled in yet
+
+    def snapshot(self) -> tuple:
+        """Return the piece as an immutable tuple for Game.save_state."""
+        return (self.x, self.y, self.type, self.color, self.rotation, tuple(self.cells))
+
+    @classmethod
+    def from_snapshot(cls, snapshot) -> "Piece":
+        """
+        Rebuild a piece from a tuple returned by snapshot().
+
+        Bypasses __init__ so restoring a piece does not draw from any RNG.
+        """
+        piece = cls.__new__(cls)
+        piece.x, piece.y, piece.type, piece.color, piece.rotation, cells = snapshot
+        piece.cells = list(cells)
+        return piece
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 class Row:
   """
     Represents a single row in the game board using bit manipulation.
@@ -27,6 +29,16 @@ class Row:
   def mask(self) -> int:
       return self._mask
 
+  @property
+  def bits(self) -> int:
+      """Occupied cells as a bitmask (bit col set = occupied)."""
+      return self.__bits
+
+  @property
+  def colors(self) -> MappingProxyType:
+      """Read-only view of the colors of occupied cells, keyed by column."""
+      return MappingProxyType(self.__colors)
+
   def is_full(self) -> bool:
     """
       Checks if the row is completely filled.
@@ -95,3 +107,23 @@ class Row:
     """
     self._check_column_index(col, "get_color")  # Validate column index
     return self.__colors.get(col)
+
+  def snapshot(self) -> tuple:
+    """
+      Returns the row contents as an immutable (bits, colors) pair.
+
+      Returns:
+        tuple: (bitmask, tuple of (col, color) pairs).
+    """
+    return (self.__bits, tuple(self.__colors.items()))
+
+  def restore(self, snapshot: tuple) -> None:
+    """
+      Replaces the row contents with a pair returned by snapshot().
+
+      Args:
+        snapshot (tuple): (bitmask, tuple of (col, color) pairs).
+    """
+    bits, colors = snapshot
+    self.__bits = bits & self.mask
+    self.__colors = dict(colors)
@@ -0,0 +1,279 @@
+"""
+Gym-style environments for training bots.
+
+TetrisEnv wraps one Game behind reset(seed)/step(action), and VectorEnv
+steps a batch of them per call, either in this process or spread over a
+pool of worker processes.
+
+Observations are built straight from the board's row bitmasks. With NumPy
+installed they are uint8 arrays of shape (2, HEIGHT, WIDTH): plane 0 holds
+locked cells and plane 1 the falling piece. Without NumPy they are the raw
+bitmasks, a (locked_rows, piece_rows) pair of int tuples.
+"""
+
+import multiprocessing
+import random
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; observations fall back to bitmask tuples
+    np = None
+
+from src.constants import WIDTH, HEIGHT
+from src.constants.game_states import GAME_OVER
+from src.figures import SHAPES
+from src.game.board import Board
+from src.game.game import Game
+from src.game.intents import Intent
+from src.game.row import Row
+from src.utils.session_manager import SessionManager
+from src.utils.event_log import EventLog, OFF
+from src.sim.generators import GENERATORS
+
+# Discrete action space: action index -> intent (None means do nothing this tick)
+ACTIONS = (None, Intent.LEFT, Intent.RIGHT, Intent.ROTATE, Intent.DOWN, Intent.DROP)
+
+# Backends accepted by VectorEnv
+BACKENDS = ("serial", "process")
+
+
+class TetrisEnv:
+    """
+    Single game behind a reset/step interface.
+
+    Each step applies one action and then one gravity tick. The reward is
+    the score gained during the step and done is True once the game is over.
+    """
+
+    def __init__(self, generator="bag", start_level=1):
+        if generator not in GENERATORS:
+            raise ValueError(f"Unknown generator '{generator}', expected one of {', '.join(GENERATORS)}")
+        self._generator = GENERATORS[generator]
+        board = Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH)
+        self.game = Game(board, self._generator(random.Random()), SessionManager(), EventLog(level=OFF))
+        self.game.start_level = start_level
+        self._seeder = random.Random()  # Seeds each new game; reset(seed) reseeds it
+        self._done = True
+        if np is not None:
+            self._shifts = np.arange(WIDTH, dtype=np.uint32)
+
+    @property
+    def action_count(self) -> int:
+        return len(ACTIONS)
+
+    def reset(self, seed=None):
+        """
+        Start a new game.
+
+        Args:
+            seed (int, optional): Seed for this and all later games. Without
+                one, the piece sequence continues the last seeded stream.
+
+        Returns:
+            The first observation.
+        """
+        if seed is not None:
+            self._seeder = random.Random(seed)
+        self.game.spawn_piece = self._generator(random.Random(self._seeder.getrandbits(64)))
+        self.game.start_new_game()
+        self._done = False
+        return self._observe()
+
+    def step(self, action):
+        """
+        Apply one action and advance the game by one tick.
+
+        Args:
+            action (int): Index into ACTIONS.
+
+        Returns:
+            tuple: (observation, reward, done, info)
+        """
+        if self._done:
+            raise RuntimeError("Game is over, call reset() before step()")
+        game = self.game
+        score = game.score
+        intent = ACTIONS[action]
+        if intent is not None:
+            game.apply((intent,))
+        game.update()
+        self._done = game._state == GAME_OVER
+        info = {"score": game.score, "lines": game.lines_cleared, "level": game.level}
+        return self._observe(), game.score - score, self._done, info
+
+    def _piece_bits(self) -> tuple:
+        """Bitmask per row for the falling piece."""
+        piece = self.game.current_piece
+        bits = [0] * HEIGHT
+        for grid_position in SHAPES[piece.type][piece.rotation]:
+            row = piece.y + grid_position // 4
+            if 0 <= row < HEIGHT:
+                bits[row] |= 1 << (piece.x + grid_position % 4)
+        return tuple(bits)
+
+    def _observe(self):
+        locked = self.game.board.row_bits()
+        piece = self._piece_bits()
+        if np is None:
+            return (locked, piece)
+        rows = np.array((locked, piece), dtype=np.uint32)
+        return ((rows[..., None] >> self._shifts) & 1).astype(np.uint8)
+
+
+def _stack(observations):
+    return np.stack(observations) if np is not None else list(observations)
+
+
+def _array(values):
+    return np.array(values) if np is not None else list(values)
+
+
+class _EnvBatch:
+    """A list of envs stepped together; finished games restart automatically."""
+
+    def __init__(self, count, env_kwargs):
+        self.envs = [TetrisEnv(**env_kwargs) for _ in range(count)]
+
+    def reset(self, seeds):
+        return [env.reset(seed) for env, seed in zip(self.envs, seeds)]
+
+    def step(self, actions):
+        observations, rewards, dones, infos = [], [], [], []
+        for env, action in zip(self.envs, actions):
+            observation, reward, done, info = env.step(action)
+            if done:
+                # Report the final observation in info and hand back a fresh game
+                info["final_observation"] = observation
+                observation = env.reset()
+            observations.append(observation)
+            rewards.append(reward)
+            dones.append(done)
+            infos.append(info)
+        return observations, rewards, dones, infos
+
+
+def _worker(conn, count, env_kwargs):
+    """Process-pool backend: serve reset/step commands for one slice of envs."""
+    batch = _EnvBatch(count, env_kwargs)
+    try:
+        while True:
+            command, payload = conn.recv()
+            if command == "step":
+                conn.send(batch.step(payload))
+            elif command == "reset":
+                conn.send(batch.reset(payload))
+            elif command == "close":
+                break
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        conn.close()
+
+
+class VectorEnv:
+    """
+    Step num_envs games per call.
+
+    Finished games are reset automatically: their done flag is True for that
+    step, the returned observation is the first one of the new game and the
+    last observation of the old game is in info["final_observation"].
+
+    The "serial" backend runs every env in this process. The "process"
+    backend splits them over worker processes, which pays off once each
+    step does enough work to cover the pipe round trip.
+    """
+
+    def __init__(self, num_envs, backend="serial", workers=None, **env_kwargs):
+        if num_envs <= 0:
+            raise ValueError("num_envs must be a positive integer")
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {', '.join(BACKENDS)}")
+        self.num_envs = num_envs
+        self.backend = backend
+        self._batch = None
+        self._pipes = []
+        self._processes = []
+        self._slices = []
+
+        if backend == "serial":
+            self._batch = _EnvBatch(num_envs, env_kwargs)
+            return
+
+        workers = min(workers or multiprocessing.cpu_count(), num_envs)
+        start = 0
+        for index in range(workers):
+            count = num_envs // workers + (1 if index < num_envs % workers else 0)
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_worker, args=(child, count, env_kwargs), daemon=True)
+            process.start()
+            child.close()
+            self._pipes.append(parent)
+            self._processes.append(process)
+            self._slices.append(slice(start, start + count))
+            start += count
+
+    def reset(self, seed=None):
+        """
+        Start new games in every env.
+
+        Args:
+            seed (int, optional): Env i is seeded with seed + i.
+
+        Returns:
+            Batched observations.
+        """
+        seeds = [None if seed is None else seed + i for i in range(self.num_envs)]
+        if self._batch is not None:
+            return _stack(self._batch.reset(seeds))
+        for pipe, part in zip(self._pipes, self._slices):
+            pipe.send(("reset", seeds[part]))
+        observations = []
+        for pipe in self._pipes:
+            observations.extend(pipe.recv())
+        return _stack(observations)
+
+    def step(self, actions):
+        """
+        Apply one action per env.
+
+        Args:
+            actions: Sequence of num_envs action indexes.
+
+        Returns:
+            tuple: (observations, rewards, dones, infos), batched over envs.
+        """
+        actions = list(actions)
+        if len(actions) != self.num_envs:
+            raise ValueError(f"Expected {self.num_envs} actions, got {len(actions)}")
+        if self._batch is not None:
+            observations, rewards, dones, infos = self._batch.step(actions)
+        else:
+            for pipe, part in zip(self._pipes, self._slices):
+                pipe.send(("step", actions[part]))
+            observations, rewards, dones, infos = [], [], [], []
+            for pipe in self._pipes:
+                part_obs, part_rewards, part_dones, part_infos = pipe.recv()
+                observations.extend(part_obs)
+                rewards.extend(part_rewards)
+                dones.extend(part_dones)
+                infos.extend(part_infos)
+        return _stack(observations), _array(rewards), _array(dones), infos
+
+    def close(self) -> None:
+        """Stop worker processes (no-op for the serial backend)."""
+        for pipe in self._pipes:
+            try:
+                pipe.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+            pipe.close()
+        for process in self._processes:
+            process.join(timeout=1)
+        self._pipes = []
+        self._processes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,182 @@
+"""
+Self-play farm: many headless games spread over worker processes.
+
+Each worker pulls batches of seeds from a task queue, plays one headless
+game per seed and streams a small summary per game back over a result
+queue. The parent aggregates summaries as they arrive, so results are
+available while the run is still going. Exact percentiles need every
+value, so the parent's memory grows with the number of games: four packed
+8-byte values per game (about 32 MB per million games), plus a byte per
+seed while the run is in progress. Nothing here imports pygame, which
+keeps worker startup cheap.
+"""
+
+import multiprocessing
+from array import array
+import os
+import queue
+import time
+import traceback
+
+from src.sim.runner import run_headless
+from src.utils.stats import percentile
+
+# Seeds handed to a worker per task; larger batches mean less queue traffic
+SEEDS_PER_TASK = 16
+
+# How long run_farm waits for a result before checking for dead workers
+RESULT_POLL_SECONDS = 1.0
+
+# Per-game summary fields, in the order workers send them
+SUMMARY_FIELDS = ("seed", "score", "lines", "pieces", "duration", "game_over")
+
+
+class FarmReport:
+    """Aggregated per-game summaries from a farm run."""
+
+    # Summary fields that get percentile statistics, with their array typecodes
+    STAT_FIELDS = ("score", "lines", "pieces", "duration")
+    _TYPECODES = {"score": "q", "lines": "q", "pieces": "q", "duration": "d"}
+
+    def __init__(self):
+        self.games = 0
+        self.game_overs = 0
+        self.errors = []     # (seed, formatted traceback) for games that raised
+        self.elapsed = 0.0   # Wall time for the whole farm run
+        # Packed arrays rather than lists of Python objects: 8 bytes per value
+        self._values = {field: array(self._TYPECODES[field]) for field in self.STAT_FIELDS}
+
+    def add(self, summary) -> None:
+        """Record one game summary (a tuple in SUMMARY_FIELDS order)."""
+        _, score, lines, pieces, duration, game_over = summary
+        self.games += 1
+        self.game_overs += 1 if game_over else 0
+        self._values["score"].append(score)
+        self._values["lines"].append(lines)
+        self._values["pieces"].append(pieces)
+        self._values["duration"].append(duration)
+
+    def values(self, field) -> array:
+        return self._values[field]
+
+    def percentiles(self, field, percents=(50, 90, 99)) -> dict:
+        """
+        Percentiles of a summary field.
+
+        Returns:
+            dict: percent -> value (None if no games were recorded).
+        """
+        ordered = sorted(self._values[field])
+        return {percent: percentile(ordered, percent) for percent in percents}
+
+    def mean(self, field) -> float:
+        values = self._values[field]
+        return sum(values) / len(values) if values else 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _farm_worker(tasks, results, options):
+    """Play one game per seed until the task queue yields the None sentinel."""
+    while True:
+        seeds = tasks.get()
+        if seeds is None:
+            break
+        for seed in seeds:
+            try:
+                result = run_headless(seed=seed, **options)
+            except Exception:
+                results.put(("error", seed, traceback.format_exc()))
+                continue
+            results.put(("game", (seed, result.score, result.lines, result.pieces,
+                                  result.elapsed, result.game_over)))
+    results.put(("done", os.getpid()))
+
+
+def run_farm(games, workers=None, first_seed=0, on_result=None, **options) -> FarmReport:
+    """
+    Play many headless games across worker processes and aggregate them.
+
+    Args:
+        games (int): Number of games; game i uses seed first_seed + i.
+        workers (int, optional): Worker processes. Defaults to the CPU count.
+        first_seed (int): Seed of the first game.
+        on_result (callable, optional): Called with each summary tuple
+            (see SUMMARY_FIELDS) as it arrives, e.g. for progress output.
+        **options: Passed to run_headless (generator, policy, max_pieces, ...).
+            At least one stop condition is required, as for run_headless.
+
+    Returns:
+        FarmReport: Aggregated results. Seeds left unplayed because a worker
+        process died are recorded in its errors.
+    """
+    if games <= 0:
+        raise ValueError("games must be a positive integer")
+    if all(options.get(key) is None for key in ("max_pieces", "max_lines", "max_seconds", "max_ticks")):
+        raise ValueError("At least one stop condition is required")
+    workers = min(workers or multiprocessing.cpu_count(), games)
+
+    tasks = multiprocessing.Queue()
+    results = multiprocessing.Queue()
+    for start in range(first_seed, first_seed + games, SEEDS_PER_TASK):
+        tasks.put(range(start, min(start + SEEDS_PER_TASK, first_seed + games)))
+    for _ in range(workers):
+        tasks.put(None)
+
+    report = FarmReport()
+    start_time = time.perf_counter()
+    processes = [multiprocessing.Process(target=_farm_worker, args=(tasks, results, options), daemon=True)
+                 for _ in range(workers)]
+    for process in processes:
+        process.start()
+
+    finished = bytearray(games)  # 1 per seed that produced a game or an error
+    dead = {}                    # pid -> exit code of workers that died without "done"
+    running = {process.pid for process in processes}
+
+    def receive(message):
+        kind, payload, *rest = message
+        if kind == "game":
+            finished[payload[0] - first_seed] = 1
+            report.add(payload)
+            if on_result is not None:
+                on_result(payload)
+        elif kind == "error":
+            finished[payload - first_seed] = 1
+            report.errors.append((payload, rest[0]))
+        else:
+            running.discard(payload)
+
+    try:
+        while running:
+            try:
+                receive(results.get(timeout=RESULT_POLL_SECONDS))
+            except queue.Empty:
+                # A worker killed outside its per-seed try (out of memory, a
+                # signal, an interpreter crash) never sends "done"
+                for process in processes:
+                    if process.pid in running and process.exitcode is not None:
+                        running.discard(process.pid)
+                        dead[process.pid] = process.exitcode
+        if dead:
+            # Collect anything sent just before a worker was declared dead
+            try:
+                while True:
+                    receive(results.get(timeout=0.1))
+            except queue.Empty:
+                pass
+            reason = f"Worker exited with code {', '.join(map(str, dead.values()))} before finishing this seed"
+            for index in range(games):
+                if not finished[index]:
+                    report.errors.append((first_seed + index, reason))
+    finally:
+        for process in processes:
+            process.join(timeout=1)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+    report.elapsed = time.perf_counter() - start_time
+    return report
@@ -0,0 +1,66 @@
+"""
+Seedable piece generators for headless simulation.
+
+Each generator is a callable that returns a new Piece, so it can be passed
+straight to Game as its spawn_piece_func.
+"""
+
+import random
+
+from src.constants import START_X, START_Y
+from src.figures import SHAPES
+from src.game.piece import Piece
+
+
+class RandomGenerator:
+    """Spawn pieces with a uniformly random shape, like the interactive game."""
+
+    def __init__(self, rng=None):
+        self._rng = rng if rng is not None else random.Random()
+
+    def __call__(self) -> Piece:
+        return Piece(START_X, START_Y, self._rng)
+
+    def get_state(self):
+        """Return the RNG state, for Game.save_state."""
+        return self._rng.getstate()
+
+    def set_state(self, state) -> None:
+        self._rng.setstate(state)
+
+
+class BagGenerator:
+    """
+    Spawn pieces from a shuffled "bag" holding one of each shape.
+
+    Every shape appears exactly once per bag, which limits droughts
+    and floods of the same piece.
+    """
+
+    def __init__(self, rng=None):
+        self._rng = rng if rng is not None else random.Random()
+        self._bag = []
+
+    def __call__(self) -> Piece:
+        if not self._bag:
+            self._bag = list(range(len(SHAPES)))
+            self._rng.shuffle(self._bag)
+        piece = Piece(START_X, START_Y, self._rng)
+        piece.type = self._bag.pop()
+        return piece
+
+    def get_state(self):
+        """Return the RNG state and remaining bag, for Game.save_state."""
+        return (self._rng.getstate(), tuple(self._bag))
+
+    def set_state(self, state) -> None:
+        rng_state, bag = state
+        self._rng.setstate(rng_state)
+        self._bag = list(bag)
+
+
+# Generator names accepted by the headless runner
+GENERATORS = {
+    "random": RandomGenerator,
+    "bag": BagGenerator,
+}
@@ -0,0 +1,130 @@
+"""
+Input policies for headless simulation.
+
+A policy is a callable that takes the Game and returns the list of intents
+to apply on this tick, the same shape of data InputHandler produces.
+"""
+
+import itertools
+import random
+
+from src.figures import SHAPES
+from src.game.intents import Intent, to_code
+
+# Gameplay intents a policy may choose from
+MOVE_INTENTS = (Intent.LEFT, Intent.RIGHT, Intent.ROTATE, Intent.DOWN, Intent.DROP)
+
+
+class ScriptedPolicy:
+    """Replay a fixed sequence of intents, one per tick, looping forever."""
+
+    def __init__(self, intents):
+        if not intents:
+            raise ValueError("ScriptedPolicy needs at least one intent")
+        codes = [to_code(intent) for intent in intents]
+        if None in codes:
+            raise ValueError(f"Unknown intent in script: {intents[codes.index(None)]}")
+        self._intents = itertools.cycle(codes)
+
+    def __call__(self, game) -> list:
+        return [next(self._intents)]
+
+
+class RandomPolicy:
+    """Press one random gameplay key per tick."""
+
+    def __init__(self, rng=None):
+        self._rng = rng if rng is not None else random.Random()
+
+    def __call__(self, game) -> list:
+        return [self._rng.choice(MOVE_INTENTS)]
+
+
+class BotPolicy:
+    """
+    Greedy placement bot.
+
+    For every new piece it tries each rotation and column, scores the
+    resulting stack with a classic weighted heuristic and emits the intents
+    that rotate, shift and hard-drop the piece into the best spot.
+    """
+
+    # Heuristic weights (aggregate height, completed lines, holes, bumpiness)
+    HEIGHT_WEIGHT = -0.51
+    LINES_WEIGHT = 0.76
+    HOLES_WEIGHT = -0.36
+    BUMPINESS_WEIGHT = -0.18
+
+    def __call__(self, game) -> list:
+        piece = game.current_piece
+        if piece is None:
+            return []
+        board = game.board
+        grid = [[board.get_cell(row, col) for col in range(board.width)]
+                for row in range(board.height)]
+        rotation, x = self._best_placement(grid, piece)
+
+        intents = [Intent.ROTATE] * ((rotation - piece.rotation) % len(SHAPES[piece.type]))
+        dx = x - piece.x
+        intents += [Intent.RIGHT if dx > 0 else Intent.LEFT] * abs(dx)
+        intents.append(Intent.DROP)
+        return intents
+
+    def _best_placement(self, grid, piece) -> tuple:
+        """Return the (rotation, x) with the highest heuristic score."""
+        height = len(grid)
+        width = len(grid[0])
+        best = (piece.rotation, piece.x)
+        best_score = None
+        for rotation, shape in enumerate(SHAPES[piece.type]):
+            offsets = [(position % 4, position // 4) for position in shape]
+            for x in range(-3, width):
+                if any(not (0 <= x + dx < width) for dx, _ in offsets):
+                    continue
+                y = piece.y
+                if self._collides(grid, offsets, x, y):
+                    continue
+                while not self._collides(grid, offsets, x, y + 1):
+                    y += 1
+                score = self._evaluate(grid, [(x + dx, y + dy) for dx, dy in offsets], height, width)
+                if best_score is None or score > best_score:
+                    best_score = score
+                    best = (rotation, x)
+        return best
+
+    @staticmethod
+    def _collides(grid, offsets, x, y) -> bool:
+        height = len(grid)
+        for dx, dy in offsets:
+            row = y + dy
+            if row >= height or (row >= 0 and grid[row][x + dx]):
+                return True
+        return False
+
+    def _evaluate(self, grid, cells, height, width) -> float:
+        """Score the stack that results from locking `cells` into `grid`."""
+        placed = [row[:] for row in grid]
+        for col, row in cells:
+            if row >= 0:
+                placed[row][col] = True
+        remaining = [row for row in placed if not all(row)]
+        lines = height - len(remaining)
+        placed = [[False] * width for _ in range(lines)] + remaining
+
+        heights = []
+        holes = 0
+        for col in range(width):
+            column_height = 0
+            for row in range(height):
+                if placed[row][col]:
+                    if not column_height:
+                        column_height = height - row
+                elif column_height:
+                    holes += 1
+            heights.append(column_height)
+        bumpiness = sum(abs(a - b) for a, b in zip(heights, heights[1:]))
+
+        return (self.HEIGHT_WEIGHT * sum(heights)
+                + self.LINES_WEIGHT * lines
+                + self.HOLES_WEIGHT * holes
+                + self.BUMPINESS_WEIGHT * bumpiness)
@@ -0,0 +1,151 @@
+"""
+Headless game loop.
+
+Drives Game.apply/Game.update back to back with no window, no frame cap and
+no pygame import, so the engine runs as fast as the interpreter allows.
+"""
+
+import random
+import time
+
+from src.constants import WIDTH, HEIGHT
+from src.constants.game_states import GAME_OVER
+from src.game.board import Board
+from src.game.game import Game
+from src.game.events import PieceLocked
+from src.game.row import Row
+from src.utils.session_manager import SessionManager
+from src.utils.event_log import EventLog, OFF
+from src.sim.generators import GENERATORS
+from src.sim.policies import ScriptedPolicy, RandomPolicy, BotPolicy
+
+# Policy names accepted by the headless runner
+POLICIES = ("scripted", "random", "bot")
+
+# How many ticks to run between wall-clock checks
+TIME_CHECK_INTERVAL = 64
+
+
+class RunResult:
+    """Summary of a finished headless run."""
+
+    def __init__(self, score, lines, pieces, ticks, elapsed, game_over):
+        self.score = score
+        self.lines = lines
+        self.pieces = pieces
+        self.ticks = ticks
+        self.elapsed = elapsed
+        self.game_over = game_over
+
+    @property
+    def pieces_per_second(self) -> float:
+        return self.pieces / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def lines_per_second(self) -> float:
+        return self.lines / self.elapsed if self.elapsed > 0 else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "score": self.score,
+            "lines": self.lines,
+            "pieces": self.pieces,
+            "ticks": self.ticks,
+            "elapsed": self.elapsed,
+            "game_over": self.game_over,
+            "pieces_per_second": self.pieces_per_second,
+            "lines_per_second": self.lines_per_second,
+        }
+
+
+class _LockCounter:
+    """PieceLocked subscriber that counts locked pieces."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, event):
+        self.count += 1
+
+
+def make_policy(name, rng, script=None):
+    """Build an input policy by name."""
+    if name == "scripted":
+        return ScriptedPolicy(script or ["DROP"])
+    if name == "random":
+        return RandomPolicy(rng)
+    if name == "bot":
+        return BotPolicy()
+    raise ValueError(f"Unknown policy '{name}', expected one of {', '.join(POLICIES)}")
+
+
+def run_headless(seed=None, generator="bag", policy="bot", script=None,
+                 max_pieces=None, max_lines=None, max_seconds=None, max_ticks=None,
+                 event_log=None, start_level=1) -> RunResult:
+    """
+    Play a single game without a window until game over or a stop condition is hit.
+
+    Args:
+        seed (int, optional): Seed for the piece generator and random policy.
+        generator (str): Piece generator name, see GENERATORS.
+        policy (str): Input policy name, see POLICIES.
+        script (list, optional): Intents replayed by the scripted policy.
+        max_pieces (int, optional): Stop after this many pieces have locked.
+        max_lines (int, optional): Stop after this many lines have been cleared.
+        max_seconds (float, optional): Stop after this much wall time.
+        max_ticks (int, optional): Stop after this many apply/update ticks.
+        event_log (EventLog, optional): Log for game events. Defaults to a
+            disabled log so logging costs nothing during benchmarks.
+        start_level (int): Level the game starts at (high levels use multi-row gravity).
+
+    Returns:
+        RunResult: Final score, lines, pieces, ticks and elapsed time.
+    """
+    if generator not in GENERATORS:
+        raise ValueError(f"Unknown generator '{generator}', expected one of {', '.join(GENERATORS)}")
+    if max_pieces is None and max_lines is None and max_seconds is None and max_ticks is None:
+        raise ValueError("At least one stop condition is required")
+
+    # Separate streams so the policy's choices don't change the piece sequence
+    seeder = random.Random(seed)
+    spawner = GENERATORS[generator](random.Random(seeder.random()))
+    input_policy = make_policy(policy, random.Random(seeder.random()), script)
+
+    board = Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH)
+    event_log = event_log if event_log is not None else EventLog(level=OFF)
+    game = Game(board, spawner, SessionManager(), event_log)
+    game.start_level = start_level
+    locked = game.events.subscribe(PieceLocked, _LockCounter())
+    game.start_new_game()
+
+    ticks = 0
+    start = time.perf_counter()
+    try:
+        while game._state != GAME_OVER:
+            game.apply(input_policy(game))
+            game.update()
+            ticks += 1
+
+            if max_pieces is not None and locked.count >= max_pieces:
+                break
+            if max_lines is not None and game.lines_cleared >= max_lines:
+                break
+            if max_ticks is not None and ticks >= max_ticks:
+                break
+            if (max_seconds is not None and ticks % TIME_CHECK_INTERVAL == 0
+                    and time.perf_counter() - start >= max_seconds):
+                break
+    except Exception:
+        # Show what the game was doing right before it failed
+        event_log.dump()
+        raise
+    elapsed = time.perf_counter() - start
+
+    return RunResult(
+        score=game.score,
+        lines=game.lines_cleared,
+        pieces=locked.count,
+        ticks=ticks,
+        elapsed=elapsed,
+        game_over=game._state == GAME_OVER,
+    )
@@ -1,6 +1,11 @@
 import pygame
+from src.ui.fonts import get_font, render_text
+
+# Label font for buttons drawn without one, as used by the HUD and popups
+DEFAULT_FONT = ('Arial', 18)
+
 class Button:
-    def __init__(self, rect, label, action, color, text_color, hover_color=None, click_color=None):
+    def __init__(self, rect, label, action, color, text_color, hover_color=None, click_color=None, font=None):
         self.rect = pygame.Rect(rect)
         self.label = label
         self.action = action
@@ -9,25 +14,52 @@ class Button:
         self.hover_color = hover_color if hover_color else self._brighten(color)
         self.click_color = click_color if click_color else self._darken(color)
         self.clicked = False
+        self._font = None        # Font the state surfaces were rendered with
+        self._surfaces = None    # (normal, hover, click) pre-rendered button faces
+        if font is not None:
+            self._render_states(font)
 
     def _darken(self, color, factor=0.8):
         """Darken the given color by the specified factor."""
         return tuple(max(int(c * factor), 0) for c in color)
 
-    def draw(self, screen, font):
-        """Draw the button on the given screen."""
-        mouse_pos = pygame.mouse.get_pos()
+    def _render_states(self, font):
+        """Pre-render the normal, hover and click faces of the button with font."""
+        text_surface = render_text(self.label, font, self.text_color)
+        surfaces = []
+        for color in (self.color, self.hover_color, self.click_color):
+            surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(surface, color, surface.get_rect(), border_radius=10)
+            surface.blit(text_surface, text_surface.get_rect(center=surface.get_rect().center))
+            surfaces.append(surface)
+        self._font = font
+        self._surfaces = tuple(surfaces)
+
+    def state(self, mouse_pos):
+        """Return which face to show: 0 normal, 1 hovered, 2 clicked."""
         if self.clicked:
-            current_color = self.click_color
-        elif self.is_hovered(mouse_pos):
-            current_color = self.hover_color
-        else:
-            current_color = self.color
+            return 2
+        if self.is_hovered(mouse_pos):
+            return 1
+        return 0
+
+    def draw(self, screen, font=None, mouse_pos=None):
+        """Draw the button on the given screen.
 
-        pygame.draw.rect(screen, current_color, self.rect, border_radius=10)
-        text_surface = font.render(self.label, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        Args:
+            screen (pygame.Surface): Target surface.
+            font (pygame.font.Font, optional): Label font; defaults to the one
+                the button was created with, else DEFAULT_FONT in bold.
+            mouse_pos (tuple, optional): Mouse position this frame; read from
+                pygame if not given.
+        """
+        if font is None and self._surfaces is None:
+            font = get_font(*DEFAULT_FONT, bold=True)  # Created without a font
+        if font is not None and font is not self._font:
+            self._render_states(font)
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
+        screen.blit(self._surfaces[self.state(mouse_pos)], self.rect)
 
     def is_hovered(self, pos):
         """Check if the button is hovered by the mouse position pos."""
@@ -35,4 +67,4 @@ class Button:
 
     def _brighten(self, color, factor=1.2):
         """Brighten the given color by the specified factor."""
-        return tuple(min(int(c * factor), 255) for c in color)
\ No newline at end of file
+        return tuple(min(int(c * factor), 255) for c in color)
@@ -2,17 +2,37 @@ import pygame
 from src.ui.button import Button
 
 class ButtonManager:
-    def __init__(self):
+    def __init__(self, font=None):
+        """
+        Args:
+            font (pygame.font.Font, optional): Label font; buttons are
+                pre-rendered with it as they are added. Without one they are
+                rendered on first draw with the button default font.
+        """
         self.buttons = []
+        self.font = font
+        # Buttons from before the last clear(), reused by add_button() when the
+        # same button is added again so its faces aren't rendered every frame
+        self._retired = {}
 
     def add_button(self, rect, label, action, color=(0, 200, 0), text_color=(255, 255, 255)):
         """Add a button to be managed."""
-        self.buttons.append(Button(rect, label, action, color, text_color))
+        button = self._retired.pop(self._key(pygame.Rect(rect), label, action, color, text_color), None)
+        if button is None:
+            button = Button(rect, label, action, color, text_color, font=self.font)
+        self.buttons.append(button)
 
-    def draw(self, screen, font):
+    @staticmethod
+    def _key(rect, label, action, color, text_color):
+        """Identity of a button for reuse across clear()/add_button()."""
+        return (tuple(rect), label, action, tuple(color), tuple(text_color))
+
+    def draw(self, screen, font=None, mouse_pos=None):
         """Draw all managed buttons on the given screen."""
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
         for button in self.buttons:
-            button.draw(screen, font)
+            button.draw(screen, font, mouse_pos)
 
     def handle_click(self, pos):
         """Return the action of the button at pos, if any."""
@@ -21,9 +41,10 @@ class ButtonManager:
                 return button.action
         return None
 
-    def set_cursor(self):
+    def set_cursor(self, mouse_pos=None):
         """Set the mouse cursor based on hover state over buttons."""
-        mouse_pos = pygame.mouse.get_pos()
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
         if any(button.is_hovered(mouse_pos) for button in self.buttons):
             pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
         else:
@@ -31,4 +52,8 @@ class ButtonManager:
 
     def clear(self):
         """Remove all managed buttons."""
-        self.buttons = []
\ No newline at end of file
+        self._retired = {
+            self._key(button.rect, button.label, button.action, button.color, button.text_color): button
+            for button in self.buttons
+        }
+        self.buttons = []
@@ -0,0 +1,143 @@
+from collections import OrderedDict
+
+import pygame
+
+TEXT_CACHE_SIZE = 256  # Rendered text surfaces kept before the least recently used is dropped
+
+
+class FontRegistry:
+    """
+    Shared pygame fonts, created once per (name, size, style).
+
+    pygame.font.SysFont scans the system font list on every call, so HUD
+    and popup code asks the registry instead of building fonts per frame.
+    A name of None means pygame's default font (pygame.font.Font(None, size)).
+    """
+
+    def __init__(self):
+        self._fonts = {}
+
+    def get(self, name, size, bold=False, italic=False):
+        """
+        Return the font for name/size/style, loading it on first use.
+
+        Args:
+            name (str or None): System font name, or None for the default font.
+            size (int): Point size.
+            bold (bool): Bold style.
+            italic (bool): Italic style.
+
+        Returns:
+            pygame.font.Font: The shared font object.
+        """
+        key = (name, size, bold, italic)
+        font = self._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            if name is None:
+                font = pygame.font.Font(None, size)
+                font.set_bold(bold)
+                font.set_italic(italic)
+            else:
+                font = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+            self._fonts[key] = font
+            _clear_on_quit()
+        return font
+
+    def clear(self):
+        """Forget all fonts."""
+        self._fonts.clear()
+
+    def __len__(self):
+        return len(self._fonts)
+
+
+class TextCache:
+    """
+    Least-recently-used cache of rendered text surfaces.
+
+    Surfaces are keyed by (text, font, color, antialias), so HUD text whose
+    value did not change is rendered once rather than every frame. The
+    returned surfaces are shared: blit them, don't draw on them.
+    """
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text, font, color, antialias=True):
+        """
+        Return text rendered with font in color, reusing a cached surface.
+
+        Args:
+            text (str): Text to render.
+            font (pygame.font.Font): Font to render with.
+            color (tuple): RGB text color.
+            antialias (bool): Smooth glyph edges.
+
+        Returns:
+            pygame.Surface: The rendered text.
+        """
+        key = (text, font, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)  # Evict the least recently used
+        _clear_on_quit()
+        return surface
+
+    def clear(self):
+        """Drop all cached surfaces and reset the counters."""
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._surfaces)
+
+
+# Shared instances used by the renderer, popups and buttons
+font_registry = FontRegistry()
+text_cache = TextCache()
+_quit_hook_registered = False
+
+
+def _clear_on_quit():
+    """Make pygame.quit() empty the shared caches.
+
+    Font objects must not outlive the pygame session that created them
+    (rendering with one after pygame.quit() crashes), and pygame drops its
+    quit callbacks once they have run, so this re-registers per session.
+    """
+    global _quit_hook_registered
+    if not _quit_hook_registered:
+        pygame.register_quit(clear_caches)
+        _quit_hook_registered = True
+
+
+def clear_caches():
+    """Empty the shared font registry and text cache."""
+    global _quit_hook_registered
+    font_registry.clear()
+    text_cache.clear()
+    _quit_hook_registered = False
+
+
+def get_font(name, size, bold=False, italic=False):
+    """Return a shared font; see FontRegistry.get."""
+    return font_registry.get(name, size, bold=bold, italic=italic)
+
+
+def render_text(text, font, color, antialias=True):
+    """Render text through the shared cache; see TextCache.render."""
+    return text_cache.render(text, font, color, antialias)
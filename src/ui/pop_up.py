@@ -1,8 +1,9 @@
 import pygame
 from typing import List, Tuple, Optional
 from src.ui.pop_up_layout_utils import center_popup
-from src.ui.pop_up_render_utils import draw_popup_background, draw_overlay
+from src.ui.pop_up_render_utils import draw_popup_background, draw_overlay, SHADOW_OFFSET
 from src.ui.button_manager import ButtonManager
+from src.ui.fonts import get_font, render_text
 
 
 class Popup:
@@ -14,6 +15,10 @@ class Popup:
 
     The popup computes its height based on content and centers itself; button_manager is used
     to register the popup buttons (it will be cleared first).
+
+    The panel (shadow, background, title, images and body text) is laid out once into a
+    cached surface and reused while the content is unchanged; only the buttons, whose
+    hover state can change every frame, are drawn on top of it each render.
     """
 
     def __init__(
@@ -37,21 +42,23 @@ class Popup:
         self.element_spacing = element_spacing
         self.title_font_style = title_font_style
         self.body_font_style = body_font_style
+        self._panel = None       # Cached panel surface, see _panel_surface()
+        self._panel_key = None   # Content the cached panel was laid out from
+        self._buttons_top = 0    # Panel y where the buttons start
 
     def _ensure_fonts(self):
         """Ensure fonts are initialized."""
         if self.title_font_style is None:
-            self.title_font_style = pygame.font.Font(None, 48)
+            self.title_font_style = get_font(None, 48)
         if self.body_font_style is None:
-            self.body_font_style = pygame.font.SysFont('Arial', 18)
+            self.body_font_style = get_font('Arial', 18)
 
     def compute_height(self, screen: pygame.Surface) -> int:
         """Compute required popup height based on title, images, body lines, and buttons."""
         self._ensure_fonts()
         popup_height = 0
         if self.title:
-            title_surface = self.title_font_style.render(self.title, True, (0, 0, 0))
-            popup_height += title_surface.get_height()
+            popup_height += self.title_font_style.size(self.title)[1]  # Measure without rendering
             popup_height += self.element_spacing
         # images
         for image in self.images:
@@ -59,8 +66,7 @@ class Popup:
             popup_height += self.element_spacing
         # body lines
         for line in self.body_lines:
-            line_surface = self.body_font_style.render(line, True, (0, 0, 0))
-            popup_height += line_surface.get_height()
+            popup_height += self.body_font_style.size(line)[1]
             popup_height += self.element_spacing
         # buttons area
         if self.button_specs:
@@ -75,50 +81,90 @@ class Popup:
         popup_height += 2 * self.padding
         return popup_height
 
-    def render(self, screen: pygame.Surface, button_manager: ButtonManager, center=True):
-        """Render the popup and register buttons into the provided ButtonManager.
-
-        Returns the popup rect.
+    def _content_key(self):
+        """Everything the panel's pixels depend on."""
+        return (
+            self.title,
+            tuple(self.body_lines),
+            tuple(id(image) for image in self.images),
+            len(self.button_specs),
+            self.popup_width,
+            self.padding,
+            self.element_spacing,
+            self.title_font_style,
+            self.body_font_style,
+        )
+
+    def _panel_surface(self, screen: pygame.Surface) -> pygame.Surface:
+        """Return the laid-out panel, re-rendering it only when the content changed.
+
+        The panel is popup_width x height plus the shadow offset, with per-pixel alpha
+        so the shadow and rounded corners blend over whatever is behind the popup.
         """
         self._ensure_fonts()
-        # Draw overlay
-        draw_overlay(screen, (0, 0, 0))
+        key = self._content_key()
+        if key == self._panel_key:
+            return self._panel
 
-        popup_height = self.compute_height(screen)
         popup_width = self.popup_width
-        if center:
-            popup_x_pos, popup_y_pos = center_popup(screen.get_width(), screen.get_height(), popup_width, popup_height)
-        else:
-            # fallback to top-left
-            popup_x_pos, popup_y_pos = (0, 0)
+        popup_height = self.compute_height(screen)
+        panel = pygame.Surface((popup_width + SHADOW_OFFSET, popup_height + SHADOW_OFFSET), pygame.SRCALPHA)
 
         # background
-        draw_popup_background(screen, (255, 255, 255), popup_x_pos, popup_y_pos, popup_width, popup_height)
+        draw_popup_background(panel, (255, 255, 255), 0, 0, popup_width, popup_height)
 
         # layout cursor
-        layout_cursor_y = popup_y_pos + self.padding
-        popup_center_x = popup_x_pos + popup_width // 2
+        layout_cursor_y = self.padding
+        popup_center_x = popup_width // 2
 
         # title
         if self.title:
-            title_surface = self.title_font_style.render(self.title, True, (0, 0, 0))
+            title_surface = render_text(self.title, self.title_font_style, (0, 0, 0))
             title_rect = title_surface.get_rect(centerx=popup_center_x, top=layout_cursor_y)
-            screen.blit(title_surface, title_rect)
+            panel.blit(title_surface, title_rect)
             layout_cursor_y = title_rect.bottom + self.element_spacing
 
         # images
         for image in self.images:
             image_rect = image.get_rect(centerx=popup_center_x, top=layout_cursor_y)
-            screen.blit(image, image_rect)
+            panel.blit(image, image_rect)
             layout_cursor_y = image_rect.bottom + self.element_spacing
 
         # body lines
         for line in self.body_lines:
-            line_surface = self.body_font_style.render(line, True, (0, 0, 0))
+            line_surface = render_text(line, self.body_font_style, (0, 0, 0))
             line_rect_obj = line_surface.get_rect(centerx=popup_center_x, top=layout_cursor_y)
-            screen.blit(line_surface, line_rect_obj)
+            panel.blit(line_surface, line_rect_obj)
             layout_cursor_y = line_rect_obj.bottom + self.element_spacing
 
+        self._panel = panel
+        self._panel_key = key
+        self._buttons_top = layout_cursor_y  # Buttons stack from here, relative to the panel
+        return panel
+
+    def render(self, screen: pygame.Surface, button_manager: ButtonManager, center=True, mouse_pos=None):
+        """Render the popup and register buttons into the provided ButtonManager.
+
+        mouse_pos is this frame's mouse position (read from pygame if not given).
+
+        Returns the popup rect.
+        """
+        # Draw overlay
+        draw_overlay(screen, (0, 0, 0))
+
+        panel = self._panel_surface(screen)
+        popup_width = self.popup_width
+        popup_height = panel.get_height() - SHADOW_OFFSET
+        if center:
+            popup_x_pos, popup_y_pos = center_popup(screen.get_width(), screen.get_height(), popup_width, popup_height)
+        else:
+            # fallback to top-left
+            popup_x_pos, popup_y_pos = (0, 0)
+
+        # background, title, images and body lines
+        screen.blit(panel, (popup_x_pos, popup_y_pos))
+        layout_cursor_y = popup_y_pos + self._buttons_top
+
         # buttons
         # Clear previous buttons and add new ones centered horizontally stacked vertically
         button_manager.clear()
@@ -132,8 +178,10 @@ class Popup:
                 layout_cursor_y += button_height + self.element_spacing
 
         # Draw buttons immediately so popup owns its visuals and cursor state
-        button_font = pygame.font.SysFont('Arial', 18, bold=True)
-        button_manager.draw(screen, button_font)
-        button_manager.set_cursor()
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
+        button_font = get_font('Arial', 18, bold=True)
+        button_manager.draw(screen, button_font, mouse_pos)
+        button_manager.set_cursor(mouse_pos)
 
         return pygame.Rect(popup_x_pos, popup_y_pos, popup_width, popup_height)
@@ -1,17 +1,31 @@
 import pygame
 
+SHADOW_OFFSET = 6  # Popup shadow offset in pixels, right and down
+
+# Reused surfaces, keyed by everything that decides their pixels
+_overlays = {}
+_shadows = {}
+
+
 def draw_overlay(screen, color, alpha=128):
     """Draw a semi-transparent overlay over the entire screen."""
-    overlay = pygame.Surface(screen.get_size())
-    overlay.set_alpha(alpha)
-    overlay.fill(color)
+    key = (screen.get_size(), tuple(color), alpha)
+    overlay = _overlays.get(key)
+    if overlay is None:
+        overlay = pygame.Surface(screen.get_size())
+        overlay.set_alpha(alpha)
+        overlay.fill(color)
+        _overlays[key] = overlay
     screen.blit(overlay, (0, 0))
 
 def draw_popup_background(screen, color, popup_x, popup_y, popup_width, popup_height):
     """Draw a popup background with shadow effect."""
-    shadow_offset = 6
     shadow_color = (0, 0, 0, 60)
-    shadow_surface = pygame.Surface((popup_width, popup_height), pygame.SRCALPHA)
-    pygame.draw.rect(shadow_surface, shadow_color, shadow_surface.get_rect(), border_radius=20)
-    screen.blit(shadow_surface, (popup_x + shadow_offset, popup_y + shadow_offset))
+    key = (popup_width, popup_height)
+    shadow_surface = _shadows.get(key)
+    if shadow_surface is None:
+        shadow_surface = pygame.Surface((popup_width, popup_height), pygame.SRCALPHA)
+        pygame.draw.rect(shadow_surface, shadow_color, shadow_surface.get_rect(), border_radius=20)
+        _shadows[key] = shadow_surface
+    screen.blit(shadow_surface, (popup_x + SHADOW_OFFSET, popup_y + SHADOW_OFFSET))
     pygame.draw.rect(screen, color, (popup_x, popup_y, popup_width, popup_height), border_radius=20)
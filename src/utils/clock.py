@@ -0,0 +1,80 @@
+"""
+Fixed-timestep simulation clock.
+
+Converts wall-clock timestamps into a whole number of simulation ticks so
+game logic runs at a steady rate no matter how fast frames are rendered.
+"""
+
+from src.constants import TICK_RATE, MAX_CATCH_UP_TICKS
+
+
+class FixedStepClock:
+    """
+    Accumulator that hands out fixed-size simulation ticks.
+
+    Time is tracked in integer milliseconds scaled by the tick rate, so the
+    same sequence of timestamps always yields the same sequence of tick
+    counts with no floating point drift.
+    """
+
+    def __init__(self, tick_rate: int = TICK_RATE, max_ticks: int = MAX_CATCH_UP_TICKS) -> None:
+        """
+        Args:
+            tick_rate (int): Simulation ticks per second.
+            max_ticks (int): Most ticks returned by one advance() call. Time
+                beyond that is dropped so a long hitch can't snowball.
+        """
+        if tick_rate <= 0:
+            raise ValueError("tick_rate must be a positive integer")
+        if max_ticks <= 0:
+            raise ValueError("max_ticks must be a positive integer")
+
+        self._tick_rate = tick_rate
+        self._max_ticks = max_ticks
+        self._last_ms = None
+        self._accumulator = 0    # Elapsed ms multiplied by tick_rate
+        self._dropped_ticks = 0  # Ticks discarded by the catch-up limit
+
+    @property
+    def tick_rate(self) -> int:
+        return self._tick_rate
+
+    @property
+    def dropped_ticks(self) -> int:
+        return self._dropped_ticks
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of the next tick already elapsed (0.0 to 1.0), for interpolation."""
+        return self._accumulator / 1000
+
+    def reset(self, now_ms: int) -> None:
+        """Start measuring from now_ms and discard any pending time."""
+        self._last_ms = now_ms
+        self._accumulator = 0
+
+    def advance(self, now_ms: int) -> int:
+        """
+        Record the current timestamp and return how many ticks to simulate.
+
+        Args:
+            now_ms (int): Current time in milliseconds (e.g. pygame.time.get_ticks()).
+
+        Returns:
+            int: Number of ticks to run, between 0 and max_ticks.
+        """
+        if self._last_ms is None:
+            self.reset(now_ms)
+            return 0
+
+        # Clamp so a clock that steps backwards never rewinds the simulation
+        elapsed_ms = max(0, now_ms - self._last_ms)
+        self._last_ms = now_ms
+        self._accumulator += elapsed_ms * self._tick_rate
+
+        ticks = self._accumulator // 1000
+        self._accumulator -= ticks * 1000
+        if ticks > self._max_ticks:
+            self._dropped_ticks += ticks - self._max_ticks
+            ticks = self._max_ticks
+        return ticks
@@ -0,0 +1,110 @@
+"""
+Structured in-memory event log.
+
+Keeps the most recent game events in a fixed-size ring buffer, optionally
+mirrors them to a JSON Lines file, and formats them only when someone asks
+to read them. Events below the configured level are dropped after a single
+comparison, so a disabled log costs next to nothing on hot paths.
+"""
+
+import json
+import sys
+import time
+from collections import deque
+
+# Log levels (same numeric values as the standard logging module)
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR", OFF: "OFF"}
+
+
+def parse_level(name: str) -> int:
+    """Return the numeric level for a name such as 'debug' or 'OFF'."""
+    for level, level_name in LEVEL_NAMES.items():
+        if level_name == name.upper():
+            return level
+    raise ValueError(f"Unknown log level '{name}', expected one of {', '.join(LEVEL_NAMES.values())}")
+
+
+class EventLog:
+    """
+    Ring buffer of (timestamp, level, event, fields) records.
+
+    Attributes:
+        level (int): Minimum level recorded; anything lower is ignored.
+    """
+
+    def __init__(self, level=INFO, capacity=256, sink=None) -> None:
+        """
+        Args:
+            level (int): Minimum level to record. Use OFF to disable.
+            capacity (int): How many recent events the ring buffer keeps.
+            sink (file-like, optional): Text stream that receives each event
+                as one JSON object per line.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+
+        self.level = level
+        self._records = deque(maxlen=capacity)
+        self._sink = sink
+
+    def log(self, level: int, event: str, /, **fields) -> None:
+        """Record an event if level is enabled. Fields are stored as-is, not formatted."""
+        if level < self.level:
+            return
+        record = (time.time(), level, event, fields)
+        self._records.append(record)
+        if self._sink is not None:
+            self._sink.write(json.dumps(self._as_dict(record)) + "\n")
+
+    def debug(self, event: str, /, **fields) -> None:
+        if DEBUG >= self.level:
+            self.log(DEBUG, event, **fields)
+
+    def info(self, event: str, /, **fields) -> None:
+        if INFO >= self.level:
+            self.log(INFO, event, **fields)
+
+    def warning(self, event: str, /, **fields) -> None:
+        if WARNING >= self.level:
+            self.log(WARNING, event, **fields)
+
+    def error(self, event: str, /, **fields) -> None:
+        if ERROR >= self.level:
+            self.log(ERROR, event, **fields)
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Return True if events at level would be recorded."""
+        return level >= self.level
+
+    def recent(self, limit=None) -> list:
+        """Return the most recent events as dicts, oldest first."""
+        records = list(self._records)
+        if limit is not None:
+            records = records[-limit:]
+        return [self._as_dict(record) for record in records]
+
+    def clear(self) -> None:
+        """Drop all buffered events."""
+        self._records.clear()
+
+    def dump(self, stream=None, limit=None) -> None:
+        """
+        Write recent events to stream (stderr by default) as readable lines.
+
+        Intended for error handlers so a crash report shows what led up to it.
+        """
+        stream = stream if stream is not None else sys.stderr
+        for record in self.recent(limit):
+            fields = " ".join(f"{key}={value}" for key, value in record["fields"].items())
+            stream.write(f"{record['time']:.3f} {record['level']:<7} {record['event']} {fields}".rstrip() + "\n")
+
+    @staticmethod
+    def _as_dict(record) -> dict:
+        timestamp, level, event, fields = record
+        return {"time": timestamp, "level": LEVEL_NAMES.get(level, str(level)), "event": event, "fields": fields}
@@ -0,0 +1,127 @@
+"""
+Frame-time profiler for the debug overlay.
+
+Keeps the most recent perf_counter_ns durations per named section (a draw
+call, Game.update, the display flip, ...) and between consecutive frames in
+fixed-size ring buffers. Sections are timed by wrapping methods on specific
+objects, so nothing is measured, and nothing costs anything, until the
+profiler is switched on; restore() puts the original methods back.
+"""
+
+import time
+from collections import deque
+
+from src.utils.stats import percentile
+
+PROFILE_SAMPLES = 600  # Samples kept per section (10 seconds of frames at 60 FPS)
+FRAME = "frame"        # Section name for whole-frame times, see end_frame()
+
+
+class FrameProfiler:
+    """Ring buffers of recent durations, in nanoseconds, per section."""
+
+    def __init__(self, capacity=PROFILE_SAMPLES):
+        self.capacity = capacity
+        self._samples = {}       # section name -> deque of durations in ns
+        self._wrapped = []       # (object, attribute) pairs replaced by instrument()
+        self._last_frame = None  # perf_counter_ns() at the previous end_frame()
+
+    def record(self, name, duration_ns):
+        """Add one duration sample to a section."""
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = self._samples[name] = deque(maxlen=self.capacity)
+        samples.append(duration_ns)
+
+    def end_frame(self):
+        """Mark the end of a frame; the time since the previous one is a FRAME sample."""
+        now = time.perf_counter_ns()
+        if self._last_frame is not None:
+            self.record(FRAME, now - self._last_frame)
+        self._last_frame = now
+
+    def instrument(self, obj, method_names, prefix=""):
+        """
+        Time every call of the named methods on obj (this instance only).
+
+        Args:
+            obj: Object whose methods are wrapped.
+            method_names (iterable): Method names to time.
+            prefix (str): Prepended to the method name to form the section name.
+        """
+        for name in method_names:
+            method = getattr(obj, name)
+            setattr(obj, name, self._timed(prefix + name, method))
+            self._wrapped.append((obj, name))
+
+    def _timed(self, section, method):
+        """Return method wrapped to record its duration under section."""
+        clock = time.perf_counter_ns
+        record = self.record
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                record(section, clock() - start)
+        return timed
+
+    def restore(self):
+        """Remove all wrappers added by instrument()."""
+        for obj, name in reversed(self._wrapped):
+            delattr(obj, name)  # The class attribute shows through again
+        self._wrapped = []
+
+    def sections(self):
+        """Names of all sections with samples, FRAME first."""
+        return sorted(self._samples, key=lambda name: (name != FRAME, name))
+
+    def stats(self, name):
+        """
+        Summarise one section.
+
+        Returns:
+            dict: count, mean, p50, p95 and p99 in milliseconds, or None if
+            the section has no samples.
+        """
+        samples = self._samples.get(name)
+        if not samples:
+            return None
+        values = sorted(samples)
+        return {
+            "count": len(values),
+            "mean": sum(values) / len(values) / 1e6,
+            "p50": percentile(values, 50) / 1e6,
+            "p95": percentile(values, 95) / 1e6,
+            "p99": percentile(values, 99) / 1e6,
+        }
+
+    def fps(self):
+        """Frames per second over the recorded frame times, or None."""
+        frames = self._samples.get(FRAME)
+        if not frames:
+            return None
+        return 1e9 * len(frames) / sum(frames)
+
+    def report_rows(self):
+        """
+        Table of the recorded sections for display.
+
+        Returns:
+            list: Header row then one row per section, each a tuple of
+            strings (name, mean, p50, p95, p99) with times in milliseconds.
+        """
+        rows = [("ms", "mean", "p50", "p95", "p99")]
+        for name in self.sections():
+            stats = self.stats(name)
+            rows.append((name,) + tuple(f"{stats[key]:.2f}" for key in ("mean", "p50", "p95", "p99")))
+        return rows
+
+    def report_lines(self):
+        """Human-readable summary: FPS, then one aligned line per section."""
+        fps = self.fps()
+        lines = [f"FPS {fps:.1f}" if fps is not None else "FPS --"]
+        for name, *times in self.report_rows():
+            lines.append(f"{name:<24}" + "".join(f"{value:>8}" for value in times))
+        return lines
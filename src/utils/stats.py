@@ -0,0 +1,22 @@
+"""
+Small statistics helpers shared by the self-play farm and the profiler.
+"""
+
+import math
+
+
+def percentile(sorted_values, percent):
+    """
+    Nearest-rank percentile of an already sorted sequence.
+
+    Args:
+        sorted_values (list): Values in ascending order.
+        percent (float): Percentile between 0 and 100.
+
+    Returns:
+        The value at that percentile, or None for an empty sequence.
+    """
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
@@ -0,0 +1,116 @@
+"""
+Lazy image loading with a disk cache of scaled variants.
+
+Image paths are resolved relative to this package, so the game runs from
+any working directory. Nothing is read from disk until an image is first
+asked for. Scaled variants are saved in a cache directory under a name
+built from the source's modification time and the target height. Editing
+the source image therefore invalidates its variants, and a warm start
+loads the scaled image instead of scaling it again.
+"""
+
+import glob
+import os
+import tempfile
+
+import pygame
+
+ASSET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "img")
+ASSET_CACHE_ENV = "TETRIS_ASSET_CACHE"  # Overrides the cache directory
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tetris", "assets")
+
+
+class AssetManager:
+    """Loads images on first use and keeps them, and their scaled variants."""
+
+    def __init__(self, asset_dir=ASSET_DIR, cache_dir=None):
+        """
+        Args:
+            asset_dir (str): Directory image names are resolved against.
+            cache_dir (str, optional): Where scaled variants are stored; defaults
+                to $TETRIS_ASSET_CACHE, else DEFAULT_CACHE_DIR.
+        """
+        self.asset_dir = asset_dir
+        self.cache_dir = cache_dir or os.environ.get(ASSET_CACHE_ENV) or DEFAULT_CACHE_DIR
+        self._images = {}  # name or (name, height) -> loaded surface
+
+    def path(self, name):
+        """Absolute path of an asset."""
+        return os.path.join(self.asset_dir, name)
+
+    def image(self, name):
+        """Return an image at its original size, loading it on first use."""
+        image = self._images.get(name)
+        if image is None:
+            image = self._images[name] = self._convert(pygame.image.load(self.path(name)))
+        return image
+
+    def scaled_to_height(self, name, height):
+        """
+        Return an image scaled proportionally to a target height.
+
+        Args:
+            name (str): Asset file name.
+            height (int): Desired height in pixels.
+
+        Returns:
+            pygame.Surface: The scaled image, from memory, the disk cache, or
+            freshly scaled (and then written to the disk cache).
+        """
+        key = (name, height)
+        image = self._images.get(key)
+        if image is None:
+            image = self._images[key] = self._load_scaled(name, height)
+        return image
+
+    def clear(self):
+        """Forget loaded images; the disk cache is kept."""
+        self._images.clear()
+
+    def cache_path(self, name, height):
+        """Disk cache file for the variant of name scaled to height."""
+        stem = os.path.splitext(name)[0]
+        mtime = os.stat(self.path(name)).st_mtime_ns
+        return os.path.join(self.cache_dir, f"{stem}-h{height}-{mtime}.png")
+
+    def _load_scaled(self, name, height):
+        """Load a variant from the disk cache, or scale the source and store it."""
+        cached = self.cache_path(name, height)
+        if os.path.exists(cached):
+            try:
+                return self._convert(pygame.image.load(cached))
+            except pygame.error:
+                pass  # Unreadable cache entry; scale again and overwrite it
+        image = self.image(name)
+        width, original_height = image.get_size()
+        image = pygame.transform.smoothscale(image, (int(width * height / original_height), height))
+        self._store(cached, image)
+        return image
+
+    def _store(self, cached, image):
+        """Write a variant to the disk cache, removing stale ones for the same height."""
+        stale = glob.glob(glob.escape(cached.rsplit("-", 1)[0]) + "-*.png")
+        temp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # mkstemp creates the file with mode 0600; that's intended, the
+            # cache is per user and nobody else needs to read it
+            handle, temp_path = tempfile.mkstemp(suffix=".png", dir=self.cache_dir)
+            os.close(handle)
+            pygame.image.save(image, temp_path)
+            os.replace(temp_path, cached)  # Never leave a half-written entry
+        except (OSError, pygame.error):
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return  # The cache is only an optimisation
+        for path in stale:
+            if path != cached:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _convert(image):
+        """Convert to the display's pixel format once there is a display."""
+        return image.convert_alpha() if pygame.display.get_surface() else image
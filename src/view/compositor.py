@@ -0,0 +1,45 @@
+import pygame
+
+
+class LayeredCompositor:
+    """
+    Builds each frame from a cached static layer plus per-frame drawing.
+
+    The static layer holds everything that only changes when the board
+    does: the background, grid and locked cells. It is re-rendered only
+    when the board's mutation version (or another input in the layer key)
+    changes, and otherwise costs a single blit per frame. The dynamic
+    layer is whatever is drawn on the screen after compose(): the active
+    piece, ghost and HUD.
+    """
+
+    def __init__(self):
+        self._static = None        # Cached static layer surface
+        self._static_key = None    # (board, board version, extra key) it was rendered for
+        self.static_renders = 0    # How many times the static layer was rebuilt
+
+    def invalidate(self):
+        """Force the static layer to be re-rendered on the next compose()."""
+        self._static_key = None
+
+    def compose(self, screen, board, render_static, extra_key=()):
+        """
+        Start a frame: refresh the static layer if needed and blit it.
+
+        Args:
+            screen (pygame.Surface): Surface the frame is composed onto.
+            board (Board): Board whose version decides when to re-render.
+            render_static (callable): render_static(surface, board) draws the
+                static layer onto surface.
+            extra_key (tuple): Other inputs of the static layer (theme, screen
+                size, ...); a change re-renders it as well.
+        """
+        size = screen.get_size()
+        key = (board, board.version, size, extra_key)
+        if key != self._static_key:
+            if self._static is None or self._static.get_size() != size:
+                self._static = pygame.Surface(size, 0, screen)
+            render_static(self._static, board)
+            self._static_key = key
+            self.static_renders += 1
+        screen.blit(self._static, (0, 0))
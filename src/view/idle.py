@@ -0,0 +1,74 @@
+import pygame
+from src.constants import IDLE_WAIT_MS, START_SCREEN, GAME_OVER
+
+
+class IdleScheduler:
+    """
+    Low-power frame scheduling for static screens.
+
+    On the start screen, game over screen and pause popup nothing moves on
+    its own, so the main loop renders once and then sleeps in
+    pygame.event.wait until input arrives. Any event (including mouse motion,
+    so button hover and cursor stay live) or an explicit request_redraw()
+    wakes it for another frame.
+    """
+
+    def __init__(self, wait_ms=IDLE_WAIT_MS):
+        """
+        Args:
+            wait_ms (int): Longest time to block before waking to re-check state.
+        """
+        self._wait_ms = wait_ms
+        self._dirty = True          # Something changed since the last render
+        self._rendered_key = None   # Screen state captured at the last render
+
+    @staticmethod
+    def is_idle(game):
+        """Return True when the game is on a screen that never changes by itself."""
+        return game._state in (START_SCREEN, GAME_OVER) or game.paused
+
+    @staticmethod
+    def _screen_key(game):
+        """Everything an idle screen displays that could change between frames."""
+        return (game._state, game.paused, game.score, game.high_score)
+
+    def request_redraw(self):
+        """Force the next frame to render, e.g. while an animation is playing."""
+        self._dirty = True
+
+    def get_events(self, game):
+        """
+        Return pending events, blocking when the current idle screen is already drawn.
+
+        Args:
+            game (Game): The game whose state decides whether we may sleep.
+
+        Returns:
+            list: pygame events to process this frame (possibly empty).
+        """
+        if self.is_idle(game) and not self._dirty and self._rendered_key == self._screen_key(game):
+            first = pygame.event.wait(self._wait_ms)
+            events = [] if first.type == pygame.NOEVENT else [first]
+            events.extend(pygame.event.get())
+            if events:
+                self._dirty = True
+            return events
+        return self.poll_events()
+
+    def poll_events(self):
+        """Return pending events without blocking (for loops that schedule their own sleeps)."""
+        events = pygame.event.get()
+        if events:
+            self._dirty = True
+        return events
+
+    def should_render(self, game):
+        """Return True if this frame needs drawing."""
+        if not self.is_idle(game):
+            return True
+        return self._dirty or self._rendered_key != self._screen_key(game)
+
+    def rendered(self, game):
+        """Record that the current state has been drawn and flipped."""
+        self._dirty = False
+        self._rendered_key = self._screen_key(game)
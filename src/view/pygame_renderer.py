@@ -1,75 +1,144 @@
+from collections import OrderedDict
+
 import pygame
-from src.constants import COLORS, CELL_SIZE, RED, WHITE, GRAY, BLACK, NEXT_PAGE_PREVIEW_RECT, SCREEN_SIZE
+from src.constants import CELL_SIZE, RED, WHITE, GRAY, BLACK, NEXT_PAGE_PREVIEW_RECT, SCREEN_SIZE
 from src.figures import SHAPES
 from src.ui.button_manager import ButtonManager
 from src.ui.pop_up import Popup
+from src.ui.pop_up_render_utils import draw_overlay
+from src.ui.fonts import get_font, render_text
+from src.view.compositor import LayeredCompositor
+from src.view.tile_atlas import TileAtlas, LOCKED, ACTIVE, PREVIEW, GHOST
+from src.view.viewport import Viewport
+from src.view.assets import AssetManager
+
+PREVIEW_CACHE_SIZE = 16  # Next-piece preview panels kept, see _preview_panel()
+PROFILE_REFRESH_MS = 500  # How often the profiler overlay text is re-rendered
+CONTROLS_IMAGE = "controls.png"
+CONTROLS_IMAGE_HEIGHT = 240  # Start screen controls image, scaled to this height
 
 class PygameRenderer:
+    # Calls timed by the profiler overlay, see toggle_profiler() in app.py
+    PROFILED_CALLS = (
+        "draw_board", "draw_piece", "draw_ghost_piece", "draw_next_piece_preview",
+        "draw_score", "draw_level_info", "draw_start_screen", "draw_game_over_screen",
+        "draw_pause_popup", "draw_pause_button", "present",
+    )
+
     def __init__(self, screen, board_origin=(70, 60), next_piece_preview_origin=(110, 60)):
         """
         Initialize the PygameRenderer.
 
         Args:
-            screen (pygame.Surface): The main display surface.
+            screen (pygame.Surface): The main display surface. Drawing happens at
+                SCREEN_SIZE and is scaled to the window if it has another size.
             board_origin (tuple): Top-left pixel coordinates for the board grid.
             next_piece_preview_origin (tuple): Top-left pixel coordinates for the next piece preview box.
         """
-        self.screen = screen
+        self.viewport = Viewport(screen)
+        self.screen = self.viewport.surface  # Logical SCREEN_SIZE surface everything is drawn on
         self.board_x, self.board_y = board_origin
         self.next_piece_preview_x, self.next_piece_preview_y = next_piece_preview_origin
-        self.controls_img = pygame.image.load("src/view/img/controls.png").convert_alpha()
-        self.controls_img = self._scale_by_height(self.controls_img, 240)
-        self.button_manager = ButtonManager()
-        self.hud_button_manager = ButtonManager()
-        self._hud_button_font = pygame.font.SysFont('Arial', 18, bold=True)
+        self.assets = AssetManager()  # Images are loaded on first use, see controls_img
+        self._hud_button_font = get_font('Arial', 18, bold=True)
+        self.button_manager = ButtonManager(self._hud_button_font)
+        self.hud_button_manager = ButtonManager(self._hud_button_font)
+        # Board theme; changing either color rebuilds the cached grid background
+        self.background_color = WHITE
+        self.grid_color = GRAY
+        self._grid_surface = None   # Pre-rendered background fill and grid outlines
+        self._grid_key = None       # Inputs the cached grid was built from
+        self.compositor = LayeredCompositor()  # Static layer: grid + locked cells
+        self.atlas = TileAtlas()  # Pre-rendered cell tiles per state and color
+        # Dirty-rect tracking: (content key, rect) of everything drawn over the
+        # static layer this frame and last frame; see present()
+        self._frame_items = []
+        self._last_items = set()
+        self._overlay = False        # A full-screen overlay was drawn this frame
+        self._needs_flip = True      # Next present() must push the whole window
+        self._static_renders = 0     # compositor.static_renders at the last present()
+        self._board_rect = None      # Screen area of the board, for static layer updates
+        self._preview_cache = OrderedDict()  # (type, rotation, color, atlas) -> preview panel
+        self._popups = {}            # name -> (content, Popup) so unchanged popups keep their layout
+        self.profiler = None         # FrameProfiler while the debug overlay is on
+        self._profiler_surface = None
+        self._profiler_rendered_at = None  # pygame ticks when the overlay text was last rendered
+
+    @property
+    def controls_img(self):
+        """The controls help image shown on the start screen, loaded on first use."""
+        return self.assets.scaled_to_height(CONTROLS_IMAGE, CONTROLS_IMAGE_HEIGHT)
 
-    def _scale_by_height(self, image, target_height):
+    def draw_board(self, board):
         """
-        Scale an image proportionally to a target height.
+        Render the game board grid and filled cells.
 
         Args:
-            image (pygame.Surface): The image to scale.
-            target_height (int): Desired height in pixels.
-
-        Returns:
-            pygame.Surface: Scaled image surface.
+            board (Board): The game board object containing cell states and colors.
         """
-        original_width, original_height = image.get_size()
-        scale_factor = target_height / original_height
-        scaled_width = int(original_width * scale_factor)
-        scaled_image = pygame.transform.smoothscale(image, (scaled_width, target_height))
-        return scaled_image
+        self._board_rect = (self.board_x, self.board_y, CELL_SIZE * board.width, CELL_SIZE * board.height)
+        self.compositor.compose(
+            self.screen, board, self._render_static_layer,
+            (self.background_color, self.grid_color, self.board_x, self.board_y)
+        )
 
-    def draw_board(self, board):
+    def _render_static_layer(self, surface, board):
         """
-        Render the game board grid and filled cells.
+        Draw the grid and locked cells onto the compositor's static layer.
 
         Args:
-            board (Board): The game board object containing cell states and colors.
+            surface (pygame.Surface): Static layer surface.
+            board (Board): Board whose locked cells are drawn.
         """
-        self.screen.fill(WHITE)
-
-        for row in range(board.height):
-            for col in range(board.width):
-                rect = [
-                    self.board_x + CELL_SIZE * col,
-                    self.board_y + CELL_SIZE * row,
-                    CELL_SIZE,
-                    CELL_SIZE
-                ]
-                # draw grid outline
-                pygame.draw.rect(self.screen, GRAY, rect, 1)
-
-                # draw filled cells
-                if board.get_cell(row, col):
-                    row_obj = board.get_row_object(row)
-                    color = row_obj.get_color(col)
+        surface.blit(self._grid_background(board), (0, 0))
+
+        # Only occupied cells are drawn on top of the cached grid, in one pass over the rows
+        sheet = self.atlas.sheet
+        area = self.atlas.area
+        tiles = []
+        for row, bits, colors in board.iter_rows():
+            y = self.board_y + CELL_SIZE * row
+            col = 0
+            while bits:
+                if bits & 1:
+                    color = colors.get(col)
                     if color is not None:
-                        pygame.draw.rect(
-                            self.screen,
-                            COLORS[color],
-                            [rect[0] + 1, rect[1] + 1, CELL_SIZE - 2, CELL_SIZE - 2]
-                        )
+                        tiles.append((sheet, (self.board_x + CELL_SIZE * col, y), area(LOCKED, color)))
+                bits >>= 1
+                col += 1
+        surface.blits(tiles, False)
+
+    def _grid_background(self, board):
+        """
+        Return the background fill and grid outlines as one surface.
+
+        The grid never changes during play, so it is drawn once and only
+        rebuilt when the screen size, board dimensions or theme colors change.
+
+        Args:
+            board (Board): Supplies the grid dimensions.
+
+        Returns:
+            pygame.Surface: Screen-sized background to blit at (0, 0).
+        """
+        key = (self.screen.get_size(), board.width, board.height, self.background_color, self.grid_color)
+        if key != self._grid_key:
+            surface = pygame.Surface(self.screen.get_size(), 0, self.screen)
+            surface.fill(self.background_color)
+            for row in range(board.height):
+                for col in range(board.width):
+                    rect = [
+                        self.board_x + CELL_SIZE * col,
+                        self.board_y + CELL_SIZE * row,
+                        CELL_SIZE,
+                        CELL_SIZE
+                    ]
+                    # draw grid outline
+                    pygame.draw.rect(surface, self.grid_color, rect, 1)
+            self._grid_surface = surface
+            self._grid_key = key
+            self._needs_flip = True  # The whole background changed
+        return self._grid_surface
 
     def draw_next_piece_preview(self, next_piece):
         """
@@ -78,15 +147,9 @@ class PygameRenderer:
         Args:
             next_piece (Piece): The upcoming piece to render in the preview box.
         """
-        pygame.draw.rect(self.screen, BLACK, NEXT_PAGE_PREVIEW_RECT, 1)
-        font = pygame.font.SysFont('Arial', 20)
-
-        text_surface = font.render('Next Piece', True, BLACK)
-
-        self.screen.blit(text_surface, (315, 200))
-
-        # Drawing piece into box holding the next piece
-        self.draw_next_piece(next_piece)
+        self.screen.blit(self._preview_panel(next_piece), NEXT_PAGE_PREVIEW_RECT[:2])
+        self._mark_dirty(("next", next_piece.type, next_piece.rotation, next_piece.color),
+                         NEXT_PAGE_PREVIEW_RECT)
 
     def draw_piece(self, piece):
         """
@@ -95,22 +158,19 @@ class PygameRenderer:
         Args:
             piece (Piece): The active piece with position, rotation, and color.
         """
-        color = COLORS[piece.color]
         shape = SHAPES[piece.type][piece.rotation]
-    
-        for grid_position in shape:
-            # Convert 4x4 grid position to board coordinates
-            col = piece.x + (grid_position % 4)
-            row = piece.y + (grid_position // 4)
-        
-            rect = [
-                self.board_x + CELL_SIZE * col,
-                self.board_y + CELL_SIZE * row,
-                CELL_SIZE - 2,
-                CELL_SIZE - 2
-            ]
+        sheet = self.atlas.sheet
+        area = self.atlas.area(ACTIVE, piece.color)
+
+        # Convert 4x4 grid positions to board coordinates
+        self.screen.blits([
+            (sheet, (self.board_x + CELL_SIZE * (piece.x + grid_position % 4),
+                     self.board_y + CELL_SIZE * (piece.y + grid_position // 4)), area)
+            for grid_position in shape
+        ], False)
 
-            pygame.draw.rect(self.screen, color, rect)
+        self._mark_dirty(("piece", piece.type, piece.rotation, piece.color, piece.x, piece.y),
+                         self._shape_rect(shape, piece.x, piece.y))
 
     def draw_score(self, score, high_score, font_size=24, color=BLACK):
         """
@@ -122,7 +182,7 @@ class PygameRenderer:
             font_size (int): Font size for text.
             color (tuple): RGB color for text.
         """
-        font = pygame.font.SysFont('Arial', font_size, bold=True)
+        font = get_font('Arial', font_size, bold=True)
         
         # Position scores to the right of the board
         # Calculate position based on board_x and CELL_SIZE
@@ -130,22 +190,28 @@ class PygameRenderer:
         score_y = self.board_y  # Align with top of board
         
         # Draw current score
-        score_text = font.render(f"Score: {score}", True, color)
-        self.screen.blit(score_text, (score_x, score_y))
+        score_text = render_text(f"Score: {score}", font, color)
+        score_rect = self.screen.blit(score_text, (score_x, score_y))
         
         # Draw high score below current score with spacing
-        high_score_text = font.render(f"High Score: {high_score}", True, color)
+        high_score_text = render_text(f"High Score: {high_score}", font, color)
         high_score_pos = (score_x, score_y + font_size + 5)
-        self.screen.blit(high_score_text, high_score_pos)
+        high_score_rect = self.screen.blit(high_score_text, high_score_pos)
+        self._mark_dirty(("score", score, high_score, font_size, color), score_rect.union(high_score_rect))
 
-    def draw_start_screen(self):
-        """Render the start screen popup with controls image and start/exit buttons."""
+    def draw_start_screen(self, mouse_pos=None):
+        """Render the start screen popup with controls image and start/exit buttons.
+
+        Args:
+            mouse_pos (tuple, optional): Mouse position this frame, for button hover.
+        """
         # Build body lines describing controls
         # To allow flexible height, we construct a Popup with title, images and body lines.
         body_lines = ["Press 'p' or 'ESC' at any time to pause."]
 
         # Compose images with small captions handled in body_lines for simplicity
-        popup = Popup(
+        popup = self._popup(
+            "start",
             title="Tetris",
             body_lines=body_lines,
             images=[self.controls_img],
@@ -154,9 +220,10 @@ class PygameRenderer:
             padding=24,
         )
 
-        popup.render(self.screen, self.button_manager)
+        popup.render(self.screen, self.button_manager, mouse_pos=mouse_pos)
+        self._overlay = True
 
-    def draw_game_over_screen(self, score=None, high_score=None):
+    def draw_game_over_screen(self, score=None, high_score=None, mouse_pos=None):
         """
         Render the game over popup with final score, high score,and two buttons:
         Play Again (RESTART) and Quit (QUIT).
@@ -164,11 +231,13 @@ class PygameRenderer:
         Args:
             score (int, optional): Final score. Defaults to 0 if None.
             high_score (int, optional): Session high score. Defaults to 0 if None.
+            mouse_pos (tuple, optional): Mouse position this frame, for button hover.
         """
         # Compose body lines including the score info
         body_lines = ["You can try again or quit.", f"Score: {score if score is not None else 0}", f"High Score: {high_score if high_score is not None else 0}"]
 
-        popup = Popup(
+        popup = self._popup(
+            "game_over",
             title="GAME OVER",
             body_lines=body_lines,
             button_specs=[("Play Again", "RESTART", (0, 200, 0)), ("Quit", "QUIT", (200, 0, 0))],
@@ -176,15 +245,75 @@ class PygameRenderer:
             padding=20,
         )
 
-        popup.render(self.screen, self.button_manager)
+        popup.render(self.screen, self.button_manager, mouse_pos=mouse_pos)
+        self._overlay = True
+
+    def _popup(self, name, **spec):
+        """
+        Return the Popup for one of the renderer's screens, reusing the last one.
+
+        A new Popup (and so a new layout) is only made when the content, such
+        as the score lines, differs from what was shown last time.
+
+        Args:
+            name (str): Which screen the popup belongs to.
+            **spec: Popup constructor arguments.
+
+        Returns:
+            Popup: The popup to render.
+        """
+        content = tuple((key, tuple(value) if isinstance(value, list) else value)
+                        for key, value in sorted(spec.items()))
+        cached = self._popups.get(name)
+        if cached is None or cached[0] != content:
+            cached = (content, Popup(**spec))
+            self._popups[name] = cached
+        return cached[1]
+
+    def _preview_panel(self, piece):
+        """
+        Return the preview box, label and piece pre-rendered as one surface.
+
+        The next piece only changes on spawn, so each (type, rotation, color)
+        is rendered once and kept in a small least-recently-used cache.
+
+        Args:
+            piece (Piece): The upcoming piece.
+
+        Returns:
+            pygame.Surface: NEXT_PAGE_PREVIEW_RECT-sized surface with a
+            transparent background, to blit at the rect's top-left corner.
+        """
+        key = (piece.type, piece.rotation, piece.color, self.atlas)
+        panel = self._preview_cache.get(key)
+        if panel is not None:
+            self._preview_cache.move_to_end(key)
+            return panel
+
+        x, y, width, height = NEXT_PAGE_PREVIEW_RECT
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(panel, BLACK, (0, 0, width, height), 1)
+        font = get_font('Arial', 20)
+        text_surface = render_text('Next Piece', font, BLACK)
+        panel.blit(text_surface, (315 - x, 200 - y))
+
+        # Drawing piece into box holding the next piece
+        self.draw_next_piece(piece, panel, (x, y))
 
-    def draw_next_piece(self, piece):
+        self._preview_cache[key] = panel
+        if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+            self._preview_cache.popitem(last=False)
+        return panel
+
+    def draw_next_piece(self, piece, surface=None, origin=(0, 0)):
         """ Render the next piece inside the preview box.
 
         Args:
             piece (Piece): The upcoming piece with type, rotation, and color.
+            surface (pygame.Surface, optional): Target surface. Defaults to the screen.
+            origin (tuple): Screen position of surface's top-left corner.
         """
-        color = COLORS[piece.color]
+        surface = surface if surface is not None else self.screen
         shape = SHAPES[piece.type][piece.rotation]
 
         cols = [grid_position % 4 for grid_position in shape]
@@ -202,42 +331,43 @@ class PygameRenderer:
         offset_x = (4 - piece_width) / 2 - min_col
         offset_y = (4 - piece_height) / 2 - min_row
 
+        sheet = self.atlas.sheet
+        area = self.atlas.area(PREVIEW, piece.color)
+        tiles = []
         for grid_position in shape:
             col = (grid_position % 4) + offset_x
             row = (grid_position // 4) + offset_y
-            
-            rect = [
-                preview_center_x - (2 * CELL_SIZE) + (col * CELL_SIZE),
-                preview_center_y - (2 * CELL_SIZE) + (row * CELL_SIZE),
-                CELL_SIZE - 1,
-                CELL_SIZE - 1
-            ]
-
-            pygame.draw.rect(self.screen, color, rect)
+            tiles.append((sheet, (int(preview_center_x - (2 * CELL_SIZE) + (col * CELL_SIZE)) - origin[0],
+                                  int(preview_center_y - (2 * CELL_SIZE) + (row * CELL_SIZE)) - origin[1]), area))
+        surface.blits(tiles, False)
 
     def draw_pause_screen(self):
         """Render the pause overlay with 'PAUSED' text and resume instructions."""
-        overlay = pygame.Surface(SCREEN_SIZE)
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        draw_overlay(self.screen, (0, 0, 0), 180)
         
-        font_large = pygame.font.SysFont('Arial', 48, bold=True)
-        font_small = pygame.font.SysFont('Arial', 24)
+        font_large = get_font('Arial', 48, bold=True)
+        font_small = get_font('Arial', 24)
         
         center_x = SCREEN_SIZE[0] // 2
         center_y = SCREEN_SIZE[1] // 2
         
-        paused_text = font_large.render('PAUSED', True, WHITE)
+        paused_text = render_text('PAUSED', font_large, WHITE)
         paused_rect = paused_text.get_rect(center=(center_x, center_y - 40))
         self.screen.blit(paused_text, paused_rect)
         
-        resume_text = font_small.render('Press P, ESC, or Click to Resume', True, WHITE)
+        resume_text = render_text('Press P, ESC, or Click to Resume', font_small, WHITE)
         resume_rect = resume_text.get_rect(center=(center_x, center_y + 20))
         self.screen.blit(resume_text, resume_rect)
+        self._overlay = True
+
+    def draw_pause_popup(self, score, high_score, mouse_pos=None):
+        """Render a modal pause popup with resume, restart, and exit options.
 
-    def draw_pause_popup(self, score, high_score):
-        """Render a modal pause popup with resume, restart, and exit options."""
+        Args:
+            score (int): Current score.
+            high_score (int): Session high score.
+            mouse_pos (tuple, optional): Mouse position this frame, for button hover.
+        """
         self.hud_button_manager.clear()
 
         body_lines = [
@@ -247,7 +377,8 @@ class PygameRenderer:
             "Resume to keep playing or restart to try again.",
         ]
 
-        popup = Popup(
+        popup = self._popup(
+            "pause",
             title="Paused",
             body_lines=body_lines,
             button_specs=[
@@ -259,10 +390,18 @@ class PygameRenderer:
             padding=24,
         )
 
-        popup.render(self.screen, self.button_manager)
+        popup.render(self.screen, self.button_manager, mouse_pos=mouse_pos)
+        self._overlay = True
+
+    def draw_pause_button(self, mouse_pos=None):
+        """Draw the in-game HUD pause button.
 
-    def draw_pause_button(self):
-        """Draw the in-game HUD pause button."""
+        Args:
+            mouse_pos (tuple, optional): Mouse position this frame, for button
+                hover; read from pygame if not given.
+        """
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
         self.hud_button_manager.clear()
 
         button_width, button_height = 120, 40
@@ -282,8 +421,11 @@ class PygameRenderer:
             text_color=(255, 255, 255),
         )
 
-        self.hud_button_manager.draw(self.screen, self._hud_button_font)
-        self.hud_button_manager.set_cursor()
+        self.hud_button_manager.draw(self.screen, mouse_pos=mouse_pos)
+        self.hud_button_manager.set_cursor(mouse_pos)
+
+        for button in self.hud_button_manager.buttons:
+            self._mark_dirty(("button", button.label, button.clicked, button.is_hovered(mouse_pos)), button.rect)
 
     def clear_hud_buttons(self):
         """Clear HUD buttons to avoid stale interactions when overlays are active."""
@@ -301,23 +443,25 @@ class PygameRenderer:
         Args:
             level (int): Current level
             lines_cleared (int): Total lines cleared
-            gravity_delay (int): Current gravity delay in frames
+            gravity_delay (int): Current gravity delay in simulation ticks
         """
-        font = pygame.font.Font(None, 24)
+        font = get_font(None, 24)
         
         # Level display (top-left)
-        level_text = font.render(f"Level: {level}", True, BLACK)
-        self.screen.blit(level_text, (10, 10))
+        level_text = render_text(f"Level: {level}", font, BLACK)
+        level_rect = self.screen.blit(level_text, (10, 10))
 
         # Lines cleared display (under level)
-        lines_text = font.render(f"Lines: {lines_cleared}", True, BLACK)
-        self.screen.blit(lines_text, (10, 35))
+        lines_text = render_text(f"Lines: {lines_cleared}", font, BLACK)
+        lines_rect = self.screen.blit(lines_text, (10, 35))
+        self._mark_dirty(("level", level, lines_cleared), level_rect.union(lines_rect))
 
         # Gravity delay display (top-right)
-        gravity_text = font.render(f"Gravity: {gravity_delay} frames", True, BLACK)
+        gravity_text = render_text(f"Gravity: {gravity_delay} ticks", font, BLACK)
         gravity_rect = gravity_text.get_rect()
         gravity_rect.topright = (self.screen.get_width() - 10, 70)
         self.screen.blit(gravity_text, gravity_rect)
+        self._mark_dirty(("gravity", gravity_delay), gravity_rect)
     def draw_ghost_piece(self, board, piece):
         """
         Render a semi-transparent 'ghost' outline of the active piece
@@ -336,38 +480,147 @@ class PygameRenderer:
         """
         shape = SHAPES[piece.type][piece.rotation]
         land_y = board.get_landing_y(piece)
+        sheet = self.atlas.sheet
+        area = self.atlas.area(GHOST, piece.color)
 
-        for grid_position in shape:
-            col = piece.x + (grid_position % 4)
-            row = land_y + (grid_position // 4)
-
-            rect = [
-                self.board_x + CELL_SIZE * col,
-                self.board_y + CELL_SIZE * row,
-                CELL_SIZE - 2,
-                CELL_SIZE - 2
-            ]
-            # Draw ghost piece with distinct visual style:
-            # Semi-transparent fill with the piece's color (but very faded)
-            ghost_color = COLORS[piece.color]
-            # Create a very transparent version of the piece color
-            ghost_surface = pygame.Surface((CELL_SIZE - 2, CELL_SIZE - 2))
-            ghost_surface.set_alpha(50)  # Semi-transparent
-            ghost_surface.fill(ghost_color)
-            self.screen.blit(ghost_surface, (rect[0], rect[1]))
-            # Then draw outline
-            # Draw dashed outline to make it more distinct
-            # Draw top and bottom edges
-            pygame.draw.line(self.screen, ghost_color, 
-                           (rect[0], rect[1]), 
-                           (rect[0] + rect[2], rect[1]), 2)
-            pygame.draw.line(self.screen, ghost_color, 
-                           (rect[0], rect[1] + rect[3]), 
-                           (rect[0] + rect[2], rect[1] + rect[3]), 2)
-            # Draw left and right edges
-            pygame.draw.line(self.screen, ghost_color, 
-                           (rect[0], rect[1]), 
-                           (rect[0], rect[1] + rect[3]), 2)
-            pygame.draw.line(self.screen, ghost_color, 
-                           (rect[0] + rect[2], rect[1]), 
-                           (rect[0] + rect[2], rect[1] + rect[3]), 2)
\ No newline at end of file
+        self.screen.blits([
+            (sheet, (self.board_x + CELL_SIZE * (piece.x + grid_position % 4),
+                     self.board_y + CELL_SIZE * (land_y + grid_position // 4)), area)
+            for grid_position in shape
+        ], False)
+
+        # Outlines are 2px wide and centred on the cell edges, so pad the bounds
+        self._mark_dirty(("ghost", piece.type, piece.rotation, piece.color, piece.x, land_y),
+                         self._shape_rect(shape, piece.x, land_y).inflate(4, 4))
+
+    def draw_profiler_overlay(self):
+        """
+        Draw the frame-time profiler panel in the bottom-right corner.
+
+        Shows FPS and the mean and percentile times of every profiled
+        section. The text is re-rendered every PROFILE_REFRESH_MS so the
+        overlay itself stays cheap and readable.
+        """
+        if self.profiler is None:
+            return
+        now = pygame.time.get_ticks()
+        if self._profiler_surface is None or now - self._profiler_rendered_at >= PROFILE_REFRESH_MS:
+            font = get_font(None, 18)
+            fps = self.profiler.fps()
+            title = font.render(f"FPS {fps:.1f}" if fps is not None else "FPS --", True, WHITE)
+            # One surface per table cell, so columns line up whatever the font
+            cells = [[font.render(cell, True, WHITE) for cell in row] for row in self.profiler.report_rows()]
+            widths = [max(row[col].get_width() for row in cells) for col in range(len(cells[0]))]
+            line_height = font.get_linesize()
+            width = max(title.get_width(), sum(widths) + 12 * (len(widths) - 1)) + 12
+            height = line_height * (len(cells) + 1) + 12
+            panel = pygame.Surface((width, height), pygame.SRCALPHA)
+            panel.fill((0, 0, 0, 180))
+            panel.blit(title, (6, 6))
+            y = 6 + line_height
+            for row in cells:
+                x = 6
+                for col, cell in enumerate(row):
+                    if col == 0:
+                        panel.blit(cell, (x, y))
+                    else:
+                        panel.blit(cell, (x + widths[col] - cell.get_width(), y))  # Right-align numbers
+                    x += widths[col] + 12
+                y += line_height
+            self._profiler_surface = panel
+            self._profiler_rendered_at = now
+
+        panel = self._profiler_surface
+        position = (self.screen.get_width() - panel.get_width() - 10,
+                    self.screen.get_height() - panel.get_height() - 10)
+        rect = self.screen.blit(panel, position)
+        self._mark_dirty(("profiler", self._profiler_rendered_at), rect)
+
+    def _shape_rect(self, shape, x, y):
+        """
+        Screen-space bounding rect of a shape's cells on the board.
+
+        Args:
+            shape (tuple): 4x4 grid positions from SHAPES.
+            x (int): Board column of the shape's grid origin.
+            y (int): Board row of the shape's grid origin.
+
+        Returns:
+            pygame.Rect: Bounds of the cells as drawn by draw_piece.
+        """
+        cols = [grid_position % 4 for grid_position in shape]
+        rows = [grid_position // 4 for grid_position in shape]
+        return pygame.Rect(
+            self.board_x + CELL_SIZE * (x + min(cols)),
+            self.board_y + CELL_SIZE * (y + min(rows)),
+            CELL_SIZE * (max(cols) - min(cols)) + CELL_SIZE - 2,
+            CELL_SIZE * (max(rows) - min(rows)) + CELL_SIZE - 2,
+        )
+
+    def _mark_dirty(self, key, rect):
+        """
+        Record something drawn over the static layer this frame.
+
+        Args:
+            key (tuple): Everything that decides how the item looks; if the
+                same key and rect were drawn last frame the pixels are unchanged.
+            rect: Screen area the item covers.
+        """
+        self._frame_items.append((key, tuple(rect)))
+
+    def resize(self, window):
+        """
+        Follow a window resize.
+
+        Only the window mapping changes; the logical surface, cached layers,
+        tiles and text all keep their logical size and nothing is re-rendered.
+
+        Args:
+            window (pygame.Surface): The resized display surface.
+        """
+        self.viewport.resize(window)
+        self.screen = self.viewport.surface
+        self.request_full_update()
+
+    def to_logical(self, pos):
+        """Convert a window position (mouse events, get_pos) to drawing coordinates."""
+        return self.viewport.to_logical(pos)
+
+    def request_full_update(self):
+        """Make the next present() push the whole window (e.g. after a resize)."""
+        self._needs_flip = True
+
+    def present(self):
+        """
+        Push this frame to the display.
+
+        Only areas whose content changed since the last frame are sent with
+        pygame.display.update(rects): the old and new positions of the piece
+        and ghost, HUD text whose value changed, buttons whose hover state
+        changed and the board when locked cells changed. Frames with a
+        full-screen overlay, the frame after one, and frames where the
+        background itself was rebuilt use a full flip instead. If the window
+        is not logical size the frame is scaled into it first (see Viewport).
+
+        Returns:
+            list or None: Rects that were updated, or None after a full flip.
+        """
+        items = set(self._frame_items)
+        if self._overlay or self._needs_flip:
+            rects = None
+        else:
+            rects = [pygame.Rect(rect) for key, rect in items ^ self._last_items]
+            if self.compositor.static_renders != self._static_renders and self._board_rect:
+                rects.append(pygame.Rect(self._board_rect))
+        self.viewport.present(rects)  # Scales to the window first if it isn't logical size
+
+        if self.profiler is not None:
+            self.profiler.end_frame()
+
+        # An overlay covers everything, so the frame after it must be full too
+        self._needs_flip = self._overlay
+        self._overlay = False
+        self._last_items = items
+        self._frame_items = []
+        self._static_renders = self.compositor.static_renders
+        return rects
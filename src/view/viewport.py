@@ -0,0 +1,111 @@
+import pygame
+from src.constants import SCREEN_SIZE, BLACK
+
+
+class Viewport:
+    """
+    Maps the fixed-size logical frame onto a window of any size.
+
+    All drawing uses logical coordinates (SCREEN_SIZE, CELL_SIZE, ...) on
+    `surface`. When the window has the logical size, `surface` is the window
+    itself and presenting costs nothing extra. Otherwise the frame is drawn
+    to an offscreen logical surface and present() scales it, once per frame,
+    into the largest centred area of the window with the same aspect ratio
+    (letterboxed). Assets, tiles and cached layers stay at logical size, so a
+    resize never re-scales any of them.
+    """
+
+    def __init__(self, window, logical_size=SCREEN_SIZE):
+        """
+        Args:
+            window (pygame.Surface): The display surface (or any target surface).
+            logical_size (tuple): Size everything is drawn at.
+        """
+        self.logical_size = tuple(logical_size)
+        self._logical = None  # Offscreen logical surface, kept across resizes
+        self.resize(window)
+
+    def resize(self, window):
+        """
+        Adopt a new window surface, e.g. after a VIDEORESIZE event.
+
+        Args:
+            window (pygame.Surface): The resized display surface.
+        """
+        self.window = window
+        window_width, window_height = window.get_size()
+        logical_width, logical_height = self.logical_size
+        self.scale = min(window_width / logical_width, window_height / logical_height)
+        width = max(1, round(logical_width * self.scale))
+        height = max(1, round(logical_height * self.scale))
+        self.rect = pygame.Rect((window_width - width) // 2, (window_height - height) // 2, width, height)
+        self.identity = window.get_size() == self.logical_size
+
+        if self.identity:
+            self.surface = window
+            self._target = None
+        else:
+            if self._logical is None:
+                self._logical = pygame.Surface(self.logical_size, 0, window)
+            self.surface = self._logical
+            self._target = window.subsurface(self.rect)  # Scaled frame is written straight here
+
+    def to_logical(self, pos):
+        """Convert a window position (e.g. the mouse) to logical coordinates."""
+        if self.identity:
+            return pos
+        return (int((pos[0] - self.rect.x) / self.scale), int((pos[1] - self.rect.y) / self.scale))
+
+    def to_window(self, rect):
+        """Return the window area covering a logical rect."""
+        rect = pygame.Rect(rect)
+        if self.identity:
+            return rect
+        left = int(rect.left * self.scale) + self.rect.x
+        top = int(rect.top * self.scale) + self.rect.y
+        right = -int(-rect.right * self.scale) + self.rect.x    # Round outwards
+        bottom = -int(-rect.bottom * self.scale) + self.rect.y
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def present(self, rects=None):
+        """
+        Scale the logical frame into the window and push it to the display.
+
+        Args:
+            rects (list, optional): Logical rects that changed; None pushes
+                the whole window, an empty list pushes nothing.
+        """
+        if self.identity:
+            if rects is None:
+                pygame.display.flip()
+            elif rects:
+                pygame.display.update(rects)
+            return
+
+        if rects is not None and not rects:
+            return
+        if self.rect.size == self.logical_size:
+            self._target.blit(self._logical, (0, 0))
+        elif self.scale == int(self.scale):
+            pygame.transform.scale(self._logical, self.rect.size, self._target)  # Exact, and faster
+        else:
+            pygame.transform.smoothscale(self._logical, self.rect.size, self._target)
+
+        if rects is None:
+            self._fill_bars()
+            pygame.display.flip()
+        else:
+            # Filtering blends neighbouring pixels, so pad each area a little
+            pygame.display.update([self.to_window(rect).inflate(4, 4).clip(self.rect) for rect in rects])
+
+    def _fill_bars(self):
+        """Clear the letterbox bars around the scaled frame."""
+        window = self.window.get_rect()
+        for bar in (
+            pygame.Rect(0, 0, window.width, self.rect.top),
+            pygame.Rect(0, self.rect.bottom, window.width, window.height - self.rect.bottom),
+            pygame.Rect(0, self.rect.top, self.rect.left, self.rect.height),
+            pygame.Rect(self.rect.right, self.rect.top, window.width - self.rect.right, self.rect.height),
+        ):
+            if bar.width > 0 and bar.height > 0:
+                self.window.fill(BLACK, bar)
@@ -300,6 +300,20 @@ def mock_time():
 
 
 # Test environment setup
+@pytest.fixture(autouse=True, scope="session")
+def asset_cache_dir(tmp_path_factory):
+    """Keep scaled-asset cache files out of the user's home directory."""
+    from src.view.assets import ASSET_CACHE_ENV
+    cache_dir = tmp_path_factory.mktemp("asset-cache")
+    previous = os.environ.get(ASSET_CACHE_ENV)
+    os.environ[ASSET_CACHE_ENV] = str(cache_dir)
+    yield cache_dir
+    if previous is None:
+        del os.environ[ASSET_CACHE_ENV]
+    else:
+        os.environ[ASSET_CACHE_ENV] = previous
+
+
 @pytest.fixture(autouse=True)
 def setup_test_environment():
     """Automatically set up test environment for each test."""
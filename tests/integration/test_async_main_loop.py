@@ -0,0 +1,132 @@
+"""
+Integration tests for the asyncio main loop variant.
+
+Tests deadline scheduling in run_every and drives app.main_async through a
+short session (start a game, autosave, quit) on the dummy video driver.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+import app
+from src.game.game import Game
+from src.game.board import Board
+from src.game.row import Row
+from src.utils.session_manager import SessionManager
+from src.constants import WIDTH, HEIGHT
+from src.constants.game_states import PLAYING
+
+
+class TestRunEvery(unittest.TestCase):
+    """Test the periodic task helper."""
+
+    def test_runs_until_stopped(self):
+        async def scenario():
+            stop = asyncio.Event()
+            calls = []
+
+            def step():
+                calls.append(1)
+                if len(calls) == 5:
+                    stop.set()
+
+            await app.run_every(0.001, stop, step)
+            return len(calls)
+
+        self.assertEqual(asyncio.run(scenario()), 5)
+
+    def test_tasks_interleave(self):
+        """A slow period must not starve a fast one."""
+        async def scenario():
+            stop = asyncio.Event()
+            fast, slow = [], []
+
+            def fast_step():
+                fast.append(1)
+                if len(fast) == 20:
+                    stop.set()
+
+            await asyncio.gather(
+                app.run_every(0.001, stop, fast_step),
+                app.run_every(0.01, stop, lambda: slow.append(1)),
+            )
+            return len(fast), len(slow)
+
+        fast, slow = asyncio.run(scenario())
+        self.assertEqual(fast, 20)
+        self.assertGreaterEqual(slow, 1)
+        self.assertLess(slow, fast)
+
+    def test_stop_interrupts_wait(self):
+        """Setting stop ends a long period without waiting it out."""
+        async def scenario():
+            stop = asyncio.Event()
+            asyncio.get_running_loop().call_later(0.05, stop.set)
+            started = time.perf_counter()
+            await app.run_every(10, stop, lambda: None)
+            return time.perf_counter() - started
+
+        self.assertLess(asyncio.run(scenario()), 1)
+
+
+class TestMainAsync(unittest.TestCase):
+    """Test a short session through main_async."""
+
+    def _run_until_quit(self, quit_ms, **kwargs):
+        """Run main_async until a QUIT posted after quit_ms; return the wall time."""
+        set_caption = pygame.display.set_caption
+
+        def schedule_quit(*args):
+            set_caption(*args)
+            pygame.time.set_timer(pygame.QUIT, quit_ms, 1)
+
+        started = time.perf_counter()
+        with patch("pygame.mouse.set_cursor"), \
+             patch("pygame.display.set_caption", side_effect=schedule_quit):
+            asyncio.run(app.main_async(**kwargs))
+        return time.perf_counter() - started
+
+    def test_quit_is_prompt_with_default_interval(self):
+        # AUTOSAVE_INTERVAL_MS is several seconds; quitting must not wait it out
+        self.assertLess(self._run_until_quit(300), 2)
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertLess(self._run_until_quit(300, autosave_path=os.path.join(directory, "autosave.bin")), 2)
+
+    def test_start_autosave_and_quit(self):
+        start_key = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, mod=0, unicode="\r", scancode=0)
+        set_caption = pygame.display.set_caption
+
+        def schedule_input(*args):
+            set_caption(*args)
+            pygame.time.set_timer(start_key, 50, 1)
+            pygame.time.set_timer(pygame.QUIT, 600, 1)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "autosave.bin")
+            with patch("pygame.mouse.set_cursor"), \
+                 patch("pygame.display.set_caption", side_effect=schedule_input):
+                asyncio.run(app.main_async(autosave_path=path, autosave_interval_ms=100))
+
+            self.assertTrue(os.path.exists(path))
+            with open(path, "rb") as handle:
+                blob = handle.read()
+
+        restored = Game(Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH), app.spawn_piece, SessionManager())
+        restored.load_state(blob)
+        self.assertEqual(restored._state, PLAYING)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+Unit tests for lazy asset loading and the scaled-image disk cache.
+
+Tests that the renderer touches no image until the start screen needs it,
+that paths don't depend on the working directory, and that scaled
+variants are reused from disk and invalidated when the source changes.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from src.view.assets import AssetManager, ASSET_DIR
+from src.view.pygame_renderer import PygameRenderer, CONTROLS_IMAGE_HEIGHT
+
+
+class TestAssetManager(unittest.TestCase):
+    """Test AssetManager loading and caching."""
+
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+        self.temp_dir = tempfile.mkdtemp()
+        self.asset_dir = os.path.join(self.temp_dir, "img")
+        self.cache_dir = os.path.join(self.temp_dir, "cache")
+        os.makedirs(self.asset_dir)
+        source = pygame.Surface((40, 20), pygame.SRCALPHA)
+        source.fill((200, 30, 30, 255))
+        pygame.image.save(source, os.path.join(self.asset_dir, "block.png"))
+
+    def tearDown(self):
+        pygame.quit()
+        shutil.rmtree(self.temp_dir)
+
+    def _assets(self):
+        return AssetManager(self.asset_dir, self.cache_dir)
+
+    def test_paths_independent_of_working_directory(self):
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        try:
+            image = AssetManager().image("controls.png")
+        finally:
+            os.chdir(cwd)
+        self.assertTrue(os.path.isabs(ASSET_DIR))
+        self.assertGreater(image.get_height(), 0)
+
+    def test_scaled_and_written_to_disk(self):
+        image = self._assets().scaled_to_height("block.png", 10)
+        self.assertEqual(image.get_size(), (20, 10))
+        self.assertEqual(os.listdir(self.cache_dir), [os.path.basename(self._assets().cache_path("block.png", 10))])
+
+    def test_memory_cache(self):
+        assets = self._assets()
+        self.assertIs(assets.scaled_to_height("block.png", 10), assets.scaled_to_height("block.png", 10))
+
+    def test_disk_cache_reused(self):
+        expected = self._assets().scaled_to_height("block.png", 10)
+        with patch('pygame.transform.smoothscale') as smoothscale:
+            image = self._assets().scaled_to_height("block.png", 10)
+        smoothscale.assert_not_called()
+        self.assertEqual(pygame.image.tostring(image, "RGBA"), pygame.image.tostring(expected, "RGBA"))
+
+    def test_source_change_invalidates(self):
+        self._assets().scaled_to_height("block.png", 10)
+        source = os.path.join(self.asset_dir, "block.png")
+        stat = os.stat(source)
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        with patch('pygame.transform.smoothscale', wraps=pygame.transform.smoothscale) as smoothscale:
+            self._assets().scaled_to_height("block.png", 10)
+        smoothscale.assert_called_once()
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)  # The stale variant is removed
+
+    def test_unwritable_cache_ignored(self):
+        blocker = os.path.join(self.temp_dir, "file")
+        open(blocker, "w").close()
+        image = AssetManager(self.asset_dir, os.path.join(blocker, "cache")).scaled_to_height("block.png", 10)
+        self.assertEqual(image.get_size(), (20, 10))
+
+    def test_corrupt_cache_entry_rebuilt(self):
+        assets = self._assets()
+        os.makedirs(self.cache_dir)
+        with open(assets.cache_path("block.png", 10), "wb") as handle:
+            handle.write(b"not a png")
+        self.assertEqual(assets.scaled_to_height("block.png", 10).get_size(), (20, 10))
+
+
+class TestRendererAssets(unittest.TestCase):
+    """Test that the renderer loads the controls image lazily."""
+
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        pygame.quit()
+        shutil.rmtree(self.cache_dir)
+
+    def test_no_image_loaded_at_startup(self):
+        with patch('pygame.image.load') as load:
+            renderer = PygameRenderer(self.screen)
+        load.assert_not_called()
+        self.assertEqual(len(renderer.assets._images), 0)
+
+    def test_controls_image_loaded_once(self):
+        renderer = PygameRenderer(self.screen)
+        renderer.assets = AssetManager(cache_dir=self.cache_dir)
+        with patch('pygame.image.load', wraps=pygame.image.load) as load, \
+             patch('pygame.mouse.set_cursor'):
+            renderer.draw_start_screen()
+            renderer.draw_start_screen()
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(renderer.controls_img.get_height(), CONTROLS_IMAGE_HEIGHT)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -197,5 +197,27 @@ class TestBoardCore(unittest.TestCase):
         self.assertEqual(coords, (3, 2))  # (x + 5%4, y + 5//4) = (2+1, 1+1) = (3, 2)
 
 
+    def test_iter_rows(self):
+        """iter_rows yields every row's index, bitmask and colors top to bottom."""
+        b = Board(simple_row_factory, height=3, width=4)
+        b.set_cell(0, 1, 'red')
+        b.set_cell(2, 0, 'blue')
+        b.set_cell(2, 3, 'green')
+        rows = [(index, bits, dict(colors)) for index, bits, colors in b.iter_rows()]
+        self.assertEqual(rows, [
+            (0, 0b0010, {1: 'red'}),
+            (1, 0, {}),
+            (2, 0b1001, {0: 'blue', 3: 'green'}),
+        ])
+
+    def test_iter_rows_colors_read_only(self):
+        b = Board(simple_row_factory, height=2, width=4)
+        b.set_cell(1, 2, 'red')
+        _, _, colors = list(b.iter_rows())[1]
+        with self.assertRaises(TypeError):
+            colors[0] = 'blue'
+        self.assertIsNone(b.get_row_object(1).get_color(0))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
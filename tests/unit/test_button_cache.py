@@ -0,0 +1,132 @@
+"""
+Unit tests for pre-rendered button faces.
+
+Tests that buttons render their normal, hover and click faces once, that
+ButtonManager reuses buttons re-added after clear(), and that a frame
+reads the mouse position only once.
+"""
+
+import os
+import random
+import sys
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+import app
+from src.ui.button import Button
+from src.ui.button_manager import ButtonManager
+from src.ui.fonts import get_font, render_text
+from src.view.pygame_renderer import PygameRenderer
+from src.game.game import Game
+from src.game.board import Board
+from src.game.row import Row
+from src.sim.generators import BagGenerator
+from src.utils.session_manager import SessionManager
+from src.constants import WIDTH, HEIGHT
+
+
+class TestButtonFaces(unittest.TestCase):
+    """Test Button and ButtonManager caching."""
+
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.font = get_font('Arial', 18, bold=True)
+        self.manager = ButtonManager(self.font)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_faces_rendered_when_added(self):
+        with patch('src.ui.button.render_text', wraps=render_text) as render:
+            self.manager.add_button((10, 10, 100, 40), "Pause", "PAUSE")
+            self.assertEqual(render.call_count, 1)
+            for pos in ((0, 0), (50, 30), (0, 0)):
+                self.manager.draw(self.screen, mouse_pos=pos)
+        self.assertEqual(render.call_count, 1)
+
+    def test_no_font_renders_on_first_draw(self):
+        manager = ButtonManager()
+        manager.add_button((10, 10, 100, 40), "Pause", "PAUSE")
+        button = manager.buttons[0]
+        self.assertIsNone(button._surfaces)
+        manager.draw(self.screen, mouse_pos=(0, 0))
+        self.assertIs(button._font, get_font('Arial', 18, bold=True))
+        self.assertEqual(self.screen.get_at((15, 30))[:3], button.color)
+        faces = button._surfaces
+        manager.draw(self.screen, mouse_pos=(15, 15))
+        self.assertIs(button._surfaces, faces)  # Rendered once
+
+    def test_faces_per_state(self):
+        button = Button((10, 10, 100, 40), "Go", "GO", (0, 150, 0), (255, 255, 255), font=self.font)
+        colors = []
+        for pos, clicked in (((0, 0), False), ((15, 15), False), ((15, 15), True)):
+            button.clicked = clicked
+            button.draw(self.screen, mouse_pos=pos)
+            colors.append(self.screen.get_at((15, 30))[:3])
+        self.assertEqual(colors, [button.color, button.hover_color, button.click_color])
+
+    def test_readded_button_reused(self):
+        self.manager.add_button((10, 10, 100, 40), "Pause", "PAUSE")
+        button = self.manager.buttons[0]
+        button.clicked = True
+        self.manager.clear()
+        self.manager.add_button((10, 10, 100, 40), "Pause", "PAUSE")
+        self.assertIs(self.manager.buttons[0], button)
+        self.assertTrue(button.clicked)  # Click feedback survives the per-frame rebuild
+
+    def test_changed_button_not_reused(self):
+        self.manager.add_button((10, 10, 100, 40), "Pause", "PAUSE")
+        button = self.manager.buttons[0]
+        self.manager.clear()
+        self.manager.add_button((10, 10, 100, 40), "Resume", "RESUME")
+        self.assertIsNot(self.manager.buttons[0], button)
+
+    def test_retired_buttons_dropped_after_one_clear(self):
+        self.manager.add_button((10, 10, 100, 40), "Pause", "PAUSE")
+        button = self.manager.buttons[0]
+        self.manager.clear()
+        self.manager.clear()
+        self.manager.add_button((10, 10, 100, 40), "Pause", "PAUSE")
+        self.assertIsNot(self.manager.buttons[0], button)
+
+
+class TestMouseReadOncePerFrame(unittest.TestCase):
+    """Test that draw_frame polls the mouse once."""
+
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.renderer = PygameRenderer(self.screen)
+        self.board = Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH)
+        self.game = Game(self.board, BagGenerator(random.Random(1)), SessionManager())
+        self.cursor = patch('pygame.mouse.set_cursor')
+        self.cursor.start()
+
+    def tearDown(self):
+        self.cursor.stop()
+        pygame.quit()
+
+    def _mouse_reads(self):
+        with patch('pygame.mouse.get_pos', return_value=(0, 0)) as get_pos:
+            app.draw_frame(self.renderer, self.game, self.board)
+        return get_pos.call_count
+
+    def test_each_screen(self):
+        self.assertEqual(self._mouse_reads(), 1)  # Start screen popup
+        self.game.apply(["START"])
+        self.assertEqual(self._mouse_reads(), 1)  # HUD pause button
+        self.game.apply(["PAUSE"])
+        self.assertEqual(self._mouse_reads(), 1)  # Pause popup
+
+
+if __name__ == '__main__':
+    unittest.main()
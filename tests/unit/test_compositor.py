@@ -0,0 +1,126 @@
+"""
+Unit tests for the layered compositor.
+
+Tests that the static layer (grid + locked cells) is only re-rendered when
+the board's mutation version changes, and that board mutations bump it.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from src.view.compositor import LayeredCompositor
+from src.view.pygame_renderer import PygameRenderer
+from src.game.board import Board
+from src.game.game import Game
+from src.game.piece import Piece
+from src.game.row import Row
+from src.utils.session_manager import SessionManager
+from src.constants import WIDTH, HEIGHT, CELL_SIZE, COLORS
+
+
+class TestBoardVersion(unittest.TestCase):
+    """Test the board mutation counter."""
+
+    def setUp(self):
+        self.board = Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH)
+
+    def test_mutations_bump_version(self):
+        for mutate in (lambda: self.board.set_cell(0, 0, 1),
+                       lambda: self.board.clear_cell(0, 0),
+                       self.board.clear,
+                       lambda: self.board.restore(self.board.snapshot())):
+            before = self.board.version
+            mutate()
+            self.assertGreater(self.board.version, before)
+
+    def test_line_clear_bumps_version_only_when_rows_removed(self):
+        before = self.board.version
+        self.board.clear_full_lines()
+        self.assertEqual(self.board.version, before)
+        for col in range(WIDTH):
+            self.board.set_cell(HEIGHT - 1, col, 1)
+        before = self.board.version
+        self.board.clear_full_lines()
+        self.assertGreater(self.board.version, before)
+
+    def test_moving_piece_does_not_bump_version(self):
+        game = Game(self.board, lambda: Piece(WIDTH // 2, 0), SessionManager())
+        game.start_new_game()
+        before = self.board.version
+        game.apply(["LEFT", "ROTATE"])
+        game.update()
+        self.assertEqual(self.board.version, before)
+
+
+class TestLayeredCompositor(unittest.TestCase):
+    """Test static layer caching."""
+
+    def setUp(self):
+        self.screen = pygame.Surface((200, 100))
+        self.board = Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH)
+        self.compositor = LayeredCompositor()
+        self.render = MagicMock(side_effect=lambda surface, board: surface.fill((1, 2, 3)))
+
+    def test_static_layer_reused_until_board_changes(self):
+        for _ in range(3):
+            self.compositor.compose(self.screen, self.board, self.render)
+        self.assertEqual(self.render.call_count, 1)
+        self.assertEqual(self.screen.get_at((5, 5))[:3], (1, 2, 3))
+
+        self.board.set_cell(0, 0, 1)
+        self.compositor.compose(self.screen, self.board, self.render)
+        self.assertEqual(self.render.call_count, 2)
+
+    def test_extra_key_and_invalidate(self):
+        self.compositor.compose(self.screen, self.board, self.render, ("light",))
+        self.compositor.compose(self.screen, self.board, self.render, ("dark",))
+        self.compositor.invalidate()
+        self.compositor.compose(self.screen, self.board, self.render, ("dark",))
+        self.assertEqual(self.compositor.static_renders, 3)
+
+    def test_resize_rebuilds_layer(self):
+        self.compositor.compose(self.screen, self.board, self.render)
+        bigger = pygame.Surface((300, 150))
+        self.compositor.compose(bigger, self.board, self.render)
+        self.assertEqual(self.compositor._static.get_size(), (300, 150))
+
+
+class TestRendererUsesCompositor(unittest.TestCase):
+    """Test PygameRenderer.draw_board through the compositor."""
+
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.renderer = PygameRenderer(self.screen)
+        self.board = Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_stationary_stack_renders_static_layer_once(self):
+        self.board.set_cell(HEIGHT - 1, 2, 4)
+        for _ in range(10):
+            self.renderer.draw_board(self.board)
+        self.assertEqual(self.renderer.compositor.static_renders, 1)
+
+    def test_locked_cell_change_shows_up(self):
+        self.renderer.draw_board(self.board)
+        self.board.set_cell(HEIGHT - 1, 2, 4)
+        self.renderer.draw_board(self.board)
+        center = (self.renderer.board_x + CELL_SIZE * 2 + CELL_SIZE // 2,
+                  self.renderer.board_y + CELL_SIZE * (HEIGHT - 1) + CELL_SIZE // 2)
+        self.assertEqual(self.screen.get_at(center)[:3], COLORS[4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+Unit tests for dirty-rectangle presentation in PygameRenderer.
+
+Tests which frames get a full flip, which rects are pushed with
+pygame.display.update, and that a window built only from those updates
+matches the fully drawn frame.
+"""
+
+import os
+import random
+import sys
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+import app
+from src.figures import SHAPES
+from src.view.pygame_renderer import PygameRenderer
+from src.game.game import Game
+from src.game.board import Board
+from src.game.row import Row
+from src.sim.generators import BagGenerator
+from src.utils.session_manager import SessionManager
+from src.constants import WIDTH, HEIGHT
+from src.constants.game_states import GAME_OVER
+
+
+class TestDirtyRects(unittest.TestCase):
+    """Test PygameRenderer.present."""
+
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.renderer = PygameRenderer(self.screen)
+        self.board = Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH)
+        self.game = Game(self.board, BagGenerator(random.Random(2)), SessionManager())
+        self.cursor = patch('pygame.mouse.set_cursor')
+        self.cursor.start()
+        # Mirror of what has actually been pushed to the window
+        self.window = self.screen.copy()
+        self.flips = 0
+        self.updates = []
+
+    def tearDown(self):
+        self.cursor.stop()
+        pygame.quit()
+
+    def _flip(self):
+        self.flips += 1
+        self.window.blit(self.screen, (0, 0))
+
+    def _update(self, rects):
+        self.updates.append(list(rects))
+        for rect in rects:
+            self.window.blit(self.screen, rect, rect)
+
+    def _frame(self):
+        app.draw_frame(self.renderer, self.game, self.board)
+        with patch('src.view.pygame_renderer.pygame.display.flip', side_effect=self._flip), \
+             patch('src.view.pygame_renderer.pygame.display.update', side_effect=self._update):
+            return self.renderer.present()
+
+    def _window_matches_screen(self):
+        return pygame.image.tostring(self.window, "RGB") == pygame.image.tostring(self.screen, "RGB")
+
+    def test_overlay_frames_flip(self):
+        self.assertIsNone(self._frame())  # Start screen overlay
+        self.game.apply(["START"])
+        self.assertIsNone(self._frame())  # First frame after the overlay
+        self.assertIsNotNone(self._frame())
+        self.assertEqual(self.flips, 2)
+
+    def test_unchanged_frame_pushes_nothing(self):
+        self.game.apply(["START"])
+        self._frame()
+        self._frame()
+        self.assertEqual(self._frame(), [])
+
+    def test_piece_move_updates_old_and_new_position(self):
+        self.game.apply(["START"])
+        self._frame()
+        self._frame()
+        piece = self.game.current_piece
+        old = self.renderer._shape_rect(SHAPES[piece.type][piece.rotation], piece.x, piece.y)
+        self.game.apply(["LEFT"])
+        rects = self._frame()
+        self.assertTrue(any(rect.contains(old) for rect in rects))
+        self.assertTrue(self._window_matches_screen())
+
+    def test_window_matches_screen_through_play(self):
+        rng = random.Random(5)
+        self.game.apply(["START"])
+        for _ in range(400):
+            if rng.random() < 0.3:
+                self.game.apply([rng.choice(["LEFT", "RIGHT", "ROTATE", "DOWN", "DROP"])])
+            if rng.random() < 0.01:
+                self.game.apply(["PAUSE"])
+            elif self.game.paused:
+                self.game.apply(["RESUME"])
+            if self.game._state == GAME_OVER:
+                self.game.apply(["RESTART"])
+            self.game.update()
+            self._frame()
+            self.assertTrue(self._window_matches_screen())
+        self.assertGreater(len(self.updates), self.flips)
+
+    def test_theme_change_flips(self):
+        self.game.apply(["START"])
+        self._frame()
+        self._frame()
+        self.renderer.background_color = (200, 200, 200)
+        self.assertIsNone(self._frame())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+Unit tests for the gym-style training environments.
+
+Tests TetrisEnv reset/step semantics, observations built from row
+bitmasks, and VectorEnv batching with both backends.
+"""
+
+import os
+import random
+import sys
+import unittest
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from src.sim import env as env_module
+from src.sim.env import TetrisEnv, VectorEnv, ACTIONS
+from src.constants import WIDTH, HEIGHT
+
+DROP = ACTIONS.index(next(a for a in ACTIONS if a is not None and a.name == "DROP"))
+
+
+def _cells(observation):
+    """Locked and piece cells of an observation as two sets of (row, col)."""
+    if env_module.np is not None:
+        locked, piece = observation
+        return ({(r, c) for r in range(HEIGHT) for c in range(WIDTH) if locked[r][c]},
+                {(r, c) for r in range(HEIGHT) for c in range(WIDTH) if piece[r][c]})
+    return tuple({(r, c) for r, bits in enumerate(plane) for c in range(WIDTH) if bits >> c & 1}
+                 for plane in observation)
+
+
+class TestTetrisEnv(unittest.TestCase):
+    """Test the single-game environment."""
+
+    def setUp(self):
+        self.env = TetrisEnv()
+
+    def test_reset_is_seeded(self):
+        first = _cells(self.env.reset(seed=3))
+        types = [self.env.game.current_piece.type, self.env.game.next_piece.type]
+        second = _cells(self.env.reset(seed=3))
+        self.assertEqual(first, second)
+        self.assertEqual(types, [self.env.game.current_piece.type, self.env.game.next_piece.type])
+
+    def test_observation_matches_board(self):
+        self.env.reset(seed=1)
+        observation, _, _, _ = self.env.step(DROP)
+        locked, piece = _cells(observation)
+        game = self.env.game
+        expected = {(r, c) for r in range(HEIGHT) for c in range(WIDTH) if game.board.get_cell(r, c)}
+        self.assertEqual(locked, expected)
+        self.assertEqual(len(piece), 4)
+
+    @unittest.skipIf(env_module.np is None, "NumPy not installed")
+    def test_numpy_observation_shape(self):
+        observation = self.env.reset(seed=1)
+        self.assertEqual(observation.shape, (2, HEIGHT, WIDTH))
+        self.assertEqual(str(observation.dtype), "uint8")
+
+    def test_reward_is_score_gained(self):
+        self.env.reset(seed=2)
+        total = 0
+        done = False
+        rng = random.Random(0)
+        while not done:
+            _, reward, done, info = self.env.step(rng.randrange(len(ACTIONS)))
+            total += reward
+        self.assertEqual(total, info["score"])
+
+    def test_step_after_game_over_requires_reset(self):
+        self.env.reset(seed=1)
+        done = False
+        while not done:
+            _, _, done, _ = self.env.step(DROP)
+        with self.assertRaises(RuntimeError):
+            self.env.step(DROP)
+        self.env.reset()
+        self.env.step(DROP)
+
+    def test_rejects_unknown_generator(self):
+        with self.assertRaises(ValueError):
+            TetrisEnv(generator="nope")
+
+
+class TestVectorEnv(unittest.TestCase):
+    """Test batched stepping."""
+
+    def _play(self, vector_env, steps=150):
+        vector_env.reset(seed=10)
+        rng = random.Random(4)
+        history = []
+        for _ in range(steps):
+            actions = [rng.randrange(len(ACTIONS)) for _ in range(vector_env.num_envs)]
+            _, rewards, dones, infos = vector_env.step(actions)
+            history.append((list(rewards), list(dones), [info["score"] for info in infos]))
+        return history
+
+    def test_batch_sizes(self):
+        with VectorEnv(3) as vector_env:
+            observations = vector_env.reset(seed=0)
+            self.assertEqual(len(observations), 3)
+            _, rewards, dones, infos = vector_env.step([0, 1, 2])
+            self.assertEqual((len(rewards), len(dones), len(infos)), (3, 3, 3))
+            with self.assertRaises(ValueError):
+                vector_env.step([0])
+
+    def test_finished_games_reset_automatically(self):
+        with VectorEnv(2) as vector_env:
+            vector_env.reset(seed=0)
+            for _ in range(300):
+                _, _, dones, infos = vector_env.step([DROP, DROP])
+                if any(dones):
+                    break
+            index = list(dones).index(True)
+            self.assertIn("final_observation", infos[index])
+            self.assertEqual(vector_env._batch.envs[index].game.score, 0)
+
+    def test_process_backend_matches_serial(self):
+        with VectorEnv(3) as serial:
+            expected = self._play(serial)
+        with VectorEnv(3, backend="process", workers=2) as pooled:
+            self.assertEqual(self._play(pooled), expected)
+
+    def test_rejects_bad_arguments(self):
+        with self.assertRaises(ValueError):
+            VectorEnv(0)
+        with self.assertRaises(ValueError):
+            VectorEnv(2, backend="threads")
+
+
+if __name__ == '__main__':
+    unittest.main()
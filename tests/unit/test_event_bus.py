@@ -0,0 +1,143 @@
+"""
+Unit tests for the game event bus.
+
+Tests subscribe/publish/batching on EventBus and the events Game publishes
+on spawn, lock, line clear, level up, pause and game over.
+"""
+
+import os
+import sys
+import unittest
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from src.game.events import (
+    EventBus, PieceSpawned, PieceLocked, LinesCleared, LevelUp, StateChanged, GameOver
+)
+from src.game.game import Game
+from src.game.board import Board
+from src.game.piece import Piece
+from src.game.row import Row
+from src.utils.session_manager import SessionManager
+from src.constants import WIDTH, HEIGHT
+from src.constants.game_states import PLAYING, GAME_OVER
+
+
+class TestEventBus(unittest.TestCase):
+    """Test EventBus delivery and batching."""
+
+    def setUp(self):
+        self.bus = EventBus()
+        self.received = []
+
+    def test_subscriber_receives_matching_events_only(self):
+        self.bus.subscribe(LevelUp, self.received.append)
+        self.bus.publish(LevelUp(2, 27))
+        self.bus.publish(LinesCleared(1, 1, 100))
+        self.assertEqual(self.received, [LevelUp(2, 27)])
+
+    def test_unsubscribe(self):
+        callback = self.bus.subscribe(LevelUp, self.received.append)
+        self.bus.unsubscribe(LevelUp, callback)
+        self.bus.publish(LevelUp(2, 27))
+        self.assertEqual(self.received, [])
+        self.assertFalse(self.bus.has_subscribers(LevelUp))
+
+    def test_batch_queues_until_closed(self):
+        self.bus.subscribe(LevelUp, self.received.append)
+        with self.bus.batch() as events:
+            self.bus.publish(LevelUp(2, 27))
+            self.bus.publish(LevelUp(3, 24))
+            self.assertEqual(self.received, [])
+            self.assertEqual(len(events), 2)
+        self.assertEqual(self.received, [LevelUp(2, 27), LevelUp(3, 24)])
+
+    def test_batch_without_delivery(self):
+        self.bus.subscribe(LevelUp, self.received.append)
+        self.bus.start_batch()
+        self.bus.publish(LevelUp(2, 27))
+        events = self.bus.end_batch(deliver=False)
+        self.assertEqual(events, [LevelUp(2, 27)])
+        self.assertEqual(self.received, [])
+
+    def test_nested_batch_delivers_once(self):
+        self.bus.subscribe(LevelUp, self.received.append)
+        with self.bus.batch():
+            with self.bus.batch():
+                self.bus.publish(LevelUp(2, 27))
+            self.assertEqual(self.received, [])
+        self.assertEqual(self.received, [LevelUp(2, 27)])
+
+
+class TestGamePublishesEvents(unittest.TestCase):
+    """Test the events Game publishes."""
+
+    def setUp(self):
+        self.board = Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH)
+        self.game = Game(self.board, lambda: Piece(WIDTH // 2, 0), SessionManager())
+        self.received = []
+        for event_type in (PieceSpawned, PieceLocked, LinesCleared, LevelUp, StateChanged, GameOver):
+            self.game.events.subscribe(event_type, self.received.append)
+
+    def _of_type(self, event_type):
+        return [event for event in self.received if isinstance(event, event_type)]
+
+    def test_start_publishes_state_and_spawn(self):
+        self.game.start_new_game()
+        self.assertEqual(self._of_type(StateChanged), [StateChanged(PLAYING, False)])
+        self.assertEqual(len(self._of_type(PieceSpawned)), 1)
+
+    def test_drop_publishes_lock_and_spawn(self):
+        self.game.start_new_game()
+        self.received.clear()
+        self.game.apply(["DROP"])
+        locked = self._of_type(PieceLocked)
+        self.assertEqual(len(locked), 1)
+        self.assertEqual(locked[0].source, "hard_drop")
+        self.assertEqual(len(self._of_type(PieceSpawned)), 1)
+
+    def test_line_clear_and_level_up(self):
+        self.game.start_new_game()
+        self.game.lines_cleared = 9
+        for col in range(WIDTH):
+            self.board.set_cell(HEIGHT - 1, col, 1)
+        self.game._freeze_piece()
+        cleared = self._of_type(LinesCleared)
+        self.assertEqual(len(cleared), 1)
+        self.assertEqual(cleared[0].count, 1)
+        self.assertEqual(cleared[0].total, 10)
+        self.assertEqual(self._of_type(LevelUp), [LevelUp(2, self.game.gravity_delay)])
+
+    def test_pause_publishes_only_real_changes(self):
+        self.game.start_new_game()
+        self.received.clear()
+        self.game.apply(["PAUSE"])
+        self.game.apply(["RESUME"])
+        self.game.apply(["RESUME"])
+        self.assertEqual(self._of_type(StateChanged),
+                         [StateChanged(PLAYING, True), StateChanged(PLAYING, False)])
+
+    def test_game_over_published(self):
+        self.game.start_new_game()
+        for row in range(0, 3):
+            for col in range(WIDTH):
+                self.board.set_cell(row, col, 1)
+        self.game._spawn_new_piece()
+        self.assertEqual(self._of_type(StateChanged)[-1].state, GAME_OVER)
+        self.assertEqual(len(self._of_type(GameOver)), 1)
+
+    def test_batched_headless_collection(self):
+        """A headless run can collect all events of a frame in one list."""
+        self.game.start_new_game()
+        self.received.clear()
+        with self.game.events.batch(deliver=False) as events:
+            self.game.apply(["DROP", "DROP"])
+        self.assertEqual(len([e for e in events if isinstance(e, PieceLocked)]), 2)
+        self.assertEqual(self.received, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Unit tests for the structured event log.
+
+Tests level filtering, the ring buffer, the JSON Lines sink, dumping recent
+events, and the events Game records in place of print() calls.
+"""
+
+import io
+import json
+import os
+import sys
+import unittest
+from contextlib import redirect_stdout
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from src.utils.event_log import EventLog, DEBUG, INFO, WARNING, OFF, parse_level
+from src.game.game import Game
+from src.game.board import Board
+from src.game.piece import Piece
+from src.game.row import Row
+from src.utils.session_manager import SessionManager
+from src.constants import WIDTH, HEIGHT
+
+
+class TestEventLog(unittest.TestCase):
+    """Test EventLog recording and output."""
+
+    def test_records_events_at_or_above_level(self):
+        log = EventLog(level=INFO)
+        log.debug("hidden")
+        log.info("shown", value=1)
+        log.warning("also_shown")
+        self.assertEqual([record["event"] for record in log.recent()], ["shown", "also_shown"])
+
+    def test_off_records_nothing(self):
+        log = EventLog(level=OFF)
+        log.error("ignored")
+        self.assertEqual(log.recent(), [])
+        self.assertFalse(log.is_enabled_for(WARNING))
+
+    def test_ring_buffer_keeps_most_recent(self):
+        log = EventLog(level=DEBUG, capacity=3)
+        for index in range(10):
+            log.debug("tick", index=index)
+        self.assertEqual([record["fields"]["index"] for record in log.recent()], [7, 8, 9])
+
+    def test_recent_limit(self):
+        log = EventLog(level=DEBUG)
+        for index in range(5):
+            log.debug("tick", index=index)
+        self.assertEqual(len(log.recent(limit=2)), 2)
+
+    def test_fields_may_use_reserved_names(self):
+        """Fields called 'level' or 'event' must not clash with the method arguments."""
+        log = EventLog(level=DEBUG)
+        log.info("level_up", level=3, event="x")
+        self.assertEqual(log.recent()[0]["fields"], {"level": 3, "event": "x"})
+
+    def test_jsonl_sink_receives_one_object_per_line(self):
+        sink = io.StringIO()
+        log = EventLog(level=INFO, sink=sink)
+        log.info("lines_cleared", count=2)
+        log.debug("not_written")
+        lines = sink.getvalue().splitlines()
+        self.assertEqual(len(lines), 1)
+        payload = json.loads(lines[0])
+        self.assertEqual(payload["event"], "lines_cleared")
+        self.assertEqual(payload["level"], "INFO")
+        self.assertEqual(payload["fields"], {"count": 2})
+
+    def test_dump_writes_readable_lines(self):
+        log = EventLog(level=INFO)
+        log.info("game_over", score=100)
+        stream = io.StringIO()
+        log.dump(stream)
+        self.assertIn("game_over score=100", stream.getvalue())
+
+    def test_clear(self):
+        log = EventLog(level=INFO)
+        log.info("x")
+        log.clear()
+        self.assertEqual(log.recent(), [])
+
+    def test_parse_level(self):
+        self.assertEqual(parse_level("debug"), DEBUG)
+        self.assertEqual(parse_level("OFF"), OFF)
+        with self.assertRaises(ValueError):
+            parse_level("verbose")
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            EventLog(capacity=0)
+
+
+class TestGameEvents(unittest.TestCase):
+    """Test the events Game records instead of printing."""
+
+    def setUp(self):
+        self.board = Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH)
+        self.log = EventLog(level=DEBUG)
+        self.game = Game(self.board, lambda: Piece(WIDTH // 2, 0), SessionManager(), self.log)
+        self.game.start_new_game()
+
+    def test_hard_drop_is_logged_not_printed(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.game.apply(["DROP"])
+        self.assertEqual(output.getvalue(), "")
+        locked = [record for record in self.log.recent() if record["event"] == "piece_locked"]
+        self.assertEqual(locked[-1]["fields"]["source"], "hard_drop")
+
+    def test_gravity_lock_is_logged(self):
+        for _ in range(HEIGHT * self.game.gravity_delay):
+            self.game.update()
+        sources = {record["fields"].get("source") for record in self.log.recent()}
+        self.assertIn("gravity", sources)
+
+    def test_game_over_is_logged(self):
+        for row in range(0, 3):
+            for col in range(WIDTH):
+                self.board.set_cell(row, col, 1)
+        self.game._spawn_new_piece()
+        self.assertEqual(self.log.recent()[-1]["event"], "game_over")
+
+    def test_default_log_skips_debug_events(self):
+        game = Game(self.board, lambda: Piece(WIDTH // 2, 0), SessionManager())
+        game.start_new_game()
+        game.apply(["DROP"])
+        self.assertEqual(game.event_log.recent(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Unit tests for the self-play farm.
+
+Tests percentile aggregation and that games played over worker processes
+match the same seeds played in-process.
+"""
+
+import os
+import io
+import sys
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from src.sim.farm import FarmReport, run_farm
+from src.utils.stats import percentile
+import headless
+from src.sim.runner import run_headless
+
+
+def _die_on_seed_one(seed=None, **options):
+    """run_headless stand-in whose worker is killed outright on seed 1."""
+    if seed == 1:
+        os._exit(3)
+    return run_headless(seed=seed, **options)
+
+
+class TestAggregation(unittest.TestCase):
+    """Test percentile helpers and FarmReport."""
+
+    def test_nearest_rank_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile(values, 100), 100)
+        self.assertEqual(percentile(values, 0), 1)
+        self.assertIsNone(percentile([], 50))
+
+    def test_report_aggregates_summaries(self):
+        report = FarmReport()
+        for seed, score in enumerate([300, 100, 200]):
+            report.add((seed, score, 1, 10, 0.5, seed == 0))
+        self.assertEqual(report.games, 3)
+        self.assertEqual(report.game_overs, 1)
+        self.assertEqual(report.percentiles("score", (50, 100)), {50: 200, 100: 300})
+        self.assertEqual(report.mean("pieces"), 10)
+
+
+class TestRunFarm(unittest.TestCase):
+    """Test running games over worker processes."""
+
+    def test_matches_in_process_runs(self):
+        streamed = []
+        report = run_farm(5, workers=2, first_seed=7, on_result=streamed.append,
+                          policy="bot", max_pieces=8)
+        self.assertEqual(report.games, 5)
+        self.assertEqual(report.errors, [])
+
+        by_seed = {summary[0]: summary for summary in streamed}
+        self.assertEqual(sorted(by_seed), [7, 8, 9, 10, 11])
+        for seed in by_seed:
+            expected = run_headless(seed=seed, policy="bot", max_pieces=8)
+            self.assertEqual(by_seed[seed][1:4], (expected.score, expected.lines, expected.pieces))
+
+    def test_worker_errors_are_reported(self):
+        report = run_farm(2, workers=1, policy="nope", max_pieces=1)
+        self.assertEqual(report.games, 0)
+        self.assertEqual(len(report.errors), 2)
+        self.assertIn("ValueError", report.errors[0][1])
+
+    @patch('src.sim.farm.RESULT_POLL_SECONDS', 0.1)
+    @patch('src.sim.farm.run_headless', _die_on_seed_one)
+    def test_dead_worker_does_not_hang(self):
+        report = run_farm(3, workers=1, policy="bot", max_pieces=2)
+        # Seed 0's result may be lost with the worker; every seed is accounted for
+        errors = dict(report.errors)
+        self.assertEqual(report.games + len(errors), 3)
+        self.assertIn(1, errors)
+        self.assertIn(2, errors)
+        self.assertIn("exited with code 3", errors[2])
+
+    def test_requires_a_stop_condition(self):
+        with self.assertRaises(ValueError):
+            run_farm(2)
+        with self.assertRaises(ValueError):
+            run_farm(0, max_pieces=1)
+
+
+class TestFarmCli(unittest.TestCase):
+    """Test the --games mode of headless.py."""
+
+    def test_every_game_failing(self):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            status = headless.main(['--policy', 'scripted', '--script', 'FOO', '--games', '2', '--workers', '1'])
+        self.assertEqual(status, 1)
+        self.assertIn("Games:     0 (0 game over, 2 errors)", stdout.getvalue())
+        self.assertNotIn("Score:", stdout.getvalue())
+        self.assertIn("First error (seed 0)", stderr.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Unit tests for the fixed-timestep simulation clock.
+
+Tests tick accumulation, catch-up limiting and determinism, and that
+gravity driven by the clock no longer depends on the render frame rate.
+"""
+
+import os
+import sys
+import unittest
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from src.utils.clock import FixedStepClock
+from src.game.game import Game
+from src.game.board import Board
+from src.game.piece import Piece
+from src.game.row import Row
+from src.utils.session_manager import SessionManager
+from src.constants import WIDTH, HEIGHT
+
+
+def _frame_times(fps, duration_ms):
+    """Integer millisecond timestamps for frames rendered at fps."""
+    count = fps * duration_ms // 1000
+    return [frame * 1000 // fps for frame in range(1, count + 1)]
+
+
+class TestFixedStepClock(unittest.TestCase):
+    """Test tick accumulation in FixedStepClock."""
+
+    def test_first_advance_only_starts_clock(self):
+        clock = FixedStepClock(tick_rate=60)
+        self.assertEqual(clock.advance(5000), 0)
+
+    def test_one_second_yields_tick_rate_ticks(self):
+        clock = FixedStepClock(tick_rate=60, max_ticks=100)
+        clock.reset(0)
+        self.assertEqual(clock.advance(1000), 60)
+
+    def test_partial_ticks_carry_over(self):
+        """Time that doesn't fill a tick should count toward the next one."""
+        clock = FixedStepClock(tick_rate=60)
+        clock.reset(0)
+        self.assertEqual(clock.advance(10), 0)
+        self.assertEqual(clock.advance(20), 1)
+        self.assertGreater(clock.alpha, 0.0)
+
+    def test_tick_total_independent_of_frame_rate(self):
+        """30, 60 and 144 FPS timestamps over one second all give the same tick count."""
+        totals = []
+        for fps in (30, 60, 144):
+            clock = FixedStepClock(tick_rate=60)
+            clock.reset(0)
+            totals.append(sum(clock.advance(now) for now in _frame_times(fps, 1000)))
+        self.assertEqual(totals, [60, 60, 60])
+
+    def test_catch_up_is_limited(self):
+        """A long hitch should run at most max_ticks and record the rest as dropped."""
+        clock = FixedStepClock(tick_rate=60, max_ticks=5)
+        clock.reset(0)
+        self.assertEqual(clock.advance(1000), 5)
+        self.assertEqual(clock.dropped_ticks, 55)
+        # The backlog is gone, so the next frame runs normally
+        self.assertEqual(clock.advance(1017), 1)
+
+    def test_backwards_time_is_ignored(self):
+        clock = FixedStepClock(tick_rate=60)
+        clock.reset(1000)
+        self.assertEqual(clock.advance(900), 0)
+
+    def test_same_timestamps_are_deterministic(self):
+        timestamps = [0, 16, 40, 41, 90, 200, 201, 350]
+        first = FixedStepClock(tick_rate=50)
+        second = FixedStepClock(tick_rate=50)
+        self.assertEqual([first.advance(t) for t in timestamps],
+                         [second.advance(t) for t in timestamps])
+
+    def test_invalid_configuration_rejected(self):
+        with self.assertRaises(ValueError):
+            FixedStepClock(tick_rate=0)
+        with self.assertRaises(ValueError):
+            FixedStepClock(max_ticks=0)
+
+
+class TestGravityWithFixedStep(unittest.TestCase):
+    """Test that clock-driven gravity is independent of render FPS."""
+
+    def _fall_distance(self, fps):
+        board = Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH)
+        game = Game(board, lambda: Piece(WIDTH // 2, 0), SessionManager())
+        game.start_new_game()
+        start_y = game.current_piece.y
+        clock = FixedStepClock(tick_rate=60)
+        clock.reset(0)
+        for now in _frame_times(fps, 2000):
+            for _ in range(clock.advance(now)):
+                game.update()
+        return game.current_piece.y - start_y
+
+    def test_piece_falls_same_distance_at_any_fps(self):
+        self.assertEqual(self._fall_distance(30), self._fall_distance(60))
+        self.assertEqual(self._fall_distance(60), self._fall_distance(144))
+
+
+if __name__ == '__main__':
+    unittest.main()
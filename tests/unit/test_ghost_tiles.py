@@ -0,0 +1,73 @@
+"""
+Unit tests for the pre-rendered ghost piece tiles in PygameRenderer.
+
+Tests that one tile is baked per color, that drawing a ghost allocates
+no surfaces, and that the blitted tiles keep the faded fill and outline.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from src.figures import SHAPES
+from src.view.pygame_renderer import PygameRenderer
+from src.view.tile_atlas import GHOST
+from src.game.board import Board
+from src.game.piece import Piece
+from src.game.row import Row
+from src.constants import WIDTH, HEIGHT, CELL_SIZE, COLORS, WHITE
+
+
+class TestGhostTiles(unittest.TestCase):
+    """Test PygameRenderer.draw_ghost_piece with cached tiles."""
+
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.renderer = PygameRenderer(self.screen)
+        self.board = Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH)
+        self.piece = Piece(3, 0)
+        self.piece.type, self.piece.rotation, self.piece.color = 3, 0, 1
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_one_tile_per_color(self):
+        areas = {tuple(self.renderer.atlas.area(GHOST, color)) for color in range(len(COLORS))}
+        self.assertEqual(len(areas), len(COLORS))
+
+    def test_cached_ghost_allocates_nothing(self):
+        self.renderer.draw_ghost_piece(self.board, self.piece)
+        with patch('src.view.pygame_renderer.pygame.Surface') as surface, \
+             patch('src.view.pygame_renderer.pygame.draw.line') as line:
+            self.renderer.draw_ghost_piece(self.board, self.piece)
+        surface.assert_not_called()
+        line.assert_not_called()
+
+    def test_pixels(self):
+        self.screen.fill(WHITE)
+        self.renderer.draw_ghost_piece(self.board, self.piece)
+        land_y = self.board.get_landing_y(self.piece)
+        shape = SHAPES[self.piece.type][self.piece.rotation]
+        col = self.piece.x + min(position % 4 for position in shape)
+        row = land_y + min(position // 4 for position in shape)
+        x = self.renderer.board_x + CELL_SIZE * col
+        y = self.renderer.board_y + CELL_SIZE * row
+        color = COLORS[self.piece.color]
+        self.assertEqual(self.screen.get_at((x, y))[:3], color)  # Outline
+        fill = self.screen.get_at((x + CELL_SIZE // 2, y + CELL_SIZE // 2))[:3]
+        self.assertNotEqual(fill, WHITE)
+        self.assertNotEqual(fill, color)  # Faded, not opaque
+
+
+if __name__ == '__main__':
+    unittest.main()
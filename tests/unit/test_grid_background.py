@@ -0,0 +1,82 @@
+"""
+Unit tests for the cached grid background in PygameRenderer.draw_board.
+
+Tests that the grid is pre-rendered once, rebuilt only when its inputs
+change, and that occupied cells are still drawn on top.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from src.view.pygame_renderer import PygameRenderer
+from src.game.board import Board
+from src.game.row import Row
+from src.constants import WIDTH, HEIGHT, CELL_SIZE, COLORS, GRAY, WHITE
+
+
+class TestGridBackground(unittest.TestCase):
+    """Test the pre-rendered grid surface."""
+
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.renderer = PygameRenderer(self.screen)
+        self.board = Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def _cell_center(self, row, col):
+        return (self.renderer.board_x + CELL_SIZE * col + CELL_SIZE // 2,
+                self.renderer.board_y + CELL_SIZE * row + CELL_SIZE // 2)
+
+    def test_grid_built_once(self):
+        self.renderer.draw_board(self.board)
+        grid = self.renderer._grid_surface
+        with patch('src.view.pygame_renderer.pygame.draw.rect') as draw_rect:
+            self.renderer.draw_board(self.board)
+        self.assertIs(self.renderer._grid_surface, grid)
+        draw_rect.assert_not_called()  # Empty board: nothing beyond the cached grid
+
+    def test_only_occupied_cells_drawn(self):
+        self.board.set_cell(HEIGHT - 1, 0, 2)
+        self.board.set_cell(HEIGHT - 1, 5, 3)
+        self.renderer._grid_background(self.board)
+        with patch.object(self.renderer.atlas, 'area', wraps=self.renderer.atlas.area) as area:
+            self.renderer.draw_board(self.board)
+        self.assertEqual(area.call_count, 2)
+
+    def test_pixels(self):
+        self.board.set_cell(3, 4, 2)
+        self.renderer.draw_board(self.board)
+        self.assertEqual(self.screen.get_at(self._cell_center(3, 4))[:3], COLORS[2])
+        self.assertEqual(self.screen.get_at(self._cell_center(3, 5))[:3], WHITE)
+        self.assertEqual(self.screen.get_at((self.renderer.board_x, self.renderer.board_y))[:3], GRAY)
+
+    def test_theme_change_rebuilds(self):
+        self.renderer.draw_board(self.board)
+        grid = self.renderer._grid_surface
+        self.renderer.background_color = (10, 20, 30)
+        self.renderer.draw_board(self.board)
+        self.assertIsNot(self.renderer._grid_surface, grid)
+        self.assertEqual(self.screen.get_at(self._cell_center(0, 0))[:3], (10, 20, 30))
+
+    def test_resize_rebuilds(self):
+        self.renderer.draw_board(self.board)
+        self.renderer.screen = pygame.Surface((640, 480))
+        self.renderer.draw_board(self.board)
+        self.assertEqual(self.renderer._grid_surface.get_size(), (640, 480))
+
+
+if __name__ == '__main__':
+    unittest.main()
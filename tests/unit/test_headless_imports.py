@@ -0,0 +1,80 @@
+"""
+Unit tests for the pygame-free simulation core.
+
+The game logic, utilities, shapes and constant tables must be importable
+without pygame so headless workers start quickly. Each check runs in a fresh
+interpreter because the test session itself has already imported pygame.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+
+def _modules_loaded_after(*modules):
+    """Import the given modules in a clean interpreter and return every module it loaded."""
+    code = "import sys\n"
+    code += "".join(f"import {module}\n" for module in modules)
+    code += "print(' '.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.strip().splitlines()[-1].split())
+
+
+def _pygame_loaded_after(*modules):
+    """Import the given modules in a clean interpreter and report whether pygame was loaded."""
+    return "pygame" in _modules_loaded_after(*modules)
+
+
+class TestHeadlessImports(unittest.TestCase):
+    """Test that the simulation core does not pull in pygame."""
+
+    def test_game_package_does_not_import_pygame(self):
+        """src.game modules should import without pygame."""
+        self.assertFalse(_pygame_loaded_after(
+            "src.game.game", "src.game.board", "src.game.piece", "src.game.row"))
+
+    def test_utils_package_does_not_import_pygame(self):
+        """src.utils modules should import without pygame."""
+        self.assertFalse(_pygame_loaded_after(
+            "src.utils.linked_list", "src.utils.score", "src.utils.session_manager"))
+
+    def test_profiler_does_not_import_sim_or_game(self):
+        """src.utils.profiler is a utility; it must not load the farm or the game."""
+        loaded = _modules_loaded_after("src.utils.profiler")
+        self.assertNotIn("multiprocessing", loaded)
+        self.assertFalse({module for module in loaded if module.startswith(("src.sim", "src.game"))})
+
+    def test_constants_and_shapes_do_not_import_pygame(self):
+        """Constant tables and shapes should import without pygame."""
+        self.assertFalse(_pygame_loaded_after("src.constants", "src.figures"))
+
+    def test_sim_package_does_not_import_pygame(self):
+        """Runner, farm and env modules start workers without pygame."""
+        self.assertFalse(_pygame_loaded_after(
+            "src.sim.runner", "src.sim.farm", "src.sim.env"))
+
+    def test_view_still_imports_pygame(self):
+        """The renderer is where pygame gets loaded."""
+        self.assertTrue(_pygame_loaded_after("src.view.pygame_renderer"))
+
+    def test_preview_rect_is_plain_tuple(self):
+        """NEXT_PAGE_PREVIEW_RECT should be a plain (x, y, w, h) tuple."""
+        from src.constants import NEXT_PAGE_PREVIEW_RECT
+        self.assertIsInstance(NEXT_PAGE_PREVIEW_RECT, tuple)
+        self.assertEqual(len(NEXT_PAGE_PREVIEW_RECT), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+"""
+Unit tests for the headless simulation runner.
+
+Tests piece generators, input policies and the run loop's stop conditions.
+"""
+
+import os
+import random
+import sys
+import unittest
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from src.figures import SHAPES
+from src.game.piece import Piece
+from src.game.intents import Intent
+from src.sim.generators import RandomGenerator, BagGenerator
+from src.sim.policies import ScriptedPolicy, RandomPolicy, BotPolicy, MOVE_INTENTS
+from src.sim.runner import run_headless
+from headless import parse_args
+
+
+class TestGenerators(unittest.TestCase):
+    """Test seedable piece generators."""
+
+    def test_piece_accepts_seeded_rng(self):
+        """Pieces built from equally seeded RNGs should match."""
+        a = Piece(3, 0, random.Random(7))
+        b = Piece(3, 0, random.Random(7))
+        self.assertEqual((a.type, a.color), (b.type, b.color))
+
+    def test_random_generator_is_reproducible(self):
+        """Same seed should produce the same piece sequence."""
+        first = RandomGenerator(random.Random(1))
+        second = RandomGenerator(random.Random(1))
+        self.assertEqual([first().type for _ in range(20)], [second().type for _ in range(20)])
+
+    def test_bag_generator_yields_each_shape_once_per_bag(self):
+        """Every consecutive bag should contain each shape exactly once."""
+        generator = BagGenerator(random.Random(3))
+        for _ in range(3):
+            types = sorted(generator().type for _ in range(len(SHAPES)))
+            self.assertEqual(types, list(range(len(SHAPES))))
+
+
+class TestPolicies(unittest.TestCase):
+    """Test input policies."""
+
+    def test_scripted_policy_cycles(self):
+        """Scripted policy should loop over its intents one per tick."""
+        policy = ScriptedPolicy(["LEFT", "DROP"])
+        self.assertEqual([policy(None) for _ in range(3)],
+                         [[Intent.LEFT], [Intent.DROP], [Intent.LEFT]])
+
+    def test_scripted_policy_requires_intents(self):
+        with self.assertRaises(ValueError):
+            ScriptedPolicy([])
+        with self.assertRaises(ValueError):
+            ScriptedPolicy(["JUMP"])
+
+    def test_random_policy_picks_gameplay_intents(self):
+        policy = RandomPolicy(random.Random(0))
+        for _ in range(50):
+            intents = policy(None)
+            self.assertEqual(len(intents), 1)
+            self.assertIn(intents[0], MOVE_INTENTS)
+
+    def test_bot_policy_ends_with_drop(self):
+        """Bot should place each piece with a single plan ending in DROP."""
+        from src.game.board import Board
+        from src.game.game import Game
+        from src.game.row import Row
+        from src.utils.session_manager import SessionManager
+        from src.constants import WIDTH, HEIGHT
+
+        game = Game(Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH),
+                    RandomGenerator(random.Random(0)), SessionManager())
+        game.start_new_game()
+        intents = BotPolicy()(game)
+        self.assertEqual(intents[-1], Intent.DROP)
+        self.assertEqual(intents.count(Intent.DROP), 1)
+
+
+class TestRunHeadless(unittest.TestCase):
+    """Test the headless run loop."""
+
+    def test_stops_after_max_pieces(self):
+        result = run_headless(seed=1, policy="bot", max_pieces=25)
+        self.assertEqual(result.pieces, 25)
+        self.assertFalse(result.game_over)
+
+    def test_stops_after_max_lines(self):
+        result = run_headless(seed=1, policy="bot", max_lines=5)
+        self.assertGreaterEqual(result.lines, 5)
+
+    def test_stops_after_max_ticks(self):
+        result = run_headless(seed=1, policy="scripted", script=["LEFT"], max_ticks=40)
+        self.assertEqual(result.ticks, 40)
+
+    def test_stops_on_game_over(self):
+        """Dropping every piece in the spawn column should top out quickly."""
+        result = run_headless(seed=1, policy="scripted", script=["DROP"], max_pieces=1000)
+        self.assertTrue(result.game_over)
+        self.assertLess(result.pieces, 1000)
+
+    def test_same_seed_is_deterministic(self):
+        first = run_headless(seed=5, policy="random", max_ticks=500)
+        second = run_headless(seed=5, policy="random", max_ticks=500)
+        self.assertEqual((first.score, first.lines, first.pieces, first.ticks),
+                         (second.score, second.lines, second.pieces, second.ticks))
+
+    def test_requires_a_stop_condition(self):
+        with self.assertRaises(ValueError):
+            run_headless(seed=1)
+
+    def test_rejects_unknown_names(self):
+        with self.assertRaises(ValueError):
+            run_headless(generator="nope", max_ticks=1)
+        with self.assertRaises(ValueError):
+            run_headless(policy="nope", max_ticks=1)
+
+    def test_rates_are_reported(self):
+        result = run_headless(seed=2, policy="bot", max_pieces=10)
+        summary = result.as_dict()
+        self.assertEqual(summary["pieces"], 10)
+        self.assertGreaterEqual(summary["pieces_per_second"], 0.0)
+        self.assertGreaterEqual(summary["lines_per_second"], 0.0)
+
+
+class TestHeadlessCli(unittest.TestCase):
+    """Test command line parsing for headless.py."""
+
+    def test_defaults_to_piece_limit(self):
+        args = parse_args([])
+        self.assertEqual(args.pieces, 1000)
+        self.assertEqual(args.policy, "bot")
+
+    def test_explicit_stop_condition_disables_default(self):
+        args = parse_args(["--seconds", "2"])
+        self.assertIsNone(args.pieces)
+        self.assertEqual(args.seconds, 2.0)
+
+    def test_farm_options(self):
+        args = parse_args(["--games", "100", "--workers", "4"])
+        self.assertEqual((args.games, args.workers), (100, 4))
+        self.assertEqual(args.pieces, 1000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Unit tests for the idle low-power scheduler.
+
+Tests that static screens (start, game over, paused) render once and then
+block for input, while active gameplay renders every frame.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch, MagicMock
+
+import pygame
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from src.view.idle import IdleScheduler
+from src.game.game import Game
+from src.game.board import Board
+from src.game.piece import Piece
+from src.game.row import Row
+from src.utils.session_manager import SessionManager
+from src.constants import WIDTH, HEIGHT
+
+
+class TestIdleScheduler(unittest.TestCase):
+    """Test when IdleScheduler renders and when it sleeps."""
+
+    def setUp(self):
+        self.board = Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH)
+        self.game = Game(self.board, lambda: Piece(WIDTH // 2, 0), SessionManager())
+        self.idle = IdleScheduler(wait_ms=250)
+
+    def test_start_screen_is_idle(self):
+        self.assertTrue(IdleScheduler.is_idle(self.game))
+
+    def test_playing_is_not_idle(self):
+        self.game.start_new_game()
+        self.assertFalse(IdleScheduler.is_idle(self.game))
+
+    def test_paused_is_idle(self):
+        self.game.start_new_game()
+        self.game.apply(["PAUSE"])
+        self.assertTrue(IdleScheduler.is_idle(self.game))
+
+    def test_first_idle_frame_renders(self):
+        self.assertTrue(self.idle.should_render(self.game))
+
+    @patch('src.view.idle.pygame.event.get', return_value=[])
+    @patch('src.view.idle.pygame.event.wait')
+    def test_idle_screen_blocks_after_render(self, mock_wait, mock_get):
+        """Once the idle screen is drawn, the next frame waits instead of polling."""
+        mock_wait.return_value = MagicMock(type=pygame.NOEVENT)
+        self.idle.rendered(self.game)
+
+        events = self.idle.get_events(self.game)
+
+        mock_wait.assert_called_once_with(250)
+        self.assertEqual(events, [])
+        self.assertFalse(self.idle.should_render(self.game))
+
+    @patch('src.view.idle.pygame.event.get', return_value=[])
+    @patch('src.view.idle.pygame.event.wait')
+    def test_mouse_motion_wakes_and_redraws(self, mock_wait, mock_get):
+        """Mouse motion must redraw so button hover and cursor stay current."""
+        motion = MagicMock(type=pygame.MOUSEMOTION)
+        mock_wait.return_value = motion
+        self.idle.rendered(self.game)
+
+        events = self.idle.get_events(self.game)
+
+        self.assertEqual(events, [motion])
+        self.assertTrue(self.idle.should_render(self.game))
+
+    @patch('src.view.idle.pygame.event.get', return_value=[])
+    @patch('src.view.idle.pygame.event.wait')
+    def test_playing_never_blocks(self, mock_wait, mock_get):
+        self.game.start_new_game()
+        self.idle.rendered(self.game)
+
+        self.idle.get_events(self.game)
+
+        mock_wait.assert_not_called()
+        self.assertTrue(self.idle.should_render(self.game))
+
+    @patch('src.view.idle.pygame.event.wait')
+    def test_poll_events_never_blocks(self, mock_wait):
+        """poll_events is for loops that sleep on their own (the asyncio loop)."""
+        self.idle.rendered(self.game)
+        with patch('src.view.idle.pygame.event.get', return_value=[MagicMock(type=pygame.MOUSEMOTION)]):
+            self.assertEqual(len(self.idle.poll_events()), 1)
+        mock_wait.assert_not_called()
+        self.assertTrue(self.idle.should_render(self.game))
+
+    def test_state_change_forces_render(self):
+        """A new screen (e.g. game over with a new score) must be drawn once."""
+        self.idle.rendered(self.game)
+        self.game.start_new_game()
+        self.game.apply(["PAUSE"])
+        self.assertTrue(self.idle.should_render(self.game))
+
+    def test_request_redraw(self):
+        self.idle.rendered(self.game)
+        self.idle.request_redraw()
+        self.assertTrue(self.idle.should_render(self.game))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+"""
+Unit tests for integer-coded intent dispatch.
+
+Tests intent code translation, coalescing of repeated intents, and that
+Game.apply behaves the same for codes and legacy string intents.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from src.game.intents import Intent, to_code, coalesce
+from src.game.game import Game
+from src.game.board import Board
+from src.game.piece import Piece
+from src.game.row import Row
+from src.utils.session_manager import SessionManager
+from src.constants import WIDTH, HEIGHT
+from src.constants.game_states import START_SCREEN, PLAYING, GAME_OVER
+
+
+def _make_piece():
+    """An I piece (type 0) so wall positions are predictable."""
+    piece = Piece(WIDTH // 2, 0)
+    piece.type = 0
+    return piece
+
+
+class TestIntentCodes(unittest.TestCase):
+    """Test translation between strings and Intent codes."""
+
+    def test_string_names_map_to_codes(self):
+        self.assertEqual(to_code("LEFT"), Intent.LEFT)
+        self.assertEqual(to_code("EXIT"), Intent.EXIT)
+
+    def test_codes_pass_through(self):
+        self.assertIs(to_code(Intent.DROP), Intent.DROP)
+        self.assertEqual(to_code(int(Intent.ROTATE)), Intent.ROTATE)
+
+    def test_unknown_intents_are_none(self):
+        self.assertIsNone(to_code("JUMP"))
+        self.assertIsNone(to_code(999))
+
+
+class TestCoalesce(unittest.TestCase):
+    """Test run-length coalescing of intents."""
+
+    def test_repeats_become_runs(self):
+        runs = coalesce(["LEFT"] * 10 + ["DROP"])
+        self.assertEqual(runs, [(Intent.LEFT, 10), (Intent.DROP, 1)])
+
+    def test_mixed_strings_and_codes_coalesce(self):
+        self.assertEqual(coalesce(["PAUSE", Intent.PAUSE]), [(Intent.PAUSE, 2)])
+
+    def test_order_is_preserved(self):
+        runs = coalesce(["LEFT", "RIGHT", "LEFT"])
+        self.assertEqual([code for code, _ in runs], [Intent.LEFT, Intent.RIGHT, Intent.LEFT])
+
+    def test_unknown_intents_dropped(self):
+        self.assertEqual(coalesce(["JUMP", "LEFT"]), [(Intent.LEFT, 1)])
+
+
+class TestGameDispatch(unittest.TestCase):
+    """Test Game.apply with codes, strings and coalesced runs."""
+
+    def setUp(self):
+        self.board = Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH)
+        self.game = Game(self.board, _make_piece, SessionManager())
+
+    def test_start_accepts_code(self):
+        self.game.apply([Intent.START])
+        self.assertEqual(self.game._state, PLAYING)
+
+    def test_exit_sets_done_in_every_state(self):
+        self.game.apply([Intent.EXIT])
+        self.assertTrue(self.game.done)
+
+        self.game.start_new_game()
+        self.game.apply(["EXIT"])
+        self.assertTrue(self.game.done)
+
+        self.game.start_new_game()
+        self.game._state = GAME_OVER
+        self.game.apply(["EXIT"])
+        self.assertTrue(self.game.done)
+
+    def test_ten_lefts_stop_at_wall(self):
+        """Moves past the wall should never reach Board."""
+        self.game.start_new_game()
+        start_x = self.game.current_piece.x
+        with patch.object(self.board, 'go_side', wraps=self.board.go_side) as go_side:
+            self.game.apply([Intent.LEFT] * 10)
+        # The vertical I piece occupies grid column 1, so it stops at x == -1
+        self.assertEqual(self.game.current_piece.x, -1)
+        # Every successful move plus the one blocked attempt, not all ten
+        self.assertEqual(go_side.call_count, start_x - (-1) + 1)
+
+    def test_string_and_code_intents_match(self):
+        self.game.start_new_game()
+        self.game.apply(["RIGHT", "RIGHT", "ROTATE"])
+        by_string = (self.game.current_piece.x, self.game.current_piece.rotation)
+
+        self.game.start_new_game()
+        self.game.apply([Intent.RIGHT, Intent.RIGHT, Intent.ROTATE])
+        by_code = (self.game.current_piece.x, self.game.current_piece.rotation)
+        self.assertEqual(by_string, by_code)
+
+    def test_pause_pair_cancels(self):
+        self.game.start_new_game()
+        self.game.apply(["PAUSE", "PAUSE"])
+        self.assertFalse(self.game.paused)
+
+    def test_triple_pause_toggles_once(self):
+        self.game.start_new_game()
+        self.game.apply([Intent.PAUSE] * 3)
+        self.assertTrue(self.game.paused)
+
+    def test_click_after_pause_in_same_batch_keeps_pause(self):
+        """ESC emits QUIT+PAUSE and a click in the same frame must not undo it."""
+        self.game.start_new_game()
+        self.game.apply(["PAUSE", "CLICK"])
+        self.assertTrue(self.game.paused)
+
+    def test_repeated_drops_each_lock_a_piece(self):
+        self.game.start_new_game()
+        with patch.object(self.game, '_freeze_piece', wraps=self.game._freeze_piece) as freeze:
+            self.game.apply([Intent.DROP] * 3)
+        self.assertEqual(freeze.call_count, 3)
+
+    def test_moves_ignored_when_paused(self):
+        self.game.start_new_game()
+        x = self.game.current_piece.x
+        self.game.apply([Intent.PAUSE, Intent.LEFT, Intent.LEFT])
+        self.assertEqual(self.game.current_piece.x, x)
+
+    def test_start_screen_ignores_gameplay_intents(self):
+        self.game.apply([Intent.LEFT, Intent.DROP])
+        self.assertEqual(self.game._state, START_SCREEN)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+Unit tests for multi-row (fractional G) gravity.
+
+Tests the gravity_rows level curve, fractional accumulation, instant
+landing at 20G via a single landing query, and that level 1 timing is
+unchanged.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from src.game.game import Game
+from src.game.board import Board
+from src.game.piece import Piece
+from src.game.row import Row
+from src.game.events import PieceLocked
+from src.utils.session_manager import SessionManager
+from src.constants import WIDTH, HEIGHT
+
+
+def _o_piece():
+    """O piece (type 6): occupies grid rows 0-1, so it lands at y == HEIGHT - 2."""
+    piece = Piece(WIDTH // 2 - 2, 0)
+    piece.type = 6
+    return piece
+
+
+class TestGravityCurve(unittest.TestCase):
+    """Test gravity_rows across levels."""
+
+    def setUp(self):
+        self.game = Game(Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH), _o_piece, SessionManager())
+
+    def _rows_at(self, level):
+        self.game.level = level
+        return self.game._calculate_gravity_rows()
+
+    def test_one_row_until_delay_floor(self):
+        for level in range(1, 9):
+            self.assertEqual(self._rows_at(level), 1, f"level={level}")
+
+    def test_speed_keeps_rising_past_floor(self):
+        speeds = []
+        for level in range(8, 21):
+            self.game.level = level
+            speeds.append(self.game._calculate_gravity_rows() / self.game._calculate_gravity_delay())
+        self.assertEqual(speeds, sorted(speeds))
+        self.assertGreater(speeds[-1], speeds[0])
+
+    def test_curve_tops_out_at_20g(self):
+        self.game.level = 50
+        rows_per_tick = self.game._calculate_gravity_rows() / self.game._calculate_gravity_delay()
+        self.assertEqual(rows_per_tick, 20)
+
+    def test_level_up_updates_gravity_rows(self):
+        self.game.start_new_game()
+        self.game._update_level(100)
+        self.assertEqual(self.game.gravity_rows, self.game._calculate_gravity_rows())
+        self.assertGreater(self.game.gravity_rows, 1)
+
+
+class TestMultiRowGravity(unittest.TestCase):
+    """Test how update() moves pieces at different speeds."""
+
+    def setUp(self):
+        self.board = Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH)
+        self.game = Game(self.board, _o_piece, SessionManager())
+
+    def _start_at(self, level):
+        self.game.start_level = level
+        self.game.start_new_game()
+
+    def test_level_one_timing_unchanged(self):
+        """At level 1 a piece still falls one row after exactly gravity_delay ticks."""
+        self._start_at(1)
+        start_y = self.game.current_piece.y
+        for _ in range(self.game.gravity_delay - 1):
+            self.game.update()
+        self.assertEqual(self.game.current_piece.y, start_y)
+        self.game.update()
+        self.assertEqual(self.game.current_piece.y, start_y + 1)
+        self.assertEqual(self.game.gravity_timer, 0)
+
+    def test_fractional_speed_keeps_remainder(self):
+        """3 rows per 10 ticks should move exactly 3 rows in 10 ticks."""
+        self._start_at(10)
+        self.assertEqual((self.game.gravity_rows, self.game.gravity_delay), (3, 10))
+        start_y = self.game.current_piece.y
+        for _ in range(10):
+            self.game.update()
+        self.assertEqual(self.game.current_piece.y, start_y + 3)
+
+    def test_multiple_rows_in_one_tick(self):
+        self._start_at(17)  # 3G
+        start_y = self.game.current_piece.y
+        self.game.update()
+        self.assertEqual(self.game.current_piece.y, start_y + 3)
+
+    def test_20g_lands_and_locks_in_one_tick(self):
+        self._start_at(20)
+        locked = []
+        self.game.events.subscribe(PieceLocked, locked.append)
+        self.game.update()
+        self.assertEqual(len(locked), 1)
+        self.assertEqual(locked[0].y, HEIGHT - 2)
+        self.assertTrue(self.board.get_cell(HEIGHT - 1, locked[0].x + 1))
+
+    def test_20g_uses_single_landing_query(self):
+        self._start_at(20)
+        with patch.object(self.board, 'go_down', wraps=self.board.go_down) as go_down, \
+             patch.object(self.board, 'get_landing_y', wraps=self.board.get_landing_y) as landing:
+            self.game.update()
+        go_down.assert_not_called()
+        self.assertEqual(landing.call_count, 1)
+
+    def test_timer_resets_after_gravity_lock(self):
+        self._start_at(20)
+        self.game.update()
+        self.assertEqual(self.game.gravity_timer, 0)
+
+    def test_start_level_used_by_new_game(self):
+        self._start_at(12)
+        self.assertEqual(self.game.level, 12)
+        self.assertEqual(self.game.gravity_rows, self.game._calculate_gravity_rows())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Unit tests for popup layout caching.
+
+Tests that a popup lays out its panel once, that the renderer reuses the
+popup while its content is unchanged and re-lays it out when the score
+changes, and that overlay and shadow surfaces are shared between frames.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from src.ui.pop_up import Popup
+from src.ui.button_manager import ButtonManager
+from src.view.pygame_renderer import PygameRenderer
+
+
+class TestPopupCache(unittest.TestCase):
+    """Test Popup panel caching and PygameRenderer popup reuse."""
+
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.renderer = PygameRenderer(self.screen)
+        self.cursor = patch('pygame.mouse.set_cursor')
+        self.cursor.start()
+
+    def tearDown(self):
+        self.cursor.stop()
+        pygame.quit()
+
+    def test_panel_laid_out_once(self):
+        popup = Popup(title="Paused", body_lines=["Score: 10"], button_specs=[("Resume", "RESUME", (0, 200, 0))])
+        popup.render(self.screen, ButtonManager())
+        panel = popup._panel
+        with patch('src.ui.pop_up.render_text') as render_text:
+            popup.render(self.screen, ButtonManager())
+        render_text.assert_not_called()
+        self.assertIs(popup._panel, panel)
+
+    def test_content_change_relays_out(self):
+        popup = Popup(title="Paused", body_lines=["Score: 10"])
+        popup.render(self.screen, ButtonManager())
+        panel = popup._panel
+        popup.body_lines = ["Score: 10", "High Score: 20"]
+        popup.render(self.screen, ButtonManager())
+        self.assertIsNot(popup._panel, panel)
+        self.assertGreater(popup._panel.get_height(), panel.get_height())
+
+    def test_renderer_reuses_popup_until_score_changes(self):
+        self.renderer.draw_pause_popup(score=100, high_score=500)
+        popup = self.renderer._popups["pause"][1]
+        self.renderer.draw_pause_popup(score=100, high_score=500)
+        self.assertIs(self.renderer._popups["pause"][1], popup)
+        self.renderer.draw_pause_popup(score=200, high_score=500)
+        self.assertIsNot(self.renderer._popups["pause"][1], popup)
+
+    def test_buttons_still_registered_each_frame(self):
+        for _ in range(2):
+            self.renderer.draw_game_over_screen(score=1, high_score=2)
+            actions = [button.action for button in self.renderer.button_manager.buttons]
+            self.assertEqual(actions, ["RESTART", "QUIT"])
+
+    def test_hover_redrawn_over_cached_panel(self):
+        self.renderer.draw_start_screen()
+        button = self.renderer.button_manager.buttons[0]
+        with patch('pygame.mouse.get_pos', return_value=(0, 0)):
+            self.renderer.draw_start_screen()
+        idle = self.screen.get_at(button.rect.move(4, 0).midleft)
+        with patch('pygame.mouse.get_pos', return_value=button.rect.center):
+            self.renderer.draw_start_screen()
+        self.assertNotEqual(self.screen.get_at(button.rect.move(4, 0).midleft), idle)
+
+    def test_overlay_surface_reused(self):
+        with patch('src.ui.pop_up_render_utils.pygame.Surface', wraps=pygame.Surface) as surface:
+            self.renderer.draw_pause_popup(score=1, high_score=2)
+            created = surface.call_count
+            self.renderer.draw_pause_popup(score=1, high_score=2)
+        self.assertEqual(surface.call_count, created)
+
+
+if __name__ == '__main__':
+    unittest.main()
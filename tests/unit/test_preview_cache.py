@@ -0,0 +1,85 @@
+"""
+Unit tests for the next-piece preview cache in PygameRenderer.
+
+Tests that each (type, rotation, color) panel is rendered once, that the
+cache is bounded, and that the cached panel draws the same pixels.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from src.figures import SHAPES
+from src.view.pygame_renderer import PygameRenderer, PREVIEW_CACHE_SIZE
+from src.game.piece import Piece
+from src.constants import BLACK, WHITE, NEXT_PAGE_PREVIEW_RECT
+
+
+def make_piece(piece_type, rotation=0, color=1):
+    piece = Piece(0, 0)
+    piece.type, piece.rotation, piece.color = piece_type, rotation, color
+    return piece
+
+
+class TestPreviewCache(unittest.TestCase):
+    """Test PygameRenderer.draw_next_piece_preview caching."""
+
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.renderer = PygameRenderer(self.screen)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_rendered_once_per_piece(self):
+        piece = make_piece(2)
+        self.renderer.draw_next_piece_preview(piece)
+        with patch('src.view.pygame_renderer.render_text') as render_text, \
+             patch('src.view.pygame_renderer.pygame.draw.rect') as draw_rect, \
+             patch.object(self.renderer, 'draw_next_piece') as draw_next_piece:
+            for _ in range(10):
+                self.renderer.draw_next_piece_preview(make_piece(2))
+        render_text.assert_not_called()
+        draw_rect.assert_not_called()
+        draw_next_piece.assert_not_called()
+        self.assertEqual(len(self.renderer._preview_cache), 1)
+
+    def test_each_rotation_and_color_cached_separately(self):
+        self.renderer.draw_next_piece_preview(make_piece(2, 0, 1))
+        self.renderer.draw_next_piece_preview(make_piece(2, 1, 1))
+        self.renderer.draw_next_piece_preview(make_piece(2, 0, 3))
+        self.assertEqual(len(self.renderer._preview_cache), 3)
+
+    def test_cache_bounded(self):
+        for piece_type, rotations in enumerate(SHAPES):
+            for rotation in range(len(rotations)):
+                self.renderer.draw_next_piece_preview(make_piece(piece_type, rotation))
+        self.assertEqual(len(self.renderer._preview_cache), PREVIEW_CACHE_SIZE)
+
+    def test_pixels(self):
+        self.screen.fill(WHITE)
+        piece = make_piece(3, 0, 2)
+        self.renderer.draw_next_piece_preview(piece)
+        x, y, width, height = NEXT_PAGE_PREVIEW_RECT
+        self.assertEqual(self.screen.get_at((x, y))[:3], BLACK)  # Box outline
+        self.assertEqual(self.screen.get_at((x + 5, y + 5))[:3], WHITE)  # Background shows through
+        direct = self.screen.copy()
+        direct.fill(WHITE)
+        self.renderer.draw_next_piece(piece, direct)
+        piece_area = pygame.Rect(x + 1, y + 60, width - 2, height - 61)
+        self.assertEqual(pygame.image.tostring(direct.subsurface(piece_area), "RGB"),
+                         pygame.image.tostring(self.screen.subsurface(piece_area), "RGB"))
+
+
+if __name__ == '__main__':
+    unittest.main()
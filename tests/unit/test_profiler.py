@@ -0,0 +1,139 @@
+"""
+Unit tests for the frame-time profiler and its debug overlay.
+
+Tests the ring buffers and statistics of FrameProfiler, method wrapping
+and restore, and toggling the overlay with the profiler key.
+"""
+
+import os
+import random
+import sys
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+import app
+from src.utils.profiler import FrameProfiler, FRAME
+from src.view.pygame_renderer import PygameRenderer
+from src.view.input import InputHandler
+from src.game.game import Game
+from src.game.board import Board
+from src.game.row import Row
+from src.sim.generators import BagGenerator
+from src.utils.session_manager import SessionManager
+from src.constants import WIDTH, HEIGHT
+
+
+class Worker:
+    def work(self, value):
+        return value * 2
+
+
+class TestFrameProfiler(unittest.TestCase):
+    """Test FrameProfiler."""
+
+    def test_ring_buffer_keeps_latest(self):
+        profiler = FrameProfiler(capacity=3)
+        for duration in (10, 20, 30, 40):
+            profiler.record("draw", duration * 1_000_000)
+        stats = profiler.stats("draw")
+        self.assertEqual(stats["count"], 3)
+        self.assertEqual(stats["mean"], 30)
+        self.assertEqual(stats["p50"], 30)
+        self.assertEqual(stats["p99"], 40)
+
+    def test_unknown_section(self):
+        profiler = FrameProfiler()
+        self.assertIsNone(profiler.stats("draw"))
+        self.assertIsNone(profiler.fps())
+
+    def test_frames(self):
+        profiler = FrameProfiler()
+        with patch('src.utils.profiler.time.perf_counter_ns', side_effect=[0, 20_000_000, 40_000_000]):
+            for _ in range(3):
+                profiler.end_frame()
+        self.assertEqual(profiler.stats(FRAME)["count"], 2)
+        self.assertAlmostEqual(profiler.fps(), 50.0)
+
+    def test_instrument_and_restore(self):
+        worker = Worker()
+        profiler = FrameProfiler()
+        profiler.instrument(worker, ["work"], "Worker.")
+        self.assertEqual(worker.work(4), 8)
+        self.assertEqual(profiler.stats("Worker.work")["count"], 1)
+        profiler.restore()
+        self.assertNotIn("work", vars(worker))
+        worker.work(1)
+        self.assertEqual(profiler.stats("Worker.work")["count"], 1)
+
+    def test_report(self):
+        profiler = FrameProfiler()
+        profiler.record("draw_board", 1_500_000)
+        profiler.record(FRAME, 16_000_000)
+        rows = profiler.report_rows()
+        self.assertEqual(rows[1][0], FRAME)
+        self.assertEqual(rows[2], ("draw_board", "1.50", "1.50", "1.50", "1.50"))
+        self.assertTrue(profiler.report_lines()[0].startswith("FPS 62.5"))
+
+
+class TestProfilerOverlay(unittest.TestCase):
+    """Test toggling and drawing the overlay."""
+
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.renderer = PygameRenderer(self.screen)
+        self.board = Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH)
+        self.game = Game(self.board, BagGenerator(random.Random(1)), SessionManager())
+        self.cursor = patch('pygame.mouse.set_cursor')
+        self.cursor.start()
+
+    def tearDown(self):
+        self.cursor.stop()
+        pygame.quit()
+
+    def _press_profiler_key(self):
+        event = pygame.event.Event(pygame.KEYDOWN, key=app.PROFILER_KEY, mod=0, unicode="", scancode=0)
+        return app.collect_intents([event], self.renderer, InputHandler(), self.game)
+
+    def test_key_toggles(self):
+        self.assertEqual(self._press_profiler_key(), ([], False))
+        self.assertIsNotNone(self.renderer.profiler)
+        self._press_profiler_key()
+        self.assertIsNone(self.renderer.profiler)
+        self.assertNotIn("update", vars(self.game))
+        self.assertNotIn("draw_board", vars(self.renderer))
+
+    def test_sections_recorded(self):
+        app.toggle_profiler(self.renderer, self.game)
+        self.game.apply(["START"])
+        for _ in range(3):
+            self.game.update()
+            app.draw_frame(self.renderer, self.game, self.board)
+            self.renderer.present()
+        sections = self.renderer.profiler.sections()
+        for name in (FRAME, "Game.apply", "Game.update", "draw_board", "draw_piece", "present"):
+            self.assertIn(name, sections)
+        self.assertIsNotNone(self.renderer._profiler_surface)
+
+    def test_overlay_text_refresh_throttled(self):
+        app.toggle_profiler(self.renderer, self.game)
+        with patch('src.view.pygame_renderer.pygame.time.get_ticks', return_value=1000):
+            self.renderer.draw_profiler_overlay()
+            panel = self.renderer._profiler_surface
+            self.renderer.draw_profiler_overlay()
+        self.assertIs(self.renderer._profiler_surface, panel)
+        with patch('src.view.pygame_renderer.pygame.time.get_ticks', return_value=2000):
+            self.renderer.draw_profiler_overlay()
+        self.assertIsNot(self.renderer._profiler_surface, panel)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+Unit tests for Game.save_state / Game.load_state.
+
+Tests that a restored game matches the saved one (board, pieces, score,
+progression, timers), that the piece RNG is restored so both copies play
+out identically, and that saving stays cheap.
+"""
+
+import os
+import random
+import sys
+import time
+import unittest
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from src.game.game import Game
+from src.game.board import Board
+from src.game.piece import Piece
+from src.game.row import Row
+from src.game.intents import Intent
+from src.sim.generators import BagGenerator
+from src.sim.policies import BotPolicy
+from src.utils.session_manager import SessionManager
+from src.constants import WIDTH, HEIGHT, START_X, START_Y
+from src.constants.game_states import PLAYING, GAME_OVER
+
+
+def _new_game(seed):
+    board = Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH)
+    return Game(board, BagGenerator(random.Random(seed)), SessionManager())
+
+
+def _board_cells(game):
+    return [[(game.board.get_cell(r, c), game.board.get_row_object(r).get_color(c))
+             for c in range(WIDTH)] for r in range(HEIGHT)]
+
+
+def _summary(game):
+    return (game.score, game.level, game.lines_cleared, game.gravity_timer,
+            game.gravity_delay, game.gravity_rows, game.paused, game._state,
+            game.current_piece.snapshot(), game.next_piece.snapshot())
+
+
+class TestSaveState(unittest.TestCase):
+    """Test round-tripping a game through save_state/load_state."""
+
+    def setUp(self):
+        self.game = _new_game(4)
+        self.game.start_new_game()
+        self.policy = BotPolicy()
+        for _ in range(30):
+            self.game.apply(self.policy(self.game))
+        for _ in range(7):
+            self.game.update()
+
+    def test_round_trip_restores_everything(self):
+        blob = self.game.save_state()
+        expected = (_summary(self.game), _board_cells(self.game))
+
+        other = _new_game(99)
+        other.load_state(blob)
+        self.assertEqual((_summary(other), _board_cells(other)), expected)
+
+    def test_load_rewinds_a_game(self):
+        blob = self.game.save_state()
+        expected = (_summary(self.game), _board_cells(self.game))
+        self.game.apply([Intent.DROP] * 5)
+        self.game.load_state(blob)
+        self.assertEqual((_summary(self.game), _board_cells(self.game)), expected)
+
+    def test_forks_play_out_identically(self):
+        """Restored RNG means both forks spawn the same pieces."""
+        blob = self.game.save_state()
+        fork = _new_game(123)
+        fork.load_state(blob)
+        for _ in range(20):
+            self.game.apply(self.policy(self.game))
+            fork.apply(self.policy(fork))
+        self.assertEqual(_summary(fork), _summary(self.game))
+        self.assertEqual(_board_cells(fork), _board_cells(self.game))
+
+    def test_global_random_used_without_generator_state(self):
+        """The default spawn function draws from the global random module."""
+        game = Game(Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH),
+                    lambda: Piece(START_X, START_Y), SessionManager())
+        game.start_new_game()
+        blob = game.save_state()
+        game.apply([Intent.DROP])
+        first = game.next_piece.snapshot()
+        game.load_state(blob)
+        game.apply([Intent.DROP])
+        self.assertEqual(game.next_piece.snapshot(), first)
+
+    def test_paused_and_game_over_states_restored(self):
+        self.game.apply([Intent.PAUSE])
+        paused = self.game.save_state()
+        self.game.apply([Intent.DROP] * 200 + [Intent.RESUME])
+        while self.game._state != GAME_OVER:
+            self.game.apply([Intent.DROP])
+        over = self.game.save_state()
+
+        self.game.load_state(paused)
+        self.assertTrue(self.game.paused)
+        self.assertEqual(self.game._state, PLAYING)
+        self.game.load_state(over)
+        self.assertEqual(self.game._state, GAME_OVER)
+        self.assertTrue(self.game.game_over)
+
+    def test_rejects_other_formats(self):
+        import pickle
+        with self.assertRaises(ValueError):
+            self.game.load_state(pickle.dumps((Game.SAVE_FORMAT + 1,)))
+
+    def test_board_snapshot_rejects_other_height(self):
+        small = Board(lambda: Row(WIDTH), height=HEIGHT - 1, width=WIDTH)
+        with self.assertRaises(ValueError):
+            small.restore(self.game.board.snapshot())
+
+    def test_save_is_fast(self):
+        runs = 200
+        start = time.perf_counter()
+        for _ in range(runs):
+            self.game.save_state()
+        per_save = (time.perf_counter() - start) / runs
+        self.assertLess(per_save, 0.001)
+
+
+if __name__ == '__main__':
+    unittest.main()
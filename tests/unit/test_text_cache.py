@@ -0,0 +1,123 @@
+"""
+Unit tests for the shared font registry and rendered-text cache.
+
+Tests font reuse, LRU eviction of text surfaces, clearing on pygame.quit()
+and that unchanged HUD text is rendered once across frames.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from src.ui import fonts
+from src.ui.fonts import FontRegistry, TextCache, get_font, render_text
+from src.view.pygame_renderer import PygameRenderer
+from src.constants import BLACK, WHITE
+
+
+class TestFontRegistry(unittest.TestCase):
+    """Test FontRegistry."""
+
+    def setUp(self):
+        pygame.init()
+        self.registry = FontRegistry()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_same_font_reused(self):
+        font = self.registry.get('Arial', 18, bold=True)
+        self.assertIs(self.registry.get('Arial', 18, bold=True), font)
+        self.assertEqual(len(self.registry), 1)
+
+    def test_style_and_size_are_separate_fonts(self):
+        plain = self.registry.get('Arial', 18)
+        self.assertIsNot(self.registry.get('Arial', 18, bold=True), plain)
+        self.assertIsNot(self.registry.get('Arial', 20), plain)
+
+    def test_system_lookup_once(self):
+        with patch('src.ui.fonts.pygame.font.SysFont', wraps=pygame.font.SysFont) as sys_font:
+            for _ in range(10):
+                self.registry.get('Arial', 24)
+        self.assertEqual(sys_font.call_count, 1)
+
+    def test_default_font(self):
+        font = self.registry.get(None, 24, bold=True)
+        self.assertTrue(font.get_bold())
+
+
+class TestTextCache(unittest.TestCase):
+    """Test TextCache."""
+
+    def setUp(self):
+        pygame.init()
+        self.font = pygame.font.Font(None, 24)
+        self.cache = TextCache(max_entries=3)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_hit_returns_same_surface(self):
+        surface = self.cache.render("Score: 1200", self.font, BLACK)
+        self.assertIs(self.cache.render("Score: 1200", self.font, BLACK), surface)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_key_includes_font_and_color(self):
+        surface = self.cache.render("Score", self.font, BLACK)
+        self.assertIsNot(self.cache.render("Score", self.font, WHITE), surface)
+        self.assertIsNot(self.cache.render("Score", pygame.font.Font(None, 30), BLACK), surface)
+
+    def test_least_recently_used_evicted(self):
+        first = self.cache.render("a", self.font, BLACK)
+        self.cache.render("b", self.font, BLACK)
+        self.cache.render("c", self.font, BLACK)
+        self.cache.render("a", self.font, BLACK)  # "b" is now the oldest
+        self.cache.render("d", self.font, BLACK)
+        self.assertEqual(len(self.cache), 3)
+        self.assertIs(self.cache.render("a", self.font, BLACK), first)
+        misses = self.cache.misses
+        self.cache.render("b", self.font, BLACK)
+        self.assertEqual(self.cache.misses, misses + 1)
+
+
+class TestSharedCaches(unittest.TestCase):
+    """Test the module-level caches used by the renderer."""
+
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        fonts.clear_caches()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_cleared_on_quit(self):
+        render_text("x", get_font(None, 24), BLACK)
+        pygame.quit()
+        self.assertEqual(len(fonts.font_registry), 0)
+        self.assertEqual(len(fonts.text_cache), 0)
+        pygame.init()
+        # A fresh session gets fresh fonts and still clears on the next quit
+        render_text("x", get_font(None, 24), BLACK)
+        pygame.quit()
+        self.assertEqual(len(fonts.text_cache), 0)
+
+    def test_unchanged_score_rendered_once(self):
+        renderer = PygameRenderer(self.screen)
+        for _ in range(60):
+            renderer.draw_score(1200, 5000)
+        self.assertEqual(fonts.text_cache.misses, 2)  # "Score: 1200" and "High Score: 5000"
+        self.assertEqual(fonts.text_cache.hits, 118)
+
+
+if __name__ == '__main__':
+    unittest.main()
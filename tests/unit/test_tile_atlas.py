@@ -0,0 +1,92 @@
+"""
+Unit tests for the cell tile atlas.
+
+Tests the atlas layout, the tile insets per state, and that the falling
+piece and preview are drawn with blits from the atlas rather than rects.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from src.figures import SHAPES
+from src.view.pygame_renderer import PygameRenderer
+from src.view.tile_atlas import TileAtlas, TILE_STATES, LOCKED, ACTIVE, PREVIEW
+from src.game.piece import Piece
+from src.constants import CELL_SIZE, COLORS, WHITE
+
+
+class TestTileAtlas(unittest.TestCase):
+    """Test TileAtlas."""
+
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.atlas = TileAtlas()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def _tile(self, state, color):
+        return self.atlas.sheet.subsurface(self.atlas.area(state, color))
+
+    def test_one_tile_per_state_and_color(self):
+        areas = {tuple(self.atlas.area(state, color))
+                 for state in TILE_STATES for color in range(len(COLORS))}
+        self.assertEqual(len(areas), len(TILE_STATES) * len(COLORS))
+        self.assertEqual(self.atlas.sheet.get_size(), (CELL_SIZE * len(COLORS), CELL_SIZE * len(TILE_STATES)))
+
+    def test_locked_tile_inset(self):
+        tile = self._tile(LOCKED, 2)
+        self.assertEqual(tile.get_at((0, 0)).a, 0)
+        self.assertEqual(tile.get_at((1, 1)), pygame.Color(*COLORS[2], 255))
+        self.assertEqual(tile.get_at((CELL_SIZE - 2, CELL_SIZE - 2)), pygame.Color(*COLORS[2], 255))
+        self.assertEqual(tile.get_at((CELL_SIZE - 1, CELL_SIZE - 1)).a, 0)
+
+    def test_active_and_preview_sizes(self):
+        self.assertEqual(self._tile(ACTIVE, 1).get_bounding_rect().size, (CELL_SIZE - 2, CELL_SIZE - 2))
+        self.assertEqual(self._tile(PREVIEW, 1).get_bounding_rect().size, (CELL_SIZE - 1, CELL_SIZE - 1))
+
+    def test_skinned_tiles(self):
+        class Skin(TileAtlas):
+            def render_tile(self, tile, state, color):
+                tile.fill((1, 2, 3))
+
+        atlas = Skin()
+        self.assertEqual(atlas.sheet.get_at(atlas.area(ACTIVE, 4).center)[:3], (1, 2, 3))
+
+
+class TestRendererUsesAtlas(unittest.TestCase):
+    """Test that piece drawing goes through the atlas."""
+
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.renderer = PygameRenderer(self.screen)
+        self.piece = Piece(3, 2)
+        self.piece.type, self.piece.rotation, self.piece.color = 0, 0, 5
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_piece_drawn_without_rects(self):
+        self.screen.fill(WHITE)
+        with patch('src.view.pygame_renderer.pygame.draw.rect') as draw_rect:
+            self.renderer.draw_piece(self.piece)
+            self.renderer.draw_next_piece(self.piece)
+        draw_rect.assert_not_called()
+        rect = self.renderer._shape_rect(SHAPES[0][0], self.piece.x, self.piece.y)
+        self.assertEqual(self.screen.get_at(rect.topleft)[:3], COLORS[5])
+
+
+if __name__ == '__main__':
+    unittest.main()
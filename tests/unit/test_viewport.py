@@ -0,0 +1,149 @@
+"""
+Unit tests for resolution-independent rendering through Viewport.
+
+Tests the logical-to-window mapping, scaling and letterboxing on present,
+that resizing keeps the renderer's cached layers, that clicks are mapped
+back to drawing coordinates, and that dirty-rect updates stay correct
+when the frame is scaled.
+"""
+
+import os
+import random
+import sys
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+# Add repository root to path for imports
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+import app
+from src.view.viewport import Viewport
+from src.view.pygame_renderer import PygameRenderer
+from src.view.input import InputHandler
+from src.game.game import Game
+from src.game.board import Board
+from src.game.row import Row
+from src.sim.generators import BagGenerator
+from src.utils.session_manager import SessionManager
+from src.constants import WIDTH, HEIGHT, SCREEN_SIZE, BLACK, RED
+from src.constants.game_states import GAME_OVER
+
+
+class TestViewport(unittest.TestCase):
+    """Test Viewport mapping and presenting."""
+
+    def setUp(self):
+        pygame.init()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_logical_size_window_is_drawn_directly(self):
+        window = pygame.display.set_mode(SCREEN_SIZE)
+        viewport = Viewport(window)
+        self.assertIs(viewport.surface, window)
+        self.assertEqual(viewport.to_logical((123, 45)), (123, 45))
+
+    def test_letterbox(self):
+        window = pygame.display.set_mode((1000, 600))
+        viewport = Viewport(window)
+        self.assertEqual(viewport.scale, 1)
+        self.assertEqual(viewport.rect, pygame.Rect(100, 0, 800, 600))
+        self.assertEqual(viewport.to_logical((500, 300)), (400, 300))
+
+    def test_scaled_present(self):
+        window = pygame.display.set_mode((1200, 900))
+        viewport = Viewport(window)
+        self.assertEqual(viewport.surface.get_size(), SCREEN_SIZE)
+        viewport.surface.fill(BLACK)
+        viewport.surface.fill(RED, (100, 100, 40, 40))
+        with patch('pygame.display.flip'):
+            viewport.present()
+        self.assertEqual(window.get_at((180, 180))[:3], RED)
+        self.assertEqual(window.get_at((140, 140))[:3], BLACK)
+        self.assertEqual(viewport.to_logical((180, 180)), (120, 120))
+        self.assertTrue(viewport.to_window((100, 100, 40, 40)).contains((150, 150, 60, 60)))
+
+    def test_empty_update_skips_scaling(self):
+        viewport = Viewport(pygame.display.set_mode((1200, 900)))
+        with patch('pygame.transform.smoothscale') as smoothscale, \
+             patch('pygame.display.update') as update:
+            viewport.present([])
+        smoothscale.assert_not_called()
+        update.assert_not_called()
+
+
+class TestScaledRenderer(unittest.TestCase):
+    """Test PygameRenderer in a window that isn't logical size."""
+
+    def setUp(self):
+        pygame.init()
+        self.window = pygame.display.set_mode(SCREEN_SIZE)
+        self.renderer = PygameRenderer(self.window)
+        self.board = Board(lambda: Row(WIDTH), height=HEIGHT, width=WIDTH)
+        self.game = Game(self.board, BagGenerator(random.Random(2)), SessionManager())
+        self.cursor = patch('pygame.mouse.set_cursor')
+        self.cursor.start()
+
+    def tearDown(self):
+        self.cursor.stop()
+        pygame.quit()
+
+    def _resize(self, size):
+        event = pygame.event.Event(pygame.VIDEORESIZE, size=size, w=size[0], h=size[1])
+        pygame.display.set_mode(size)
+        app.collect_intents([event], self.renderer, InputHandler(), self.game)
+
+    def test_resize_keeps_cached_layers(self):
+        self.renderer.draw_board(self.board)
+        grid = self.renderer._grid_surface
+        renders = self.renderer.compositor.static_renders
+        self._resize((1200, 900))
+        self.assertEqual(self.renderer.screen.get_size(), SCREEN_SIZE)
+        self.renderer.draw_board(self.board)
+        self.assertIs(self.renderer._grid_surface, grid)
+        self.assertEqual(self.renderer.compositor.static_renders, renders)
+
+    def test_click_mapped_to_logical(self):
+        self._resize((1600, 1200))
+        self.game.apply(["START"])
+        app.draw_frame(self.renderer, self.game, self.board)
+        button = self.renderer.hud_button_manager.buttons[0]
+        click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(button.rect.centerx * 2, button.rect.centery * 2))
+        intents, _ = app.collect_intents([click], self.renderer, InputHandler(), self.game)
+        self.assertEqual(intents, ["PAUSE", "CLICK"])
+
+    def test_dirty_rects_when_scaled(self):
+        self._resize((1200, 900))
+        window = pygame.display.get_surface()
+        mirror = window.copy()  # What has actually been pushed to the display
+
+        def flip():
+            mirror.blit(window, (0, 0))
+
+        def update(rects):
+            for rect in rects:
+                mirror.blit(window, rect, rect)
+
+        rng = random.Random(4)
+        self.game.apply(["START"])
+        with patch('pygame.display.flip', side_effect=flip), \
+             patch('pygame.display.update', side_effect=update):
+            for _ in range(150):
+                if rng.random() < 0.3:
+                    self.game.apply([rng.choice(["LEFT", "RIGHT", "ROTATE", "DOWN", "DROP"])])
+                if self.game._state == GAME_OVER:
+                    self.game.apply(["RESTART"])
+                self.game.update()
+                app.draw_frame(self.renderer, self.game, self.board)
+                self.renderer.present()
+                self.assertEqual(pygame.image.tostring(mirror, "RGB"), pygame.image.tostring(window, "RGB"))
+
+
+if __name__ == '__main__':
+    unittest.main()